@@ -0,0 +1,529 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2025 James James Johnson. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+import os
+import sys
+import math
+import gc
+import time
+import pickle
+import random
+import tempfile
+import tracemalloc
+# The domain classes are imported by name, like in "wn_chatbot.py", because
+# "wn_repository.py" pickles them from its "__main__" module.
+from wn_repository import \
+    Lexicon, \
+    LexicalEntry, \
+    Lemma, \
+    Pronunciation, \
+    Sense, \
+    SyntacticBehaviour,\
+    SenseRelation, \
+    Synset, \
+    SynsetRelation, \
+    RelationGraph, \
+    SymmetricDeleteIndex, \
+    HypernymHierarchy, \
+    lst_synset_relation_types, \
+    dict_synset_relation_type_to_code, \
+    phonetic_key, \
+    DIR_PATH_DATA_XML_WORDNET, \
+    FILE_NAME_DATA_XML_WORDNET, \
+    FILE_EXT_DATA_XML_WORDNET, \
+    INT_XML_LOADING_PROCESSES, \
+    DIR_PATH_DATA_PKL_XZ_WORDNET, \
+    FILE_NAME_DATA_PKL_XZ_WORDNET
+from wn_similarity import SynsetSimilarity, tpl_similarity_measures
+
+
+###############################################################################
+# Memory footprint of the domain model.
+#
+# The "legacy" lexicon reproduces the objects graph of the domain model before
+# "__slots__", interning and integer IDs were introduced: every object has its
+# own instance "__dict__", every string is a separate copy (as returned by the
+# XML parser), every definition, example and form is wrapped into an object,
+# which only holds this string, and the relations are objects in dictionaries
+# keyed by their targets' identifiers and types.
+
+
+class _LegacyObject :
+
+    def __init__(self, dict_attributes) :
+        self.__dict__.update(dict_attributes)
+
+
+dict_legacy_wrapped_slots_to_attribute = {
+    "_list_forms" : "_str_written_form", # "Form" object
+    "_list_definitions" : "_str_text", # "Definition" object
+    "_list_examples" : "_str_text", # "Example" object
+}
+
+tpl_legacy_skipped_slots_prefixes = (
+    "_int_id", "_list_unresolved_", "_tpl_", "_bytes_",)
+
+
+def _copy_str(str_value) :
+    return str_value.encode("utf-8").decode("utf-8")
+
+
+def _legacy_relations(entity_obj, lexicon) :
+    if isinstance(entity_obj, Sense) :
+        return ("_dict_sense_relations", {
+            _copy_str(
+                lexicon.list_of_senses[sense_relation_obj.target_sense_int_id].identifier +
+                "|" + sense_relation_obj.sense_relation_type) :
+            _LegacyObject({
+                "_str_source_sense_identifier" : _copy_str(entity_obj.identifier),
+                "_str_target_sense_identifier" : _copy_str(lexicon.list_of_senses[
+                    sense_relation_obj.target_sense_int_id].identifier),
+                "_str_sense_relation_type" : _copy_str(
+                    sense_relation_obj.sense_relation_type),
+                "_str_sense_relation_subtype" : _copy_str(
+                    sense_relation_obj.sense_relation_subtype),})
+            for sense_relation_obj in entity_obj.list_of_sense_relations})
+    if isinstance(entity_obj, Synset) :
+        return ("_dict_synset_relations", {
+            _copy_str(
+                lexicon.list_of_synsets[synset_relation_obj.target_synset_int_id].identifier +
+                "|" + synset_relation_obj.synset_relation_type) :
+            _LegacyObject({
+                "_str_source_synset_identifier" : _copy_str(entity_obj.identifier),
+                "_str_target_synset_identifier" : _copy_str(lexicon.list_of_synsets[
+                    synset_relation_obj.target_synset_int_id].identifier),
+                "_str_synset_relation_type" : _copy_str(
+                    synset_relation_obj.synset_relation_type),})
+            for synset_relation_obj in entity_obj.list_of_synset_relations})
+    return None
+
+
+def _to_legacy(value, lexicon, dict_converted) :
+    if isinstance(value, str) :
+        return _copy_str(value)
+    if isinstance(value, list) :
+        return [_to_legacy(item, lexicon, dict_converted) for item in value]
+    if isinstance(value, dict) :
+        return {
+            _copy_str(key) : _to_legacy(item, lexicon, dict_converted)
+            for (key, item) in value.items()}
+    if not hasattr(type(value), "__slots__") :
+        return value
+    # The objects shared by several collections (e.g. senses) are converted
+    # once, so that they stay shared.
+    if id(value) in dict_converted :
+        return dict_converted[id(value)]
+    dict_attributes = {}
+    for str_slot in type(value).__slots__ :
+        if str_slot.startswith(tpl_legacy_skipped_slots_prefixes) :
+            continue
+        slot_value = getattr(value, str_slot)
+        if str_slot in dict_legacy_wrapped_slots_to_attribute :
+            slot_value = [
+                _LegacyObject({dict_legacy_wrapped_slots_to_attribute[
+                    str_slot] : _copy_str(str_item)})
+                for str_item in slot_value]
+        else :
+            slot_value = _to_legacy(slot_value, lexicon, dict_converted)
+        dict_attributes[str_slot] = slot_value
+    tpl_relations = _legacy_relations(value, lexicon)
+    if tpl_relations is not None :
+        dict_attributes[tpl_relations[0]] = tpl_relations[1]
+    legacy_obj = _LegacyObject(dict_attributes)
+    dict_converted[id(value)] = legacy_obj
+    return legacy_obj
+
+
+def _to_legacy_lexicon(lexicon) :
+    dict_converted = {}
+    return [
+        _to_legacy(lexicon.dictionary_of_lexical_entries, lexicon, dict_converted),
+        _to_legacy(lexicon.dictionary_of_senses, lexicon, dict_converted),
+        _to_legacy(lexicon.dictionary_of_synsets, lexicon, dict_converted),
+        _to_legacy(lexicon.dictionary_of_syntactic_behaviours, lexicon, dict_converted),
+    ]
+
+
+def measure_memory_footprint(fn_build, *args) :
+    # Returns the result of "fn_build" and the memory it still holds.
+    gc.collect()
+    tracemalloc.start()
+    int_memory_before = tracemalloc.get_traced_memory()[0]
+    result = fn_build(*args)
+    gc.collect()
+    int_memory_after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (result, int_memory_after - int_memory_before)
+
+
+def benchmark_memory_footprint(str_file_path, str_file_name) :
+    flt_start_time = time.perf_counter()
+    (lexicon, int_compact_bytes) = measure_memory_footprint(
+        Lexicon.load_from_lzma, str_file_path, str_file_name)
+    flt_elapsed_seconds = time.perf_counter() - flt_start_time
+    (lst_legacy, int_legacy_bytes) = measure_memory_footprint(
+        _to_legacy_lexicon, lexicon)
+    print("Memory footprint of the loaded lexicon ({:.1f} s with tracing):".format(
+        flt_elapsed_seconds))
+    print("  legacy model (instance dictionaries, wrappers, copies): {:.1f} MB;".format(
+        int_legacy_bytes / 1e6))
+    print("  compact model (slots, interned identifiers, integer IDs): {:.1f} MB;".format(
+        int_compact_bytes / 1e6))
+    print("  saving: {:.1f} MB ({:.1f}%).".format(
+        (int_legacy_bytes - int_compact_bytes) / 1e6,
+        100. * (int_legacy_bytes - int_compact_bytes) / max(1, int_legacy_bytes)))
+    del lst_legacy
+    return lexicon
+
+
+###############################################################################
+# Relation traversals: per-object relation lists versus the CSR graphs.
+
+
+def benchmark_relation_traversal(lexicon, tpl_str_synset_relation_types = ("hypernym",)) :
+    flt_start_time = time.perf_counter()
+    lst_tpl_objects_edges = [
+        (synset_obj.int_id, synset_relation_obj.target_synset_int_id)
+        for synset_obj in lexicon.list_of_synsets
+        for synset_relation_obj in synset_obj.list_of_synset_relations
+        if synset_relation_obj.synset_relation_type in tpl_str_synset_relation_types]
+    flt_objects_seconds = time.perf_counter() - flt_start_time
+    flt_start_time = time.perf_counter()
+    (arr_sources, arr_targets) = lexicon.synset_relation_graph.edges(
+        tpl_str_synset_relation_types)
+    flt_graph_seconds = time.perf_counter() - flt_start_time
+    if lst_tpl_objects_edges != list(zip(arr_sources.tolist(), arr_targets.tolist())) :
+        raise ValueError('Error: expecting the same relations from the graph.')
+    print('All "{0}" synset relations ({1:d}):'.format(
+        '", "'.join(tpl_str_synset_relation_types), len(arr_sources)))
+    print("  relation objects: {:.1f} ms;".format(flt_objects_seconds * 1e3))
+    print("  CSR graph: {:.1f} ms.".format(flt_graph_seconds * 1e3))
+
+
+###############################################################################
+# Shortest paths: the bidirectional search versus a plain one-sided
+# breadth-first search over the relation objects, in either direction.
+
+
+def _breadth_first_distances(lst_lst_neighbours, int_synset_id) :
+    lst_int_distances = [-1] * len(lst_lst_neighbours)
+    lst_int_distances[int_synset_id] = 0
+    lst_int_frontier = [int_synset_id]
+    while len(lst_int_frontier) > 0 :
+        lst_int_next_frontier = []
+        for int_id in lst_int_frontier :
+            for int_neighbour_id in lst_lst_neighbours[int_id] :
+                if lst_int_distances[int_neighbour_id] < 0 :
+                    lst_int_distances[int_neighbour_id] = lst_int_distances[int_id] + 1
+                    lst_int_next_frontier.append(int_neighbour_id)
+        lst_int_frontier = lst_int_next_frontier
+    return lst_int_distances
+
+
+def check_shortest_paths(lexicon, int_sources_count = 30, int_targets_count = 30) :
+    random_obj = random.Random(12345)
+    lst_synsets = lexicon.list_of_synsets
+    for tpl_str_relation_types in (None, ("hypernym", "hyponym",), ("similar",),) :
+        set_tpl_relations = set()
+        lst_lst_neighbours = [[] for _ in range(len(lst_synsets))]
+        for synset_obj in lst_synsets :
+            for synset_relation_obj in synset_obj.list_of_synset_relations :
+                str_type = synset_relation_obj.synset_relation_type
+                if tpl_str_relation_types is None or str_type in tpl_str_relation_types :
+                    int_target_id = synset_relation_obj.target_synset_int_id
+                    set_tpl_relations.add((synset_obj.int_id, str_type, int_target_id))
+                    lst_lst_neighbours[synset_obj.int_id].append(int_target_id)
+                    lst_lst_neighbours[int_target_id].append(synset_obj.int_id)
+        for synset_obj in random_obj.sample(lst_synsets, min(int_sources_count, len(lst_synsets))) :
+            lst_int_distances = _breadth_first_distances(lst_lst_neighbours, synset_obj.int_id)
+            # The reachable synsets first, so that most paths are not None.
+            lst_int_reachable_ids = [
+                int_id for (int_id, int_distance) in enumerate(lst_int_distances)
+                if int_distance >= 0]
+            lst_int_target_ids = random_obj.sample(
+                lst_int_reachable_ids, min(int_targets_count, len(lst_int_reachable_ids))) + \
+                [random_obj.randrange(len(lst_synsets))]
+            for int_target_id in lst_int_target_ids :
+                int_distance = lst_int_distances[int_target_id]
+                # The max lengths around the distance, where the path is cut off.
+                int_max_length = random_obj.choice((
+                    None, max(0, int_distance - 1), max(0, int_distance), int_distance + 1,))
+                lst_tpl_steps = lexicon.shortest_path(
+                    synset_obj, lst_synsets[int_target_id], tpl_str_relation_types, int_max_length)
+                bool_expected_path = int_distance >= 0 and (
+                    int_max_length is None or int_distance <= int_max_length)
+                if (lst_tpl_steps is not None) != bool_expected_path or (
+                        lst_tpl_steps is not None and len(lst_tpl_steps) != int_distance) :
+                    raise ValueError(
+                        'Error: expecting a path of length {0} from synset "{1}" to "{2}" '
+                        '(types {3}, max length {4}), got {5}.'.format(
+                            int_distance if bool_expected_path else None,
+                            synset_obj.identifier, lst_synsets[int_target_id].identifier,
+                            tpl_str_relation_types, int_max_length,
+                            None if lst_tpl_steps is None else len(lst_tpl_steps)))
+                if lst_tpl_steps is None :
+                    continue
+                int_id = synset_obj.int_id
+                for (step_synset_obj, str_type, next_synset_obj, bool_inverse) in lst_tpl_steps :
+                    tpl_relation = (next_synset_obj.int_id, str_type, step_synset_obj.int_id) \
+                        if bool_inverse else \
+                        (step_synset_obj.int_id, str_type, next_synset_obj.int_id)
+                    if step_synset_obj.int_id != int_id or tpl_relation not in set_tpl_relations :
+                        raise ValueError(
+                            'Error: expecting the steps of the path from synset "{0}" to "{1}" '
+                            'along relations.'.format(
+                                synset_obj.identifier, lst_synsets[int_target_id].identifier))
+                    int_id = next_synset_obj.int_id
+                if int_id != int_target_id :
+                    raise ValueError(
+                        'Error: expecting the path from synset "{0}" to end at "{1}".'.format(
+                            synset_obj.identifier, lst_synsets[int_target_id].identifier))
+    print("Shortest paths between random synsets: checked.")
+
+
+###############################################################################
+# Hypernym hierarchy: interval labels versus brute-force closures.
+#
+# The descendants of every synset are found by a search over the hyponyms,
+# in the lexicon and in small random hierarchies with multiple inheritance
+# (up to 3 hypernyms per synset), where the side ranges of the interval
+# labels overlap most often.
+
+
+def _brute_force_descendants(lst_lst_hyponyms, int_synset_id) :
+    set_int_descendants = set()
+    lst_int_synsets_to_visit = [int_synset_id]
+    while len(lst_int_synsets_to_visit) > 0 :
+        for int_hyponym_id in lst_lst_hyponyms[lst_int_synsets_to_visit.pop()] :
+            if int_hyponym_id not in set_int_descendants :
+                set_int_descendants.add(int_hyponym_id)
+                lst_int_synsets_to_visit.append(int_hyponym_id)
+    set_int_descendants.discard(int_synset_id)
+    return set_int_descendants
+
+
+def _check_hypernym_hierarchy(hypernym_hierarchy, lst_lst_hyponyms) :
+    arr_descendants_counts = hypernym_hierarchy.descendants_counts()
+    for int_synset_id in range(len(lst_lst_hyponyms)) :
+        set_int_descendants = _brute_force_descendants(lst_lst_hyponyms, int_synset_id)
+        lst_int_descendants = hypernym_hierarchy.descendants(int_synset_id).tolist()
+        if len(lst_int_descendants) != len(set_int_descendants) or \
+                set(lst_int_descendants) != set_int_descendants or \
+                arr_descendants_counts[int_synset_id] != len(set_int_descendants) :
+            raise ValueError(
+                'Error: expecting the same descendants of synset {0:d} from the interval labels.'.format(
+                int_synset_id))
+
+
+def check_hypernym_hierarchy(lexicon, int_random_hierarchies_count = 3000) :
+    lst_lst_hyponyms = [[] for _ in range(lexicon.synset_relation_graph.count_of_nodes)]
+    (arr_sources, arr_targets) = lexicon.synset_relation_graph.edges(
+        ("hypernym", "instance_hypernym",))
+    for (int_synset_id, int_hypernym_id) in zip(arr_sources.tolist(), arr_targets.tolist()) :
+        lst_lst_hyponyms[int_hypernym_id].append(int_synset_id)
+    flt_start_time = time.perf_counter()
+    _check_hypernym_hierarchy(lexicon.hypernym_hierarchy, lst_lst_hyponyms)
+    flt_lexicon_seconds = time.perf_counter() - flt_start_time
+    random_obj = random.Random(12345)
+    bytes_hypernym_code = bytes([dict_synset_relation_type_to_code["hypernym"]])
+    for _ in range(int_random_hierarchies_count) :
+        int_count = random_obj.randint(2, 25)
+        # The synsets' IDs are shuffled, so that they are not topologically
+        # sorted, like in the lexicon.
+        lst_int_ids = list(range(int_count))
+        random_obj.shuffle(lst_int_ids)
+        lst_tpl_hypernyms = [()] * int_count
+        lst_lst_hyponyms = [[] for _ in range(int_count)]
+        for int_index in range(1, int_count) :
+            lst_tpl_hypernyms[lst_int_ids[int_index]] = tuple(
+                lst_int_ids[int_hypernym_index] for int_hypernym_index in random_obj.sample(
+                    range(int_index), min(int_index, random_obj.randint(1, 3))))
+            for int_hypernym_id in lst_tpl_hypernyms[lst_int_ids[int_index]] :
+                lst_lst_hyponyms[int_hypernym_id].append(lst_int_ids[int_index])
+        _check_hypernym_hierarchy(
+            HypernymHierarchy.from_relation_graph(RelationGraph.from_relations(
+                lst_tpl_hypernyms,
+                [bytes_hypernym_code * len(tpl_hypernyms) for tpl_hypernyms in lst_tpl_hypernyms],
+                lst_synset_relation_types)),
+            lst_lst_hyponyms)
+    print("Descendants of all synsets from the interval labels: checked in {:.1f} s;".format(
+        flt_lexicon_seconds))
+    print("  and in {:d} random hierarchies with multiple inheritance.".format(
+        int_random_hierarchies_count))
+
+
+def check_information_contents(lexicon) :
+    # The intrinsic ICs by the brute-force counts of the hyponyms.
+    lst_lst_hyponyms = [[] for _ in range(lexicon.synset_relation_graph.count_of_nodes)]
+    (arr_sources, arr_targets) = lexicon.synset_relation_graph.edges(
+        ("hypernym", "instance_hypernym",))
+    for (int_synset_id, int_hypernym_id) in zip(arr_sources.tolist(), arr_targets.tolist()) :
+        lst_lst_hyponyms[int_hypernym_id].append(int_synset_id)
+    dict_part_of_speech_to_count = {}
+    for synset_obj in lexicon.list_of_synsets :
+        dict_part_of_speech_to_count[synset_obj.part_of_speech] = \
+            dict_part_of_speech_to_count.get(synset_obj.part_of_speech, 0) + 1
+    synset_similarity = SynsetSimilarity(lexicon)
+    for synset_obj in lexicon.list_of_synsets :
+        int_count = dict_part_of_speech_to_count[synset_obj.part_of_speech]
+        flt_information_content = 1. if int_count <= 1 else 1. - math.log(
+            len(_brute_force_descendants(lst_lst_hyponyms, synset_obj.int_id)) + 1) / math.log(int_count)
+        if abs(synset_similarity.information_content(synset_obj) - flt_information_content) > 1e-12 :
+            raise ValueError(
+                'Error: expecting the same information content of synset "{0}".'.format(
+                synset_obj.identifier))
+    print("Intrinsic information contents of all synsets: checked.")
+
+
+def check_similarity_matrix(lexicon, int_sample_size = 200) :
+    # The similarity matrices of a random sample of synsets (with some pairs
+    # of the same synsets) by the pairwise similarities: NaN stands for None,
+    # or for the ValueError of different parts of speech.
+    random_obj = random.Random(12345)
+    lst_synsets = lexicon.list_of_synsets
+    lst_synsets_a = random_obj.sample(lst_synsets, min(int_sample_size, len(lst_synsets)))
+    lst_synsets_b = random_obj.sample(lst_synsets, min(int_sample_size, len(lst_synsets))) + \
+        lst_synsets_a[:10]
+    synset_similarity = SynsetSimilarity(lexicon)
+    for str_measure in tpl_similarity_measures :
+        fn_similarity = getattr(synset_similarity, str_measure + "_similarity")
+        tpl_bool_simulate_roots = (True, False,) if str_measure in (
+            "path", "wu_palmer", "leacock_chodorow",) else (True,)
+        for bool_simulate_root in tpl_bool_simulate_roots :
+            arr_similarities = synset_similarity.similarity_matrix(
+                lst_synsets_a, lst_synsets_b, str_measure, bool_simulate_root)
+            for (int_row, synset_obj) in enumerate(lst_synsets_a) :
+                for (int_column, other_synset_obj) in enumerate(lst_synsets_b) :
+                    try :
+                        if len(tpl_bool_simulate_roots) > 1 :
+                            flt_similarity = fn_similarity(
+                                synset_obj, other_synset_obj, bool_simulate_root)
+                        else :
+                            flt_similarity = fn_similarity(synset_obj, other_synset_obj)
+                    except ValueError :
+                        flt_similarity = None
+                    flt_matrix_similarity = float(arr_similarities[int_row, int_column])
+                    if flt_similarity is None :
+                        bool_same = math.isnan(flt_matrix_similarity)
+                    else :
+                        bool_same = flt_matrix_similarity == flt_similarity or \
+                            abs(flt_matrix_similarity - flt_similarity) <= 1e-12
+                    if not bool_same :
+                        raise ValueError(
+                            'Error: expecting the same {0} similarity of synsets "{1}" and "{2}" '
+                            'in the matrix, got {3} and {4}.'.format(
+                                str_measure, synset_obj.identifier, other_synset_obj.identifier,
+                                flt_matrix_similarity, flt_similarity))
+    print("Similarity matrices of {:d} x {:d} random synsets: checked.".format(
+        len(lst_synsets_a), len(lst_synsets_b)))
+
+
+###############################################################################
+# Spelling suggestions: the forms, which sound the same, come first.
+
+
+tpl_tpl_sound_alike_written_forms = (
+    ("fone", "phone",), ("nite", "night",),
+    ("tuff", "tough",), ("enuf", "enough",), ("thru", "through",),)
+
+
+def check_sound_alike_suggestions(lexicon) :
+    for (str_written_form, str_expected_written_form) in tpl_tpl_sound_alike_written_forms :
+        if phonetic_key(str_written_form) != phonetic_key(str_expected_written_form) :
+            raise ValueError('Error: expecting the same phonetic key for "{0}" and "{1}".'.format(
+                str_written_form, str_expected_written_form))
+        if len(lexicon.find_lexical_entries(str_expected_written_form)) == 0 :
+            continue
+        for lst_tpl_suggestions in (
+                lexicon.suggest_written_forms(str_written_form),
+                lexicon.find_written_forms_by_sound(str_written_form),) :
+            if len(lst_tpl_suggestions) == 0 or lst_tpl_suggestions[0][0] != str_expected_written_form :
+                raise ValueError('Error: expecting "{0}" first for "{1}", got {2}.'.format(
+                    str_expected_written_form, str_written_form, lst_tpl_suggestions))
+    print("Sound-alike spelling suggestions: checked.")
+
+
+###############################################################################
+# XML loading: serial versus parallel.
+#
+# The document is made harder to split: every "LexicalEntry" tag gets a nested
+# "SyntacticBehaviour" tag (as allowed by WN-LMF 1.1+) and a comment with a
+# "<Synset" tag, so that the shards must be cut at the children of the
+# "Lexicon" tag only. Both loadings must give byte-identical pickles.
+
+
+def benchmark_xml_loading(
+        str_file_path, str_file_name, str_file_extension, int_processes) :
+    (fp_raw, _, fp_xml) = Lexicon._open_xml_file(
+        str_file_path, str_file_name, str_file_extension)
+    with fp_raw :
+        bytes_xml = fp_xml.read()
+    bytes_xml = bytes_xml.replace(
+        b"</LexicalEntry>",
+        b'<SyntacticBehaviour subcategorizationFrame="Somebody ----s"/>'
+        b'<!-- <Synset id="nested"> --></LexicalEntry>')
+    with tempfile.TemporaryDirectory() as str_temp_dir_path :
+        with open(os.path.join(str_temp_dir_path, str_file_name + ".xml"), "wb") as fp_temp :
+            fp_temp.write(bytes_xml)
+        del bytes_xml
+        flt_start_time = time.perf_counter()
+        lexicon = Lexicon.load_from_xml(str_temp_dir_path, str_file_name)
+        flt_serial_seconds = time.perf_counter() - flt_start_time
+        bytes_serial_pickle = pickle.dumps(lexicon, pickle.HIGHEST_PROTOCOL)
+        del lexicon
+        flt_start_time = time.perf_counter()
+        lexicon = Lexicon.load_from_xml_in_parallel(
+            str_temp_dir_path, str_file_name, int_processes = int_processes)
+        flt_parallel_seconds = time.perf_counter() - flt_start_time
+        bytes_parallel_pickle = pickle.dumps(lexicon, pickle.HIGHEST_PROTOCOL)
+        del lexicon
+    if bytes_serial_pickle != bytes_parallel_pickle :
+        raise ValueError('Error: expecting the same lexicon from the parallel loading.')
+    print("XML loading (with nested tags and comments):")
+    print("  serial: {:.1f} s;".format(flt_serial_seconds))
+    print("  parallel ({:d} processes): {:.1f} s.".format(
+        int_processes, flt_parallel_seconds))
+
+
+###############################################################################
+
+
+def main() -> int :
+
+    benchmark_xml_loading(
+        DIR_PATH_DATA_XML_WORDNET, FILE_NAME_DATA_XML_WORDNET,
+        FILE_EXT_DATA_XML_WORDNET, max(2, INT_XML_LOADING_PROCESSES))
+    print()
+    lexicon = benchmark_memory_footprint(
+        DIR_PATH_DATA_PKL_XZ_WORDNET, FILE_NAME_DATA_PKL_XZ_WORDNET)
+    print()
+    benchmark_relation_traversal(lexicon)
+    check_shortest_paths(lexicon)
+    print()
+    check_hypernym_hierarchy(lexicon)
+    check_information_contents(lexicon)
+    check_similarity_matrix(lexicon)
+    print()
+    check_sound_alike_suggestions(lexicon)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -20,7 +20,6 @@
 import os
 import sys
 import json
-import heapq
 from datetime import datetime
 import configparser
 from tensorflow.keras.models import model_from_json
@@ -29,21 +28,19 @@ import tensorflow as tf
 import random
 import colorama
 from colorama import Fore, Style #, Back
-# pip install --upgrade rapidfuzz
-from rapidfuzz.distance import DamerauLevenshtein
 from wn_repository import \
     Lexicon, \
     LexicalEntry, \
     Lemma, \
     Pronunciation, \
-    Form, \
     Sense, \
     SyntacticBehaviour,\
     SenseRelation, \
     Synset, \
     SynsetRelation, \
-    Definition, \
-    Example, \
+    RelationGraph, \
+    SymmetricDeleteIndex, \
+    HypernymHierarchy, \
     dict_parts_of_speech_code_to_name, \
     dict_relations_between_senses_name_to_descr, \
     dict_other_relations_between_senses_name_to_descr, \
@@ -53,7 +50,10 @@ from wn_repository import \
     dict_sense_relations_syntactic_behaviours_code_to_descr, \
     dict_relations_between_synsets_name_to_descr, \
     DIR_PATH_DATA_PKL_XZ_WORDNET, \
-    FILE_NAME_DATA_PKL_XZ_WORDNET
+    FILE_NAME_DATA_PKL_XZ_WORDNET, \
+    DIR_PATH_DATA_MMAP_WORDNET, \
+    FILE_NAME_DATA_MMAP_WORDNET, \
+    FILE_EXT_DATA_MMAP_WORDNET
 from intent_shared import \
     clean_intent_features_in_list, \
     lst_str_contexts_names, \
@@ -64,6 +64,10 @@ from intent_shared import \
     DIR_PATH_MODELS_OUTPUT_LOOKUP_SCHEMAS
 
 
+# The longest chain of synonym set relations, which is worth explaining.
+INT_MAX_SYNSETS_CONNECTION_LENGTH = 6
+
+
 class ChatState :
 
     def __init__(self,) :
@@ -276,9 +280,18 @@ def initialize_chat() :
         Fore.CYAN +
         "Please, give me a few seconds to refresh my memory before we start chatting ..." +
         Style.RESET_ALL)
-    lexicon = Lexicon.load_from_lzma(
-        str_file_path = DIR_PATH_DATA_PKL_XZ_WORDNET,
-        str_file_name = FILE_NAME_DATA_PKL_XZ_WORDNET)
+    # The memory-mapped repository opens instantly and is read lazily,
+    # while the compressed "pickle" repository is a fallback.
+    if os.path.isfile(os.path.join(
+            DIR_PATH_DATA_MMAP_WORDNET,
+            FILE_NAME_DATA_MMAP_WORDNET + FILE_EXT_DATA_MMAP_WORDNET)) :
+        lexicon = Lexicon.load_from_mmap(
+            str_file_path = DIR_PATH_DATA_MMAP_WORDNET,
+            str_file_name = FILE_NAME_DATA_MMAP_WORDNET)
+    else :
+        lexicon = Lexicon.load_from_lzma(
+            str_file_path = DIR_PATH_DATA_PKL_XZ_WORDNET,
+            str_file_name = FILE_NAME_DATA_PKL_XZ_WORDNET)
     # lexicon.print_summary()
     for str_context_name in lst_str_contexts_names :
         dict_all_context_names_to_contexts[str_context_name] = Context(
@@ -375,10 +388,11 @@ def find_lexical_entry(
 
         print(Fore.MAGENTA + "What is your choice of a written word?" + Style.RESET_ALL)
         str_writtenForm = input().strip()
-        lst_found_LexicalEntry = []
-        for le in lexicon.dictionary_of_lexical_entries.values() :
-            if str_writtenForm == le.written_form :
-                lst_found_LexicalEntry.append(le)
+        lst_found_LexicalEntry = lexicon.find_lexical_entries(str_writtenForm)
+        if len(lst_found_LexicalEntry) == 0 :
+            # Try matching other forms, case, hyphens, spaces and underscores
+            lst_found_LexicalEntry = lexicon.find_lexical_entries_by_normalized_form(
+                str_writtenForm)
 
         if len(lst_found_LexicalEntry) == 0 :
             # Try using fuzzy matching
@@ -387,13 +401,10 @@ def find_lexical_entry(
                 # This code is inactive (see "int_top_best_matches_max_count")
                 str_best_matching_written_form = None
                 flt_dam_lev_norm_dist_upper_threshold = .5 # up to 1.
-                flt_shortest_dam_lev_norm_dist = flt_dam_lev_norm_dist_upper_threshold
-                for le in lexicon.dictionary_of_lexical_entries.values() :
-                    flt_curr_dam_lev_norm_dist = DamerauLevenshtein.normalized_distance(
-                        str_writtenForm, le.written_form)
-                    if flt_curr_dam_lev_norm_dist < flt_shortest_dam_lev_norm_dist :
-                        flt_shortest_dam_lev_norm_dist = flt_curr_dam_lev_norm_dist
-                        str_best_matching_written_form = le.written_form
+                for (str_similar_written_form, flt_curr_dam_lev_norm_dist) in \
+                        lexicon.find_similar_written_forms(str_writtenForm, 1) :
+                    if flt_curr_dam_lev_norm_dist < flt_dam_lev_norm_dist_upper_threshold :
+                        str_best_matching_written_form = str_similar_written_form
                 if str_best_matching_written_form is not None :
                     print(
                         Fore.RED +
@@ -416,9 +427,7 @@ def find_lexical_entry(
 
                     if str_yes_no == "yes" :
                         str_writtenForm = str_best_matching_written_form
-                        for le in lexicon.dictionary_of_lexical_entries.values() :
-                            if str_writtenForm == le.written_form :
-                                lst_found_LexicalEntry.append(le)
+                        lst_found_LexicalEntry = lexicon.find_lexical_entries(str_writtenForm)
                     elif str_yes_no == "no" :
                         pass
                     else :
@@ -426,23 +435,20 @@ def find_lexical_entry(
                               Style.RESET_ALL)
             else : # if int_top_best_matches_max_count > 1
                 str_best_matching_written_form = None
-                lst_tpl_best_matching_written_forms = []
-                for le in lexicon.dictionary_of_lexical_entries.values() :
-                    flt_curr_dam_lev_norm_dist = DamerauLevenshtein.normalized_distance(
-                        str_writtenForm, le.written_form)
-                    if len(lst_tpl_best_matching_written_forms) < int_top_best_matches_max_count :
-                        heapq.heappush(
-                            lst_tpl_best_matching_written_forms,
-                            (-flt_curr_dam_lev_norm_dist, le.written_form))
-                    elif lst_tpl_best_matching_written_forms[0][0] < flt_curr_dam_lev_norm_dist :
-                        heapq.heappushpop(
-                            lst_tpl_best_matching_written_forms,
-                            (-flt_curr_dam_lev_norm_dist, le.written_form))
-                intNumWrittenForms = len(lst_tpl_best_matching_written_forms)
-                lst_str_best_matching_written_forms = [None] * intNumWrittenForms
-                for i in range(len(lst_str_best_matching_written_forms)-1,-1,-1) :
-                    lst_str_best_matching_written_forms[i] = \
-                        heapq.heappop(lst_tpl_best_matching_written_forms)[1]
+                lst_tpl_best_matching_written_forms = lexicon.suggest_written_forms(
+                    str_writtenForm, int_top_best_matches_max_count)
+                if len(lst_tpl_best_matching_written_forms) == 0 :
+                    # Nothing is close enough, so take the closest ones anyway,
+                    # among the forms sharing character n-grams with the word
+                    lst_tpl_best_matching_written_forms = lexicon.find_written_forms_by_ngrams(
+                        str_writtenForm, int_top_best_matches_max_count)
+                if len(lst_tpl_best_matching_written_forms) == 0 :
+                    lst_tpl_best_matching_written_forms = lexicon.find_similar_written_forms(
+                        str_writtenForm, int_top_best_matches_max_count)
+                lst_str_best_matching_written_forms = [
+                    str_similar_written_form for (str_similar_written_form, _) in
+                    lst_tpl_best_matching_written_forms]
+                intNumWrittenForms = len(lst_str_best_matching_written_forms)
                 print(
                     Fore.RED +
                     'I have never heard of "{0}", but it looks similar to one of the following options:'.format(
@@ -471,9 +477,11 @@ def find_lexical_entry(
                         str_best_matching_written_form = lst_str_best_matching_written_forms[
                             intSelectedWrittenFormIndex]
                         str_writtenForm = str_best_matching_written_form
-                        for le in lexicon.dictionary_of_lexical_entries.values() :
-                            if str_writtenForm == le.written_form :
-                                lst_found_LexicalEntry.append(le)
+                        lst_found_LexicalEntry = lexicon.find_lexical_entries(str_writtenForm)
+                        if len(lst_found_LexicalEntry) == 0 :
+                            # The suggestions may include other forms, e.g. "ran"
+                            lst_found_LexicalEntry = lexicon.find_lexical_entries_by_normalized_form(
+                                str_writtenForm)
                     else :
                         print(
                             Fore.RED +
@@ -563,18 +571,16 @@ def find_lexical_entry(
                 dict_parts_of_speech_code_to_name[str_selected_part_of_speech_code],
                 ) + Style.RESET_ALL)
 
-        lst_found_LexicalEntry = []
-        for le in lexicon.dictionary_of_lexical_entries.values() :
-            if str_selected_part_of_speech_code == le.part_of_speech :
-                lst_found_LexicalEntry.append(le)
-        if len(lst_found_LexicalEntry) == 0 :
+        arr_found_lexical_entries_int_ids = lexicon.lexical_entries_int_ids_of(
+            str_selected_part_of_speech_code)
+        if len(arr_found_lexical_entries_int_ids) == 0 :
             print(Fore.RED + 'Sorry, but I do not know any such part of speech.' +
                 Style.RESET_ALL)
-        else : # len(lst_found_LexicalEntry) >= 1 :
+        else : # len(arr_found_lexical_entries_int_ids) >= 1 :
             print(Fore.GREEN + 'I am aware of {0} {1}{2}.'.format(
-                len(lst_found_LexicalEntry),
+                len(arr_found_lexical_entries_int_ids),
                 dict_parts_of_speech_code_to_name[str_selected_part_of_speech_code],
-                "" if len(lst_found_LexicalEntry) == 1 else "s") +
+                "" if len(arr_found_lexical_entries_int_ids) == 1 else "s") +
                 Style.RESET_ALL)
             if str_selected_part_of_speech_code in {'n', 'a', 'v'} :
                 if False :
@@ -649,20 +655,12 @@ def find_lexical_entry(
                         str_selected_lexicographer_file_code.split(".")[-1],
                         dict_synset_lexicographer_files_name_to_descr[str_selected_lexicographer_file_code],) + Style.RESET_ALL)
 
-                    lst_orig_found_LexicalEntry = lst_found_LexicalEntry
-                    lst_found_LexicalEntry = []
-                    for tmp_LexicalEntry in lst_orig_found_LexicalEntry :
-                        bool_lex_entry_has_lex_file_categ = False
-                        for tmp_Sense in list(tmp_LexicalEntry.dictionary_of_senses.values()) :
-                            if lexicon.dictionary_of_synsets[tmp_Sense.synset_identifier].lexical_file_category == str_selected_lexicographer_file_code :
-                                bool_lex_entry_has_lex_file_categ = True
-                                break
-                        if bool_lex_entry_has_lex_file_categ : 
-                            lst_found_LexicalEntry.append(tmp_LexicalEntry)
+                    arr_found_lexical_entries_int_ids = lexicon.lexical_entries_int_ids_of(
+                        str_selected_part_of_speech_code, str_selected_lexicographer_file_code)
                     print(Fore.CYAN + 'I know {0} {1}{2} from the lexicographer file "{3}", which has {4}!'.format(
-                        len(lst_found_LexicalEntry),
+                        len(arr_found_lexical_entries_int_ids),
                         dict_parts_of_speech_code_to_name[str_selected_part_of_speech_code],
-                        "" if len(lst_found_LexicalEntry) == 1 else "s",
+                        "" if len(arr_found_lexical_entries_int_ids) == 1 else "s",
                         str_selected_lexicographer_file_code.split(".")[-1],
                         dict_synset_lexicographer_files_name_to_descr[str_selected_lexicographer_file_code],
                         ) + Style.RESET_ALL)
@@ -672,8 +670,9 @@ def find_lexical_entry(
                     print(Fore.RED + 'I did not get it. I expected "yes" or "no" from you.' + Style.RESET_ALL)
                     print(Fore.RED + 'But I will take your answer as "no", and I will make a choice from any word category.' + Style.RESET_ALL)
 
-            intSelectedLexicalEntryIndex = random.randint(0, len(lst_found_LexicalEntry) - 1)
-            found_LexicalEntry = lst_found_LexicalEntry[intSelectedLexicalEntryIndex]
+            intSelectedLexicalEntryIndex = random.randint(0, len(arr_found_lexical_entries_int_ids) - 1)
+            found_LexicalEntry = lexicon.list_of_lexical_entries[
+                int(arr_found_lexical_entries_int_ids[intSelectedLexicalEntryIndex])]
             chat_state.previous_lexical_entry = chat_state.current_lexical_entry
             chat_state.current_lexical_entry = found_LexicalEntry
             chat_state.previous_sense = chat_state.current_sense
@@ -733,10 +732,10 @@ def process_found_lexical_entry(
             dict_parts_of_speech_code_to_name[
                 chat_state.current_lexical_entry.part_of_speech],
             chat_state.current_lexical_entry.written_form,
-            chat_state.current_lexical_entry.list_of_forms[0].written_form,) + Style.RESET_ALL)
+            chat_state.current_lexical_entry.list_of_forms[0],) + Style.RESET_ALL)
     elif intNumForms > 1 :
         str_forms = '"' + '", or "'.join(
-            [form_obj.written_form for form_obj in chat_state.current_lexical_entry.list_of_forms]) + '"'
+            chat_state.current_lexical_entry.list_of_forms) + '"'
         print(
             Fore.CYAN +
             'The {0} "{1}" has {2} more alternative forms: {3}.'.format(
@@ -751,7 +750,7 @@ def process_found_lexical_entry(
             tmp_Sense = list(chat_state.current_lexical_entry.dictionary_of_senses.values())[0]
             tmp_Synset = lexicon.dictionary_of_synsets[tmp_Sense.synset_identifier]
             str_definitions = '"' + '", or "'.join(
-                [definition.text for definition in tmp_Synset.list_of_definitions]) + '"'
+                tmp_Synset.list_of_definitions) + '"'
             if str_definitions == '""' :
                 str_definitions = "no definition"
             print(
@@ -775,7 +774,7 @@ def process_found_lexical_entry(
             for (i, tmp_Sense) in enumerate(lst_senses_for_curr_lexical_entry) :
                 tmp_Synset = lexicon.dictionary_of_synsets[tmp_Sense.synset_identifier]
                 str_definitions = '"' + '", or "'.join(
-                    [definition_obj.text for definition_obj in tmp_Synset.list_of_definitions]) + '"'
+                    tmp_Synset.list_of_definitions) + '"'
                 if str_definitions == '""' :
                     str_definitions = "no definition"
                 print(Fore.CYAN +'{0}. {1}.'.format(
@@ -820,7 +819,7 @@ def process_found_lexical_entry(
                 "Let me tell you about sense # {0}.".format(
                 intSelectedSenseIndex + 1,) + Style.RESET_ALL)
 
-        intNumSenseRelations = len(chat_state.current_sense.dictionary_of_sense_relations)
+        intNumSenseRelations = len(chat_state.current_sense.list_of_sense_relations)
         if intNumSenseRelations == 0 :
             print(
                 Fore.CYAN +
@@ -834,6 +833,17 @@ def process_found_lexical_entry(
                 Fore.CYAN +
                 "This sense has {0} relations with other senses.".format(
                 intNumSenseRelations,) + Style.RESET_ALL)
+        intNumIncomingSenseRelations = lexicon.sense_incoming_relation_graph.degree(
+            chat_state.current_sense.int_id)
+        if intNumIncomingSenseRelations == 1 :
+            print(
+                Fore.CYAN +
+                "Another sense has a relation with this sense." + Style.RESET_ALL)
+        elif intNumIncomingSenseRelations > 1 :
+            print(
+                Fore.CYAN +
+                "Other senses have {0} relations with this sense.".format(
+                intNumIncomingSenseRelations,) + Style.RESET_ALL)
 
         int_syntactic_behaviour_count = len(chat_state.current_sense.list_of_syntactic_behaviour_identifiers)
         if int_syntactic_behaviour_count == 1 :
@@ -888,7 +898,7 @@ def process_found_lexical_entry(
                     dict_parts_of_speech_code_to_name[
                         tmp_LexicalEntry.part_of_speech]) + Style.RESET_ALL)
 
-        intNumSynsetRelations = len(chat_state.current_synset.dictionary_of_synset_relations)
+        intNumSynsetRelations = len(chat_state.current_synset.list_of_synset_relations)
         if intNumSynsetRelations == 0 :
             print(
                 Fore.CYAN +
@@ -904,6 +914,18 @@ def process_found_lexical_entry(
                 Fore.CYAN +
                 "This synonym group has {0} relations with other synonym groups.".format(
                 intNumSynsetRelations,) + Style.RESET_ALL)
+        intNumIncomingSynsetRelations = lexicon.synset_incoming_relation_graph.degree(
+            chat_state.current_synset.int_id)
+        if intNumIncomingSynsetRelations == 1 :
+            print(
+                Fore.CYAN +
+                "Another synonym group has a relation with this synonym group." +
+                Style.RESET_ALL)
+        elif intNumIncomingSynsetRelations > 1 :
+            print(
+                Fore.CYAN +
+                "Other synonym groups have {0} relations with this synonym group.".format(
+                intNumIncomingSynsetRelations,) + Style.RESET_ALL)
 
         lfc = chat_state.current_synset.lexical_file_category
         str_lexical_file_category_descr = \
@@ -934,12 +956,12 @@ def process_found_lexical_entry(
                 print(Fore.CYAN + 'This sense of the {0} "{1}" is defined as follows: "{2}".'.format(
                     dict_parts_of_speech_code_to_name[chat_state.current_lexical_entry.part_of_speech],
                     chat_state.current_lexical_entry.written_form,
-                    chat_state.current_synset.list_of_definitions[0].text,) + Style.RESET_ALL)
+                    chat_state.current_synset.list_of_definitions[0],) + Style.RESET_ALL)
             else :
                 print(Fore.CYAN + 'The synonym group with the {0} "{1}" is defined as follows: "{2}".'.format(
                     dict_parts_of_speech_code_to_name[chat_state.current_lexical_entry.part_of_speech],
                     chat_state.current_lexical_entry.written_form,
-                    chat_state.current_synset.list_of_definitions[0].text,) + Style.RESET_ALL)
+                    chat_state.current_synset.list_of_definitions[0],) + Style.RESET_ALL)
         else : # len(chat_state.current_synset.list_of_definitions) > 1
             if int_lexical_entries_count <= 1 :
                 print(Fore.CYAN + 'This sense of the {0} "{1}" can be defined in different ways as follows:'.format(
@@ -949,9 +971,9 @@ def process_found_lexical_entry(
                 print(Fore.CYAN + 'The synonym group with the {0} "{1}" can be defined in different ways as follows:'.format(
                     dict_parts_of_speech_code_to_name[chat_state.current_lexical_entry.part_of_speech],
                     chat_state.current_lexical_entry.written_form,) + Style.RESET_ALL)
-            for (int_def_idx, definition_obj) in enumerate(chat_state.current_synset.list_of_definitions) :
+            for (int_def_idx, str_definition) in enumerate(chat_state.current_synset.list_of_definitions) :
                 print(Fore.CYAN + '{0}. "{1}".'.format(
-                    int_def_idx + 1, definition_obj.text) +
+                    int_def_idx + 1, str_definition) +
                     Style.RESET_ALL)
 
         if len(chat_state.current_synset.list_of_examples) == 0 :
@@ -964,12 +986,12 @@ def process_found_lexical_entry(
                 print(Fore.CYAN + 'This sense of the {0} "{1}" has an example as follows: "{2}".'.format(
                     dict_parts_of_speech_code_to_name[chat_state.current_lexical_entry.part_of_speech],
                     chat_state.current_lexical_entry.written_form,
-                    chat_state.current_synset.list_of_examples[0].text,) + Style.RESET_ALL)
+                    chat_state.current_synset.list_of_examples[0],) + Style.RESET_ALL)
             else :
                 print(Fore.CYAN + 'The synonym group with the {0} "{1}" has an example as follows: "{2}".'.format(
                     dict_parts_of_speech_code_to_name[chat_state.current_lexical_entry.part_of_speech],
                     chat_state.current_lexical_entry.written_form,
-                    chat_state.current_synset.list_of_examples[0].text,) + Style.RESET_ALL)
+                    chat_state.current_synset.list_of_examples[0],) + Style.RESET_ALL)
         else : # len(chat_state.current_synset.list_of_examples) > 1
             if int_lexical_entries_count <= 1 :
                 print(Fore.CYAN + 'This sense of the {0} "{1}" has some examples as follows:'.format(
@@ -979,9 +1001,9 @@ def process_found_lexical_entry(
                 print(Fore.CYAN + 'The synonym group with the {0} "{1}" has some examples as follows:'.format(
                     dict_parts_of_speech_code_to_name[chat_state.current_lexical_entry.part_of_speech],
                     chat_state.current_lexical_entry.written_form,) + Style.RESET_ALL)
-            for (int_exa_idx, example_obj) in enumerate(chat_state.current_synset.list_of_examples) :
+            for (int_exa_idx, str_example) in enumerate(chat_state.current_synset.list_of_examples) :
                 print(Fore.CYAN + '{0}. "{1}".'.format(
-                    int_exa_idx + 1, example_obj.text) +
+                    int_exa_idx + 1, str_example) +
                     Style.RESET_ALL)
 
         if intNumSenses > 1 :
@@ -1147,10 +1169,10 @@ def process_found_sense(
         chat_state.current_sense = found_Sense
 
     intNumSenseRelations = len(
-        chat_state.current_sense.dictionary_of_sense_relations)
+        chat_state.current_sense.list_of_sense_relations)
     if intNumSenseRelations > 0 :
-        lst_candidate_sense_relations = list(
-            chat_state.current_sense.dictionary_of_sense_relations.values())
+        lst_candidate_sense_relations = \
+            chat_state.current_sense.list_of_sense_relations
 
         # Listing unique pairs {str_sense_relation_type, str_sense_relation_desc}.
         print(
@@ -1191,7 +1213,7 @@ def process_found_sense(
                 lst_str_candidate_sense_relations_types.append(
                     tmp_sense_relation_obj.sense_relation_type + "-" +
                     tmp_sense_relation_obj.sense_relation_subtype)
-            tmp_target_sense_obj = lexicon.dictionary_of_senses[tmp_sense_relation_obj.target_sense_identifier]
+            tmp_target_sense_obj = lexicon.list_of_senses[tmp_sense_relation_obj.target_sense_int_id]
             tmp_target_synset_obj = lexicon.dictionary_of_synsets[tmp_target_sense_obj.synset_identifier]
             lst_lex_ent_ids =  tmp_target_synset_obj.list_of_lexical_entries_identifiers
             if len(lst_lex_ent_ids) > 0 :
@@ -1237,31 +1259,24 @@ def process_found_sense(
                 str_selected_sense_relation_name.replace("_"," "),
                 str_sense_relation_descr) +
                 Style.RESET_ALL)
-            lst_pre_selected_candidate_sense_relations = []
-            for tmp_sense_relation_obj in lst_candidate_sense_relations :
-                if tmp_sense_relation_obj.sense_relation_type != "other" :
-                    str_sense_relation_type = tmp_sense_relation_obj.sense_relation_type
-                else :
-                    str_sense_relation_type = tmp_sense_relation_obj.sense_relation_type + "-" + \
-                        tmp_sense_relation_obj.sense_relation_subtype
-                if str_sense_relation_type == str_selected_sense_relation_code :
-                    lst_pre_selected_candidate_sense_relations.append(tmp_sense_relation_obj)
-            intNumSenseRelations = len(lst_pre_selected_candidate_sense_relations)
+            if str_selected_sense_relation_code.startswith("other") :
+                lst_pre_selected_target_sense_ids = lexicon.sense_relation_graph.neighbors(
+                    chat_state.current_sense.int_id,
+                    tpl_str_relation_types = ("other",),
+                    tpl_str_relation_subtypes = (str_selected_sense_relation_name,)).tolist()
+            else :
+                lst_pre_selected_target_sense_ids = lexicon.sense_relation_graph.neighbors(
+                    chat_state.current_sense.int_id,
+                    tpl_str_relation_types = (str_selected_sense_relation_name,)).tolist()
+            intNumSenseRelations = len(lst_pre_selected_target_sense_ids)
             if intNumSenseRelations > 1 :
                 print(Fore.CYAN + 'These are the sense relations of type "{0}":'.format(
                     str_selected_sense_relation_code,) + Style.RESET_ALL)
-                for (i, tmp_sense_relation_obj) in enumerate(lst_pre_selected_candidate_sense_relations) :
-                    if tmp_sense_relation_obj.sense_relation_type != "other" :
-                        str_sense_relation_type = tmp_sense_relation_obj.sense_relation_type
-                        lst_str_candidate_sense_relations_types.append(
-                            tmp_sense_relation_obj.sense_relation_type)
-                    else :
-                        str_sense_relation_type = tmp_sense_relation_obj.sense_relation_subtype
-                        lst_str_candidate_sense_relations_types.append(
-                            tmp_sense_relation_obj.sense_relation_type + "-" +
-                            tmp_sense_relation_obj.sense_relation_subtype)
-                    tmp_target_sense_obj = lexicon.dictionary_of_senses[
-                        tmp_sense_relation_obj.target_sense_identifier]
+                for (i, int_target_sense_id) in enumerate(lst_pre_selected_target_sense_ids) :
+                    str_sense_relation_type = str_selected_sense_relation_name
+                    lst_str_candidate_sense_relations_types.append(
+                        str_selected_sense_relation_code)
+                    tmp_target_sense_obj = lexicon.list_of_senses[int_target_sense_id]
                     tmp_target_synset_obj = lexicon.dictionary_of_synsets[
                         tmp_target_sense_obj.synset_identifier]
                     lst_target_lex_ent_ids =  tmp_target_synset_obj.list_of_lexical_entries_identifiers
@@ -1310,17 +1325,11 @@ def process_found_sense(
             else :
                 intSelectedSenseRelationIndex = 0
 
-            selected_sense_relation_obj = lst_pre_selected_candidate_sense_relations[
-                intSelectedSenseRelationIndex]
-            selected_target_sense_obj = lexicon.dictionary_of_senses[
-                selected_sense_relation_obj.target_sense_identifier]
+            selected_target_sense_obj = lexicon.list_of_senses[
+                lst_pre_selected_target_sense_ids[intSelectedSenseRelationIndex]]
             selected_target_synset_obj = lexicon.dictionary_of_synsets[
                 selected_target_sense_obj.synset_identifier]
             lst_selected_target_lex_ent_ids = selected_target_synset_obj.list_of_lexical_entries_identifiers
-            if selected_sense_relation_obj.sense_relation_type == "other" :
-                str_selected_sense_relation_name = selected_sense_relation_obj.sense_relation_subtype
-            else :
-                str_selected_sense_relation_name = selected_sense_relation_obj.sense_relation_type
 
             if len(lst_selected_target_lex_ent_ids) > 0 :
                 print(Fore.CYAN + 'The {0} "{1}" has the sense relation of type "{2}" with the following lexical entries:'.format(
@@ -1396,6 +1405,49 @@ def process_found_sense(
     return updated_Sense
 
 
+def describe_synset(synset_obj, lexicon) :
+    lst_lex_ent_ids = synset_obj.list_of_lexical_entries_identifiers
+    if len(lst_lex_ent_ids) == 0 :
+        return 'the synonym set "{0}"'.format(synset_obj.identifier)
+    return '"' + '", "'.join([
+        lexicon.dictionary_of_lexical_entries[str_lexical_entry_identifier].written_form
+        for str_lexical_entry_identifier in lst_lex_ent_ids]) + '"'
+
+
+def explain_synsets_connection(previous_synset_obj, synset_obj, lexicon) :
+    # Explains, how the previous synonym set is connected to the current one,
+    # unless they are related directly (or too far from each other).
+    if previous_synset_obj is None or previous_synset_obj == synset_obj :
+        return
+    lst_tpl_steps = lexicon.shortest_path(
+        previous_synset_obj, synset_obj,
+        int_max_length = INT_MAX_SYNSETS_CONNECTION_LENGTH)
+    if lst_tpl_steps is None or len(lst_tpl_steps) < 2 :
+        return
+    print(
+        Fore.CYAN +
+        'By the way, {0} and {1} are connected through {2} synonym set relations:'.format(
+        describe_synset(previous_synset_obj, lexicon),
+        describe_synset(synset_obj, lexicon),
+        len(lst_tpl_steps),) + Style.RESET_ALL)
+    for (i, (step_synset_obj, str_synset_relation_type, next_synset_obj, bool_is_inverse)) in \
+            enumerate(lst_tpl_steps) :
+        if bool_is_inverse :
+            (str_from_synset, str_to_synset) = (
+                describe_synset(next_synset_obj, lexicon), describe_synset(step_synset_obj, lexicon))
+        else :
+            (str_from_synset, str_to_synset) = (
+                describe_synset(step_synset_obj, lexicon), describe_synset(next_synset_obj, lexicon))
+        print(Fore.CYAN + '{0}. {1} has "{2}" relation to {3}.'.format(
+            i + 1,
+            str_to_synset,
+            str_synset_relation_type.replace("_", " "),
+            str_from_synset,) + Style.RESET_ALL)
+
+
+###############################################################################
+
+
 def process_found_synset(
         found_Synset, lexicon, chat_state, dict_all_context_names_to_contexts) :
 
@@ -1405,11 +1457,14 @@ def process_found_synset(
         chat_state.previous_synset = chat_state.current_synset
         chat_state.current_synset = found_Synset
 
+    explain_synsets_connection(
+        chat_state.previous_synset, chat_state.current_synset, lexicon)
+
     intNumSynsetRelations = len(
-        chat_state.current_synset.dictionary_of_synset_relations)
+        chat_state.current_synset.list_of_synset_relations)
     if intNumSynsetRelations > 0 :
-        lst_candidate_synset_relations = list(
-            chat_state.current_synset.dictionary_of_synset_relations.values())
+        lst_candidate_synset_relations = \
+            chat_state.current_synset.list_of_synset_relations
 
         # Listing unique pairs {str_synset_relation_type, str_synset_relation_desc}.
         print(
@@ -1441,7 +1496,7 @@ def process_found_synset(
             str_synset_relation_desc = dict_relations_between_synsets_name_to_descr[str_synset_relation_type]
             lst_str_candidate_synset_relations_types.append(
                 tmp_synset_relation_obj.synset_relation_type)
-            tmp_target_synset_obj = lexicon.dictionary_of_synsets[tmp_synset_relation_obj.target_synset_identifier]
+            tmp_target_synset_obj = lexicon.list_of_synsets[tmp_synset_relation_obj.target_synset_int_id]
             lst_lex_ent_ids =  tmp_target_synset_obj.list_of_lexical_entries_identifiers
             if len(lst_lex_ent_ids) > 0 :
                 str_synset_lexical_entries = ': ' + ', '.join([
@@ -1483,21 +1538,18 @@ def process_found_synset(
             print(Fore.CYAN + 'The synonym set relation "{0}" is defined as follows: "{1}".'.format(
                 str_selected_synset_relation_name.replace("_", " "),
                 str_synset_relation_descr) + Style.RESET_ALL)
-            lst_pre_selected_candidate_synset_relations = []
-            for tmp_synset_relation_obj in lst_candidate_synset_relations :
-                str_synset_relation_type = tmp_synset_relation_obj.synset_relation_type
-                if str_synset_relation_type == str_selected_synset_relation_code :
-                    lst_pre_selected_candidate_synset_relations.append(tmp_synset_relation_obj)
-            intNumSynsetRelations = len(lst_pre_selected_candidate_synset_relations)
+            lst_pre_selected_target_synset_ids = lexicon.synset_relation_graph.neighbors(
+                chat_state.current_synset.int_id,
+                tpl_str_relation_types = (str_selected_synset_relation_code,)).tolist()
+            intNumSynsetRelations = len(lst_pre_selected_target_synset_ids)
             if intNumSynsetRelations > 1 :
                 print(Fore.CYAN + 'These are the synonym set relations of type "{0}":'.format(
                     str_selected_synset_relation_code.replace("_", " "),) + Style.RESET_ALL)
-                for (i, tmp_synset_relation_obj) in enumerate(lst_pre_selected_candidate_synset_relations) :
-                    str_synset_relation_type = tmp_synset_relation_obj.synset_relation_type
+                for (i, int_target_synset_id) in enumerate(lst_pre_selected_target_synset_ids) :
+                    str_synset_relation_type = str_selected_synset_relation_code
                     lst_str_candidate_synset_relations_types.append(
-                        tmp_synset_relation_obj.synset_relation_type)
-                    tmp_target_synset_obj = lexicon.dictionary_of_synsets[
-                        tmp_synset_relation_obj.target_synset_identifier]
+                        str_selected_synset_relation_code)
+                    tmp_target_synset_obj = lexicon.list_of_synsets[int_target_synset_id]
                     lst_target_lex_ent_ids =  tmp_target_synset_obj.list_of_lexical_entries_identifiers
                     if len(lst_target_lex_ent_ids) > 0 :
                         str_synset_lexical_entries = ': ' + ', '.join([
@@ -1544,12 +1596,9 @@ def process_found_synset(
             else :
                 intSelectedSynsetRelationIndex = 0
 
-            selected_synset_relation_obj = lst_pre_selected_candidate_synset_relations[
-                intSelectedSynsetRelationIndex]
-            selected_target_synset_obj = lexicon.dictionary_of_synsets[
-                selected_synset_relation_obj.target_synset_identifier]
+            selected_target_synset_obj = lexicon.list_of_synsets[
+                lst_pre_selected_target_synset_ids[intSelectedSynsetRelationIndex]]
             lst_selected_target_lex_ent_ids = selected_target_synset_obj.list_of_lexical_entries_identifiers
-            str_selected_synset_relation_name = selected_synset_relation_obj.synset_relation_type
 
             if len(lst_selected_target_lex_ent_ids) > 0 :
                 print(Fore.CYAN + 'The {0} "{1}" has the synonym set relation of type "{2}" with the following lexical entries:'.format(
@@ -1626,7 +1675,7 @@ def process_found_synset(
                         tmp_Sense = lst_relevant_senses_for_curr_lexical_entry[intSelectedSenseIndex]
                         tmp_Synset = lexicon.dictionary_of_synsets[tmp_Sense.synset_identifier]
                         str_definitions = '"' + '", or "'.join(
-                            [definition.text for definition in selected_target_synset_obj.list_of_definitions]) + '"'
+                            selected_target_synset_obj.list_of_definitions) + '"'
                         if str_definitions == '""' :
                             str_definitions = "no definition"
                         print(
@@ -1648,7 +1697,7 @@ def process_found_synset(
                         for (i, tmp_Sense) in enumerate(lst_relevant_senses_for_curr_lexical_entry) :
                             tmp_Synset = lexicon.dictionary_of_synsets[tmp_Sense.synset_identifier]
                             str_definitions = '"' + '", or "'.join(
-                                [definition_obj.text for definition_obj in tmp_Synset.list_of_definitions]) + '"'
+                                tmp_Synset.list_of_definitions) + '"'
                             if str_definitions == '""' :
                                 str_definitions = "no definition"
                             print(Fore.CYAN +'{0}. {1}.'.format(
@@ -37,10 +37,57 @@ import sys
 import xml.etree.ElementTree as ET
 import pickle
 import lzma
+import gzip
+import time
+import re
+import io
+import tempfile
+import shutil
+import concurrent.futures
+import mmap
+import array
+import json
+import collections.abc
+import bisect
+import zlib
+import unicodedata
+import warnings
+import numpy as np
+# pip install --upgrade rapidfuzz
+from rapidfuzz import process
+from rapidfuzz.distance import DamerauLevenshtein
+
+DIR_PATH_DATA_XML_WORDNET = "data_xml_wordnet"
+FILE_NAME_DATA_XML_WORDNET = "english-wordnet-2024"
+FILE_EXT_DATA_XML_WORDNET = ".xml.gz" # or ".xml.xz", or ".xml"
+# The parallel loading is opt-in until it is benchmarked on the release
+# (e.g. "os.cpu_count()" processes).
+INT_XML_LOADING_PROCESSES = 1 # 1 for the serial loading
+INT_XML_SHARDS_PER_PROCESS = 4
+# Comments, CDATA sections, processing instructions and declarations (with
+# their internal subsets), end tags, and start or empty-element tags (with
+# quoted attribute values, which can contain ">").
+re_xml_markup_token = re.compile(
+    rb"<!--.*?-->|<!\[CDATA\[.*?\]\]>|<\?.*?\?>|"
+    rb"<![^\[>]*(?:\[.*?\][^>]*)?>|</[^>]*>|"
+    rb"<[^>\"']*(?:(?:\"[^\"]*\"|'[^']*')[^>\"']*)*>",
+    re.DOTALL)
+re_xml_shard_start_tag = re.compile(rb"<(?:LexicalEntry|Synset)[\s/>]")
+INT_WRITTEN_FORM_NGRAM_LENGTH = 3
+INT_SYMMETRIC_DELETE_MAX_DISTANCE = 2
+INT_SYMMETRIC_DELETE_PREFIX_LENGTH = 7
 
 DIR_PATH_DATA_PKL_XZ_WORDNET = "data_pkl_xz_wordnet"
 FILE_NAME_DATA_PKL_XZ_WORDNET = "lexicon_oewn"
 
+DIR_PATH_DATA_MMAP_WORDNET = "data_mmap_wordnet"
+FILE_NAME_DATA_MMAP_WORDNET = "lexicon_oewn"
+FILE_EXT_DATA_MMAP_WORDNET = ".mmap"
+STR_MMAP_FILE_MAGIC = b"WNLEXMM2"
+
+# <LexicalResource xmlns:dc="https://globalwordnet.github.io/schemas/dc/">
+STR_XML_ATTRIB_DC_TYPE = "{https://globalwordnet.github.io/schemas/dc/}type" # "dc:type"
+
 
 # Sense Relation's counts by their Syntactic Behaviour types:
 # 1. v: verb
@@ -1105,6 +1152,332 @@ dict_relations_between_synsets_name_to_descr = \
         # loot is an inter-register synonym of money
 }
 
+# Relation type codes: the relations are stored with small integer codes of
+# their types and sub-types, which are their positions in the dictionaries
+# above. The sub-type code 0 ("<empty>") stands for a missing "dc:type". The
+# types and sub-types, which are not in the dictionaries (e.g. from a newer
+# release), get the next codes, when they are met, and they are saved with
+# the lexicon, so that they get the same codes, when it is loaded.
+# Limitation: the codes are module-wide, rather than per lexicon, so all the
+# lexicons of a process share them. Loading a saved lexicon, whose unknown
+# types were given other codes than those of the process (e.g. after another
+# release with other unknown types was loaded first), raises ValueError:
+# such lexicons must be loaded in separate processes.
+lst_sense_relation_types = list(dict_relations_between_senses_name_to_descr.keys())
+dict_sense_relation_type_to_code = {
+    str_type : int_code for (int_code, str_type) in enumerate(lst_sense_relation_types)}
+lst_sense_relation_subtypes = list(dict_other_relations_between_senses_name_to_descr.keys())
+dict_sense_relation_subtype_to_code = {
+    str_subtype : int_code for (int_code, str_subtype) in enumerate(lst_sense_relation_subtypes)}
+lst_synset_relation_types = list(dict_relations_between_synsets_name_to_descr.keys())
+dict_synset_relation_type_to_code = {
+    str_type : int_code for (int_code, str_type) in enumerate(lst_synset_relation_types)}
+
+
+def _relation_name_code(str_name, lst_names, dict_name_to_code, dict_name_to_descr) :
+    int_code = dict_name_to_code.get(str_name)
+    if int_code is None :
+        # The codes are stored as bytes.
+        if len(lst_names) > 255 :
+            raise ValueError('Error: expecting at most 256 relation types, got "{0}".'.format(
+                str_name))
+        int_code = len(lst_names)
+        lst_names.append(sys.intern(str_name))
+        dict_name_to_code[lst_names[-1]] = int_code
+        dict_name_to_descr.setdefault(lst_names[-1], str_name.replace("_", " "))
+    return int_code
+
+
+def sense_relation_type_code(str_sense_relation_type) :
+    return _relation_name_code(
+        str_sense_relation_type, lst_sense_relation_types,
+        dict_sense_relation_type_to_code, dict_relations_between_senses_name_to_descr)
+
+
+def sense_relation_subtype_code(str_sense_relation_subtype) :
+    return _relation_name_code(
+        str_sense_relation_subtype, lst_sense_relation_subtypes,
+        dict_sense_relation_subtype_to_code, dict_other_relations_between_senses_name_to_descr)
+
+
+def synset_relation_type_code(str_synset_relation_type) :
+    return _relation_name_code(
+        str_synset_relation_type, lst_synset_relation_types,
+        dict_synset_relation_type_to_code, dict_relations_between_synsets_name_to_descr)
+
+
+def relation_types_to_dict() :
+    return {
+        "sense_relation_types" : list(lst_sense_relation_types),
+        "sense_relation_subtypes" : list(lst_sense_relation_subtypes),
+        "synset_relation_types" : list(lst_synset_relation_types),}
+
+
+def register_relation_types(dict_relation_types) :
+    # Gives the relation types and sub-types of a saved lexicon (see
+    # "relation_types_to_dict") the codes, which they were saved with.
+    for (str_key, fn_code) in (
+            ("sense_relation_types", sense_relation_type_code),
+            ("sense_relation_subtypes", sense_relation_subtype_code),
+            ("synset_relation_types", synset_relation_type_code),) :
+        for (int_code, str_name) in enumerate(dict_relation_types[str_key]) :
+            if fn_code(str_name) != int_code :
+                raise ValueError(
+                    'Error: expecting the code {0:d} of the relation type "{1}", as saved.'.format(
+                        int_code, str_name))
+
+
+# Normalized written forms: case-folded, with any runs of hyphens, spaces and
+# underscores replaced by single spaces, e.g. "Ice-Cream" -> "ice cream".
+re_written_form_separators = re.compile(r"[\s_\-]+")
+
+
+def normalize_written_form(str_written_form) :
+    return re_written_form_separators.sub(" ", str_written_form.casefold()).strip()
+
+
+# Phonetic keys of written forms, after Lawrence Philips' Metaphone: similar
+# sounding words, e.g. "night" and "nite", or "phone" and "fone", get the same
+# key ("NT" and "FN"). The key keeps the consonants' sounds only (a sound of
+# adjacent letters once), and an initial vowel as "A".
+tpl_phonetic_vowels = ("A", "E", "I", "O", "U",)
+tpl_phonetic_silent_initial_letters_pairs = ("AE", "GN", "KN", "PN", "WR",)
+# A final "GH" after a vowel sounds "F" (e.g. "tough", "laugh"), except after
+# "I" (e.g. "high", "weigh") and in these endings (e.g. "through", "dough").
+tpl_phonetic_silent_final_gh_endings = (
+    "HROUGH", "OROUGH", "THOUGH", "DOUGH", "BOUGH", "PLOUGH",)
+
+
+def phonetic_key(str_written_form) :
+    str_letters = "".join(
+        str_char for str_char in unicodedata.normalize(
+            "NFKD", str_written_form.upper()) if "A" <= str_char <= "Z")
+    if str_letters[:2] in tpl_phonetic_silent_initial_letters_pairs :
+        str_letters = str_letters[1:]
+    elif str_letters[:1] == "X" :
+        str_letters = "S" + str_letters[1:]
+    elif str_letters[:2] == "WH" :
+        str_letters = "W" + str_letters[2:]
+    lst_str_sounds = []
+    str_previous_sound = ""
+    int_length = len(str_letters)
+    for i in range(int_length) :
+        str_char = str_letters[i]
+        str_previous = str_letters[i - 1] if i > 0 else ""
+        str_next = str_letters[i + 1] if i + 1 < int_length else ""
+        str_after_next = str_letters[i + 2] if i + 2 < int_length else ""
+        if str_char == str_previous and str_char != "C" :
+            continue
+        str_sound = ""
+        if str_char in tpl_phonetic_vowels :
+            if i == 0 :
+                str_sound = "A"
+        elif str_char == "B" :
+            if not (str_previous == "M" and i + 1 == int_length) :
+                str_sound = "B"
+        elif str_char == "C" :
+            if str_next == "H" :
+                str_sound = "K" if str_previous == "S" else "X"
+            elif str_next == "I" and str_after_next == "A" :
+                str_sound = "X"
+            elif str_next in ("I", "E", "Y") :
+                if str_previous != "S" :
+                    str_sound = "S"
+            else :
+                str_sound = "K"
+        elif str_char == "D" :
+            if str_next == "G" and str_after_next in ("E", "I", "Y") :
+                str_sound = "J"
+            else :
+                str_sound = "T"
+        elif str_char == "G" :
+            if str_next == "H" and not (i + 2 == int_length or str_after_next in tpl_phonetic_vowels) :
+                pass # e.g. "night"
+            elif str_next == "H" and i + 2 == int_length and str_previous in tpl_phonetic_vowels :
+                if not (str_previous == "I" or
+                        str_letters.endswith(tpl_phonetic_silent_final_gh_endings)) :
+                    str_sound = "F" # e.g. "tough", "enough"
+            elif str_next == "N" and (i + 2 == int_length or str_letters[i + 2:] == "ED") :
+                pass # e.g. "sign", "signed"
+            elif str_previous == "D" and str_next in ("I", "E", "Y") :
+                pass # part of "DGE", "DGI" or "DGY"
+            elif str_next in ("I", "E", "Y") and str_previous != "G" :
+                str_sound = "J"
+            else :
+                str_sound = "K"
+        elif str_char == "H" :
+            if str_previous in ("C", "G", "P", "S", "T") :
+                pass # part of "CH", "GH", "PH", "SH" or "TH"
+            elif str_previous in tpl_phonetic_vowels and str_next not in tpl_phonetic_vowels :
+                pass
+            else :
+                str_sound = "H"
+        elif str_char == "K" :
+            if str_previous != "C" :
+                str_sound = "K"
+        elif str_char == "P" :
+            str_sound = "F" if str_next == "H" else "P"
+        elif str_char == "Q" :
+            str_sound = "K"
+        elif str_char == "S" :
+            if str_next == "H" or (str_next == "I" and str_after_next in ("O", "A")) :
+                str_sound = "X"
+            else :
+                str_sound = "S"
+        elif str_char == "T" :
+            if str_next == "I" and str_after_next in ("O", "A") :
+                str_sound = "X"
+            elif str_next == "H" :
+                str_sound = "0" # "th"
+            elif not (str_next == "C" and str_after_next == "H") :
+                str_sound = "T"
+        elif str_char == "V" :
+            str_sound = "F"
+        elif str_char in ("W", "Y") :
+            if str_next in tpl_phonetic_vowels :
+                str_sound = str_char
+        elif str_char == "X" :
+            str_sound = "KS"
+        elif str_char == "Z" :
+            str_sound = "S"
+        else : # "F", "J", "L", "M", "N", "R"
+            str_sound = str_char
+        if str_sound != str_previous_sound :
+            lst_str_sounds.append(str_sound)
+        str_previous_sound = str_sound
+    return "".join(lst_str_sounds)
+
+
+# Vowel keys of written forms refine their phonetic keys, which have no
+# vowels: every vowel sound is a letter, the short vowels in upper case and
+# the long vowels (e.g. before a final silent "E", or in "IGH") in lower
+# case, so that "fone" and "phone" get the same key ("o"), but "fine" does
+# not ("i"), and "nite" and "night" get the same key ("i"), but "knit" does
+# not ("I"). The diphthongs "OU"/"OW" and "OI"/"OY" are "W" and "Y".
+dict_phonetic_vowel_digraph_to_sound = {
+    "AI" : "a", "AY" : "a", "EI" : "a", "EY" : "a",
+    "EA" : "e", "EE" : "e", "IE" : "e",
+    "OA" : "o", "OE" : "o",
+    "OO" : "u", "EW" : "u", "UE" : "u",
+    "AU" : "O", "AW" : "O",
+    "OU" : "W", "OW" : "W",
+    "OI" : "Y", "OY" : "Y",}
+
+
+def phonetic_vowels_key(str_written_form) :
+    str_letters = "".join(
+        str_char for str_char in unicodedata.normalize(
+            "NFKD", str_written_form.upper()) if "A" <= str_char <= "Z")
+    int_length = len(str_letters)
+    # A final "E" after a consonant is silent (unless it is the only vowel),
+    # and after a single consonant, it makes a single vowel before the
+    # consonant long, e.g. "fone", "nite".
+    int_long_vowel_index = -1
+    if int_length >= 3 and str_letters[-1] == "E" and \
+            str_letters[-2] not in tpl_phonetic_vowels and \
+            any(str_char in tpl_phonetic_vowels for str_char in str_letters[:-2]) :
+        if str_letters[-3] in tpl_phonetic_vowels and \
+                (int_length == 3 or str_letters[-4] not in tpl_phonetic_vowels) :
+            int_long_vowel_index = int_length - 3
+        int_length -= 1
+    lst_str_sounds = []
+    i = 0
+    while i < int_length :
+        str_char = str_letters[i]
+        if str_char == "Y" and i > 0 and (i + 1 == int_length or str_letters[i + 1] not in tpl_phonetic_vowels) :
+            str_char = "I" # a vowel, e.g. "my", "gym"
+        if str_char not in tpl_phonetic_vowels :
+            i += 1
+            continue
+        if str_letters[i:i + 3] == "IGH" :
+            lst_str_sounds.append("i")
+            i += 3
+        elif i + 2 <= int_length and str_letters[i:i + 2] in dict_phonetic_vowel_digraph_to_sound :
+            lst_str_sounds.append(dict_phonetic_vowel_digraph_to_sound[str_letters[i:i + 2]])
+            i += 2
+        else :
+            lst_str_sounds.append(str_char.lower() if i == int_long_vowel_index else str_char)
+            i += 1
+            while i < int_length and str_letters[i] == str_char :
+                i += 1
+    return "".join(lst_str_sounds)
+
+
+# Anagram keys of written forms: their letters and digits, case-folded and
+# sorted, e.g. "Dormitory" and "dirty room" -> "dimoorrty". For the words made
+# from the given letters, the letters are counted by "str_counted_letters",
+# and any other letters or digits together, in the last column.
+str_counted_letters = "abcdefghijklmnopqrstuvwxyz"
+dict_counted_letter_to_column = {
+    str_letter : int_column for (int_column, str_letter) in enumerate(str_counted_letters)}
+
+
+def anagram_key(str_written_form) :
+    return "".join(sorted(
+        str_char for str_char in str_written_form.casefold() if str_char.isalnum()))
+
+
+def written_form_letter_counts(str_written_form) :
+    arr_counts = np.zeros(len(str_counted_letters) + 1, dtype = np.int32)
+    for str_char in anagram_key(str_written_form) :
+        arr_counts[dict_counted_letter_to_column.get(str_char, len(str_counted_letters))] += 1
+    return np.minimum(arr_counts, 255).astype(np.uint8)
+
+
+# Rhymes of pronunciations (IPA texts): a rhyme is the part of a
+# pronunciation from the vowel after its last primary stress mark, or from its
+# last vowels, if no stress is marked, e.g. "/ˈnaɪt/" -> "aɪt". The
+# pronunciations are indexed by "rhyme keys", which are their varieties and
+# their own rhymes, so that the rhyming pronunciations have equal keys (e.g.
+# "/bɪt/" rhymes with "/sɪt/", but not with "/eɪt/", which merely ends with
+# "ɪt").
+str_ipa_vowels = "aeiouyæøœɐɑɒɔəɘɚɛɜɝɞɤɨɪɯɵɶʉʊʌʏ"
+str_ipa_primary_stress_mark = "ˈ"
+str_rhyme_key_variety_separator = "\x1f"
+re_ipa_delimiters = re.compile(r"[/\[\]\s]+")
+re_ipa_stress_and_syllable_marks = re.compile(r"[ˈˌ.]+")
+
+
+def normalize_pronunciation(str_text) :
+    return re_ipa_stress_and_syllable_marks.sub("", re_ipa_delimiters.sub("", str_text))
+
+
+def pronunciation_rhyme(str_text) :
+    str_text = re_ipa_delimiters.sub("", str_text)
+    int_start = len(str_text)
+    if str_ipa_primary_stress_mark in str_text :
+        int_start = str_text.rfind(str_ipa_primary_stress_mark) + 1
+        while int_start < len(str_text) and str_text[int_start] not in str_ipa_vowels :
+            int_start += 1
+    if int_start == len(str_text) :
+        # No stress is marked (or no vowel follows it)
+        int_start = len(str_text)
+        while int_start > 0 and str_text[int_start - 1] not in str_ipa_vowels :
+            int_start -= 1
+        while int_start > 0 and str_text[int_start - 1] in str_ipa_vowels :
+            int_start -= 1
+        if int_start == len(str_text) or str_text[int_start] not in str_ipa_vowels :
+            return "" # no vowels at all
+    return re_ipa_stress_and_syllable_marks.sub("", str_text[int_start:])
+
+
+def rhyme_key(str_text, str_variety = None,) :
+    # The key of the pronunciation's rhyme, or None without vowels.
+    str_rhyme = pronunciation_rhyme(str_text)
+    if str_rhyme == "" :
+        return None
+    return ("" if str_variety is None else str_variety) + \
+        str_rhyme_key_variety_separator + str_rhyme
+
+
+def written_form_ngrams(str_written_form) :
+    # The distinct character n-grams of the normalized written form padded
+    # with "$", sorted, e.g. "Cat" -> "$ca", "at$", "cat".
+    str_padded = "$" + normalize_written_form(str_written_form) + "$"
+    return sorted(set(
+        str_padded[i:i + INT_WRITTEN_FORM_NGRAM_LENGTH] for i in
+        range(max(1, len(str_padded) - INT_WRITTEN_FORM_NGRAM_LENGTH + 1))))
+
 
 ###############################################################################
 
@@ -1117,6 +1490,45 @@ class Lexicon :
         self._dict_senses = {}
         self._dict_synsets = {}
         self._dict_syntactic_behaviours = {}
+        # Entities by their integer IDs (see "_assign_int_ids"):
+        self._list_lexical_entries = []
+        self._list_senses = []
+        self._list_synsets = []
+        # Relations by integer IDs (see "_build_relation_graphs"):
+        self._sense_relation_graph = None
+        self._synset_relation_graph = None
+        self._sense_incoming_relation_graph = None
+        self._synset_incoming_relation_graph = None
+        self._hypernym_hierarchy = None
+        # Lookup indexes (see "_build_lookup_indexes"):
+        self._dict_written_form_to_lexical_entry_int_ids = {}
+        self._dict_normalized_form_to_lexical_entry_int_ids = {}
+        self._list_written_forms = [] # sorted unique written forms
+        self._arr_written_forms_sense_counts = np.zeros(0, dtype = np.int32)
+        # normalized written forms, sorted, and their rows in the above:
+        self._list_autocomplete_keys = []
+        self._arr_autocomplete_written_form_rows = np.zeros(0, dtype = np.int32)
+        # written forms separated (and ended) by "\n", and their offsets in it:
+        self._str_written_forms_buffer = ""
+        self._arr_written_forms_buffer_offsets = np.zeros(1, dtype = np.int32)
+        self._dict_anagram_key_to_written_form_rows = {}
+        # counts of letters of the written forms (see "written_form_letter_counts"):
+        self._arr_written_forms_letter_counts = np.zeros(
+            (0, len(str_counted_letters) + 1), dtype = np.uint8)
+        # rhyme keys (see "rhyme_key") of all pronunciations, sorted, and the
+        # integer IDs of their lexical entries:
+        self._list_rhyme_keys = []
+        self._arr_rhyme_keys_lexical_entry_int_ids = np.zeros(0, dtype = np.int32)
+        self._dict_pronunciation_to_lexical_entry_int_ids = {}
+        self._symmetric_delete_index_of_written_forms = None
+        self._dict_phonetic_key_to_written_form_rows = {}
+        # sorted unique written forms of the lemmas and the "Form" tags:
+        self._list_ngram_indexed_forms = []
+        self._dict_ngram_to_indexed_form_rows = {}
+        self._dict_part_of_speech_to_lexical_entry_int_ids = {}
+        self._dict_lexical_file_category_to_lexical_entry_int_ids = {}
+        # "part of speech" + "\x1f" + "lexicographer file" keys:
+        self._dict_part_of_speech_and_lexical_file_category_to_lexical_entry_int_ids = {}
         # Summary counts collections:
         self._dict_syntactic_behaviour_types_counts = {} # subtype
         self._dict_sense_relation_types_counts = {} # relType
@@ -1160,6 +1572,707 @@ class Lexicon :
     def dictionary_of_syntactic_behaviours(self) :
         return self._dict_syntactic_behaviours
 
+    @property
+    def list_of_lexical_entries(self) :
+        return self._list_lexical_entries
+
+    @property
+    def list_of_senses(self) :
+        return self._list_senses
+
+    @property
+    def list_of_synsets(self) :
+        return self._list_synsets
+
+    @property
+    def sense_relation_graph(self) :
+        return self._sense_relation_graph
+
+    @property
+    def synset_relation_graph(self) :
+        return self._synset_relation_graph
+
+    @property
+    def sense_incoming_relation_graph(self) :
+        return self._sense_incoming_relation_graph
+
+    @property
+    def synset_incoming_relation_graph(self) :
+        return self._synset_incoming_relation_graph
+
+    @property
+    def hypernym_hierarchy(self) :
+        return self._hypernym_hierarchy
+
+    def is_kind_of(self, synset_obj, other_synset_obj,) :
+        # Whether the synset is the other synset or its (instance) hyponym,
+        # directly or not, by the interval labels of the hypernym hierarchy.
+        return self._hypernym_hierarchy.is_a(synset_obj.int_id, other_synset_obj.int_id)
+
+    def shortest_path(
+            self, synset_obj, other_synset_obj, tpl_str_relation_types = None,
+            int_max_length = None,) :
+        # Returns a shortest path from the synset to the other synset over the
+        # synset relations (optionally only of the given types) in either
+        # direction, as the list of "(synset, relation type, next synset,
+        # is inverse)" steps, where the relation goes from the synset to the
+        # next synset, or back from the next synset, if it is inverse. Returns
+        # None without a path (of at most "int_max_length" steps).
+        # Both searches go level by level over the outgoing and the incoming
+        # relations graphs, and the smaller frontier is expanded first, until
+        # they meet.
+        int_synset_id = synset_obj.int_id
+        int_other_synset_id = other_synset_obj.int_id
+        if tpl_str_relation_types is not None :
+            self._synset_relation_graph.relation_type_codes(tpl_str_relation_types)
+        if int_synset_id == int_other_synset_id :
+            return []
+        int_count = self._synset_relation_graph.count_of_nodes
+        tpl_graphs = (self._synset_relation_graph, self._synset_incoming_relation_graph,)
+        # Per search (from the synset and from the other synset): the
+        # distances, the predecessors, the type codes of the relations with
+        # them and whether the relations go from them (i.e. are outgoing).
+        arr_distances = np.full((2, int_count), -1, dtype = np.int32)
+        arr_predecessors = np.full((2, int_count), -1, dtype = np.int32)
+        arr_reltypes = np.zeros((2, int_count), dtype = np.int32)
+        arr_bool_from_predecessors = np.zeros((2, int_count), dtype = np.bool_)
+        arr_distances[0, int_synset_id] = 0
+        arr_distances[1, int_other_synset_id] = 0
+        lst_arr_frontiers = [
+            np.array([int_synset_id], dtype = np.int32),
+            np.array([int_other_synset_id], dtype = np.int32),]
+        lst_int_depths = [0, 0]
+        int_meeting_synset_id = -1
+        while int_meeting_synset_id < 0 and \
+                len(lst_arr_frontiers[0]) > 0 and len(lst_arr_frontiers[1]) > 0 and \
+                (int_max_length is None or lst_int_depths[0] + lst_int_depths[1] < int_max_length) :
+            int_side = 0 if len(lst_arr_frontiers[0]) <= len(lst_arr_frontiers[1]) else 1
+            lst_tpl_edges = [
+                graph.frontier_edges(lst_arr_frontiers[int_side], tpl_str_relation_types)
+                for graph in tpl_graphs]
+            arr_sources = np.concatenate([tpl_edges[0] for tpl_edges in lst_tpl_edges])
+            arr_targets = np.concatenate([tpl_edges[1] for tpl_edges in lst_tpl_edges])
+            arr_types = np.concatenate([tpl_edges[2] for tpl_edges in lst_tpl_edges])
+            arr_bool_outgoing = np.concatenate([
+                np.full(len(lst_tpl_edges[int_graph][0]), int_graph == 0, dtype = np.bool_)
+                for int_graph in range(len(tpl_graphs))])
+            arr_bool_new = arr_distances[int_side, arr_targets] < 0
+            # The first relation with every new synset (outgoing first) wins.
+            (arr_new_ids, arr_first_indices) = np.unique(
+                arr_targets[arr_bool_new], return_index = True)
+            arr_first_indices = np.flatnonzero(arr_bool_new)[arr_first_indices]
+            lst_int_depths[int_side] += 1
+            arr_distances[int_side, arr_new_ids] = lst_int_depths[int_side]
+            arr_predecessors[int_side, arr_new_ids] = arr_sources[arr_first_indices]
+            arr_reltypes[int_side, arr_new_ids] = arr_types[arr_first_indices]
+            arr_bool_from_predecessors[int_side, arr_new_ids] = arr_bool_outgoing[arr_first_indices]
+            lst_arr_frontiers[int_side] = arr_new_ids
+            arr_other_distances = arr_distances[1 - int_side, arr_new_ids]
+            arr_meeting_ids = arr_new_ids[arr_other_distances >= 0]
+            if len(arr_meeting_ids) > 0 :
+                int_meeting_synset_id = int(arr_meeting_ids[np.argmin(
+                    arr_other_distances[arr_other_distances >= 0])])
+        if int_meeting_synset_id < 0 :
+            return None
+        lst_tpl_steps = []
+        int_id = int_meeting_synset_id
+        while int_id != int_synset_id :
+            int_predecessor_id = int(arr_predecessors[0, int_id])
+            lst_tpl_steps.append((
+                self._list_synsets[int_predecessor_id],
+                lst_synset_relation_types[arr_reltypes[0, int_id]],
+                self._list_synsets[int_id],
+                not bool(arr_bool_from_predecessors[0, int_id]),))
+            int_id = int_predecessor_id
+        lst_tpl_steps.reverse()
+        int_id = int_meeting_synset_id
+        while int_id != int_other_synset_id :
+            int_predecessor_id = int(arr_predecessors[1, int_id])
+            lst_tpl_steps.append((
+                self._list_synsets[int_id],
+                lst_synset_relation_types[arr_reltypes[1, int_id]],
+                self._list_synsets[int_predecessor_id],
+                bool(arr_bool_from_predecessors[1, int_id]),))
+            int_id = int_predecessor_id
+        return lst_tpl_steps
+
+    @property
+    def dictionary_of_written_forms(self) :
+        # "written form -> integer IDs of lexical entries" dictionary.
+        return self._dict_written_form_to_lexical_entry_int_ids
+
+    @property
+    def dictionary_of_normalized_forms(self) :
+        # "normalized form -> integer IDs of lexical entries" dictionary,
+        # for the lemmas' and the "Form" tags' written forms.
+        return self._dict_normalized_form_to_lexical_entry_int_ids
+
+    @property
+    def list_of_written_forms(self) :
+        # The unique written forms of the lemmas, sorted.
+        return self._list_written_forms
+
+    @property
+    def written_forms_sense_counts(self) :
+        # NumPy array of the counts of senses (i.e. the polysemy) of the
+        # written forms in "list_of_written_forms", over all their entries.
+        return self._arr_written_forms_sense_counts
+
+    @property
+    def symmetric_delete_index_of_written_forms(self) :
+        # Symmetric delete dictionary over "list_of_written_forms".
+        return self._symmetric_delete_index_of_written_forms
+
+    @property
+    def dictionary_of_phonetic_keys(self) :
+        # "phonetic key -> NumPy array of rows in list_of_written_forms" (see
+        # "phonetic_key") dictionary.
+        return self._dict_phonetic_key_to_written_form_rows
+
+    @property
+    def list_of_ngram_indexed_forms(self) :
+        # The unique written forms of the lemmas and the "Form" tags, sorted.
+        return self._list_ngram_indexed_forms
+
+    @property
+    def dictionary_of_ngrams(self) :
+        # "n-gram -> NumPy array of rows in list_of_ngram_indexed_forms" (see
+        # "written_form_ngrams") inverted index.
+        return self._dict_ngram_to_indexed_form_rows
+
+    @property
+    def dictionary_of_parts_of_speech(self) :
+        # "part of speech -> NumPy array of lexical entries' integer IDs".
+        return self._dict_part_of_speech_to_lexical_entry_int_ids
+
+    @property
+    def dictionary_of_lexical_file_categories(self) :
+        # "lexicographer file -> NumPy array of integer IDs of the lexical
+        # entries, which have at least one sense in this file".
+        return self._dict_lexical_file_category_to_lexical_entry_int_ids
+
+    def lexical_entries_int_ids_of(
+            self, str_part_of_speech, str_lexical_file_category = None,) :
+        # Returns the NumPy array of the integer IDs of the lexical entries
+        # with the given part of speech (and lexicographer file), in the
+        # document order, e.g. to pick a random entry from it.
+        if str_lexical_file_category is None :
+            return np.asarray(
+                self._dict_part_of_speech_to_lexical_entry_int_ids.get(
+                    str_part_of_speech, ()), dtype = np.int32)
+        return np.asarray(
+            self._dict_part_of_speech_and_lexical_file_category_to_lexical_entry_int_ids.get(
+                str_part_of_speech + "\x1f" + str_lexical_file_category, ()), dtype = np.int32)
+
+    def find_lexical_entries(self, str_written_form,) :
+        # Returns the lexical entries with the given written form of their
+        # lemmas, in the document order.
+        return [
+            self._list_lexical_entries[int_id] for int_id in
+            self._dict_written_form_to_lexical_entry_int_ids.get(str_written_form, ())]
+
+    def find_lexical_entries_by_normalized_form(self, str_written_form,) :
+        # Returns the lexical entries, whose lemmas or other forms (e.g.
+        # "ran" for "run") match the given written form, regardless of case,
+        # hyphens, spaces and underscores, in the document order.
+        return [
+            self._list_lexical_entries[int_id] for int_id in
+            self._dict_normalized_form_to_lexical_entry_int_ids.get(
+                normalize_written_form(str_written_form), ())]
+
+    def find_similar_written_forms(self, str_written_form, int_max_count = 7,) :
+        # Returns up to "int_max_count" "(written form, normalized
+        # Damerau-Levenshtein distance)" pairs, which are the closest to the
+        # given written form, from the closest one (the ties are sorted by
+        # the written forms). All distances are computed in one call, which
+        # is spread across all cores.
+        if int_max_count < 1 or len(self._list_written_forms) == 0 :
+            return []
+        arr_distances = process.cdist(
+            [str_written_form], self._materialized_written_forms(),
+            scorer = DamerauLevenshtein.normalized_distance,
+            dtype = np.float64, workers = -1)[0]
+        int_max_count = min(int_max_count, len(arr_distances))
+        flt_max_distance = np.partition(arr_distances, int_max_count - 1)[int_max_count - 1]
+        arr_rows = np.flatnonzero(arr_distances <= flt_max_distance)
+        arr_rows = arr_rows[np.argsort(arr_distances[arr_rows], kind = "stable")][:int_max_count]
+        return [
+            (self._list_written_forms[int_row], float(arr_distances[int_row]))
+            for int_row in arr_rows.tolist()]
+
+    def _materialized_written_forms(self,) :
+        # The sorted unique written forms as a list of strings, which
+        # "process.cdist" scans without decoding them.
+        return self._list_written_forms
+
+    def autocomplete(self, str_prefix, int_max_count = 7,) :
+        # Returns up to "int_max_count" "(written form, count of senses)"
+        # pairs of the written forms, which start with the given prefix
+        # (regardless of case, hyphens, spaces and underscores), the most
+        # polysemous first (the ties are sorted by the normalized forms). The
+        # completions are a range of the sorted normalized forms, which is
+        # found by two binary searches.
+        str_prefix = normalize_written_form(str_prefix)
+        int_start = bisect.bisect_left(self._list_autocomplete_keys, str_prefix)
+        int_end = bisect.bisect_left(self._list_autocomplete_keys, str_prefix + "\U0010ffff")
+        if int_max_count < 1 or int_start == int_end :
+            return []
+        arr_rows = self._arr_autocomplete_written_form_rows[int_start:int_end]
+        arr_negative_counts = -self._arr_written_forms_sense_counts[arr_rows]
+        if len(arr_rows) > int_max_count :
+            int_max_negative_count = np.partition(
+                arr_negative_counts, int_max_count - 1)[int_max_count - 1]
+            arr_bool_mask = arr_negative_counts <= int_max_negative_count
+            arr_rows = arr_rows[arr_bool_mask]
+            arr_negative_counts = arr_negative_counts[arr_bool_mask]
+        return [
+            (self._list_written_forms[int_row], int(self._arr_written_forms_sense_counts[int_row]))
+            for int_row in arr_rows[np.argsort(
+                arr_negative_counts, kind = "stable")[:int_max_count]].tolist()]
+
+    def find_written_forms_by_regex(
+            self, str_regex, int_min_length = None, int_max_length = None, int_flags = 0,) :
+        # Returns the sorted written forms, which contain a match of the
+        # regular expression (e.g. "^un.*able$"), optionally only those of
+        # the given lengths. The regular expression is run over the buffer
+        # of all written forms in the multi-line mode, and the matches are
+        # mapped to the written forms by their offsets in the buffer.
+        re_pattern = re.compile(str_regex, int_flags | re.MULTILINE)
+        arr_offsets = self._arr_written_forms_buffer_offsets
+        int_count = len(arr_offsets) - 1
+        arr_spans = np.array(
+            [re_match.span() for re_match in re_pattern.finditer(self._str_written_forms_buffer)],
+            dtype = np.int64).reshape(-1, 2)
+        arr_rows = np.searchsorted(arr_offsets, arr_spans[:, 0], side = "right") - 1
+        # The empty matches at the end of the buffer are dropped.
+        arr_bool_mask = arr_rows < int_count
+        arr_rows = arr_rows[arr_bool_mask]
+        arr_spans = arr_spans[arr_bool_mask]
+        # A match may span several lines, e.g. by "[^x]*", and then each of
+        # these lines is tried again on its own.
+        arr_bool_spanning = arr_spans[:, 1] > arr_offsets[arr_rows + 1] - 1
+        lst_int_rows = arr_rows[~arr_bool_spanning].tolist()
+        for (int_start_row, int_end) in zip(
+                arr_rows[arr_bool_spanning].tolist(), arr_spans[arr_bool_spanning, 1].tolist()) :
+            int_end_row = min(
+                int_count - 1,
+                int(np.searchsorted(arr_offsets, int_end - 1, side = "right")) - 1)
+            for int_row in range(int_start_row, int_end_row + 1) :
+                if re_pattern.search(
+                        self._str_written_forms_buffer, int(arr_offsets[int_row]),
+                        int(arr_offsets[int_row + 1]) - 1) is not None :
+                    lst_int_rows.append(int_row)
+        arr_rows = np.unique(np.array(lst_int_rows, dtype = np.int32))
+        if int_min_length is not None or int_max_length is not None :
+            arr_lengths = arr_offsets[arr_rows + 1] - arr_offsets[arr_rows] - 1
+            if int_min_length is not None :
+                arr_rows = arr_rows[arr_lengths >= int_min_length]
+                arr_lengths = arr_lengths[arr_lengths >= int_min_length]
+            if int_max_length is not None :
+                arr_rows = arr_rows[arr_lengths <= int_max_length]
+        return [self._list_written_forms[int_row] for int_row in arr_rows.tolist()]
+
+    def find_written_forms_by_wildcard(
+            self, str_wildcard, int_min_length = None, int_max_length = None,) :
+        # Returns the sorted written forms, which match the wildcard pattern
+        # regardless of case, where "?" is any character and "*" is any
+        # characters, e.g. "c?t*", optionally only those of the given lengths.
+        return self.find_written_forms_by_regex(
+            "^" + "".join(
+                ".*" if str_char == "*" else "." if str_char == "?" else re.escape(str_char)
+                for str_char in str_wildcard) + "$",
+            int_min_length = int_min_length, int_max_length = int_max_length,
+            int_flags = re.IGNORECASE)
+
+    def find_anagrams(self, str_letters,) :
+        # Returns the sorted written forms, which consist of the same letters
+        # and digits (regardless of case) as the given ones, e.g. "listen" for
+        # "silent", by a single dictionary lookup.
+        arr_rows = self._dict_anagram_key_to_written_form_rows.get(anagram_key(str_letters))
+        if arr_rows is None :
+            return []
+        return [self._list_written_forms[int_row] for int_row in np.asarray(arr_rows).tolist()]
+
+    def find_written_forms_made_from(self, str_letters, int_min_length = 1,) :
+        # Returns the written forms, which can be made from the given letters
+        # and digits (regardless of case), each used at most once, and which
+        # have at least "int_min_length" of them, the longest first (the ties
+        # are sorted by the written forms). The counts of letters of all
+        # written forms are compared with the given ones at once, and only
+        # the written forms with other letters than "str_counted_letters" are
+        # checked on their own.
+        arr_query_counts = written_form_letter_counts(str_letters)
+        arr_counts = self._arr_written_forms_letter_counts
+        arr_lengths = arr_counts.sum(axis = 1, dtype = np.int32)
+        arr_rows = np.flatnonzero(
+            np.all(arr_counts <= arr_query_counts, axis = 1) &
+            (arr_lengths >= int_min_length))
+        arr_bool_other_letters = arr_counts[arr_rows, -1] > 0
+        if np.any(arr_bool_other_letters) :
+            counter_query_letters = collections.Counter(anagram_key(str_letters))
+            arr_bool_mask = ~arr_bool_other_letters
+            for int_index in np.flatnonzero(arr_bool_other_letters).tolist() :
+                counter_letters = collections.Counter(
+                    anagram_key(self._list_written_forms[int(arr_rows[int_index])]))
+                arr_bool_mask[int_index] = all(
+                    counter_query_letters[str_char] >= int_count
+                    for (str_char, int_count) in counter_letters.items())
+            arr_rows = arr_rows[arr_bool_mask]
+        return [
+            self._list_written_forms[int_row] for int_row in
+            arr_rows[np.argsort(-arr_lengths[arr_rows], kind = "stable")].tolist()]
+
+    def find_lexical_entries_by_pronunciation(self, str_pronunciation,) :
+        # Returns the lexical entries with the given pronunciation (IPA text),
+        # regardless of delimiters, stress and syllable marks, in the
+        # document order.
+        return [
+            self._list_lexical_entries[int_id] for int_id in
+            self._dict_pronunciation_to_lexical_entry_int_ids.get(
+                normalize_pronunciation(str_pronunciation), ())]
+
+    def rhymes(self, str_written_form, str_variety = None,) :
+        # Returns the sorted written forms of the lexical entries, which rhyme
+        # with the given written form (see "pronunciation_rhyme"), in the
+        # given variety of pronunciations (e.g. "GB"), or in the variety of
+        # each of its pronunciations. The rhyming pronunciations are found by
+        # two binary searches for the equal keys in the sorted rhyme keys per
+        # pronunciation.
+        lst_lexical_entries = self.find_lexical_entries(str_written_form)
+        if len(lst_lexical_entries) == 0 :
+            lst_lexical_entries = self.find_lexical_entries_by_normalized_form(str_written_form)
+        set_int_ids = set()
+        for lexical_entry_obj in lst_lexical_entries :
+            for pronunciation_obj in lexical_entry_obj.lemma.list_of_pronunciations :
+                if str_variety is not None and pronunciation_obj.variety != str_variety :
+                    continue
+                str_rhyme_key = rhyme_key(pronunciation_obj.text, pronunciation_obj.variety)
+                if str_rhyme_key is None :
+                    continue
+                int_start = bisect.bisect_left(self._list_rhyme_keys, str_rhyme_key)
+                int_end = bisect.bisect_right(self._list_rhyme_keys, str_rhyme_key)
+                set_int_ids.update(
+                    self._arr_rhyme_keys_lexical_entry_int_ids[int_start:int_end].tolist())
+        set_str_written_forms = {
+            self._list_lexical_entries[int_id].written_form for int_id in set_int_ids}
+        set_str_written_forms.difference_update(
+            lexical_entry_obj.written_form for lexical_entry_obj in lst_lexical_entries)
+        return sorted(set_str_written_forms)
+
+    def correct_written_form(self, str_written_form, int_max_count = 7,) :
+        # Returns up to "int_max_count" "(written form, Damerau-Levenshtein
+        # distance)" pairs within "INT_SYMMETRIC_DELETE_MAX_DISTANCE" edits
+        # of the given written form (regardless of case, hyphens, spaces and
+        # underscores), from the closest one, by a few hash probes only.
+        return [
+            (self._list_written_forms[int_row], int_distance)
+            for (int_row, int_distance) in self._symmetric_delete_index_of_written_forms.lookup(
+                str_written_form, int_max_count)]
+
+    def _find_written_forms_by_sound(self, str_written_form, int_max_count) :
+        # Returns up to "int_max_count" "(written form, distance between the
+        # vowel keys, Damerau-Levenshtein distance)" triples of the written
+        # forms with the same phonetic key, ranked by both distances.
+        str_phonetic_key = phonetic_key(str_written_form)
+        arr_rows = self._dict_phonetic_key_to_written_form_rows.get(str_phonetic_key)
+        if str_phonetic_key == "" or arr_rows is None or int_max_count < 1 :
+            return []
+        lst_str_candidates = [
+            self._list_written_forms[int_row] for int_row in np.asarray(arr_rows).tolist()]
+        arr_sound_distances = process.cdist(
+            [phonetic_vowels_key(str_written_form)],
+            [phonetic_vowels_key(str_candidate) for str_candidate in lst_str_candidates],
+            scorer = DamerauLevenshtein.distance, dtype = np.int32)[0]
+        arr_distances = process.cdist(
+            [str_written_form], lst_str_candidates,
+            scorer = DamerauLevenshtein.distance,
+            processor = normalize_written_form, dtype = np.int32)[0]
+        return [
+            (lst_str_candidates[int_index], int(arr_sound_distances[int_index]),
+             int(arr_distances[int_index]))
+            for int_index in np.lexsort(
+                (arr_distances, arr_sound_distances))[:int_max_count].tolist()]
+
+    def find_written_forms_by_sound(self, str_written_form, int_max_count = 7,) :
+        # Returns up to "int_max_count" "(written form, Damerau-Levenshtein
+        # distance)" pairs of the written forms with the same phonetic key as
+        # the given one, e.g. "night" for "nite", from the closest one by
+        # their vowel keys (see "phonetic_vowels_key"), and then by spelling.
+        return [
+            (str_form, int_distance) for (str_form, _, int_distance) in
+            self._find_written_forms_by_sound(str_written_form, int_max_count)]
+
+    def suggest_written_forms(self, str_written_form, int_max_count = 7,) :
+        # Merges the typo corrections (see "correct_written_form") and the
+        # sound-alike written forms (see "find_written_forms_by_sound"): the
+        # forms, which sound the same (i.e. with the same vowel keys too),
+        # come first, e.g. "phone" for "fone" and "night" for "nite", and the
+        # other sound-alike forms count as one edit closer than the forms,
+        # which are only spelled alike. Returns up to "int_max_count"
+        # "(written form, Damerau-Levenshtein distance)" pairs, from the best
+        # one.
+        dict_form_to_tpl_rank = {}
+        for (str_form, int_distance) in self.correct_written_form(
+                str_written_form, int_max_count) :
+            dict_form_to_tpl_rank[str_form] = (1, int_distance, str_form, int_distance)
+        for (str_form, int_sound_distance, int_distance) in self._find_written_forms_by_sound(
+                str_written_form, int_max_count) :
+            dict_form_to_tpl_rank[str_form] = (
+                0 if int_sound_distance == 0 else 1, int_distance - 1, str_form, int_distance)
+        return [
+            (str_form, int_distance) for (_, _, str_form, int_distance) in
+            sorted(dict_form_to_tpl_rank.values())[:int_max_count]]
+
+    def find_written_forms_by_ngrams(
+            self, str_written_form, int_max_count = 7, int_max_candidates_count = 100,) :
+        # Returns up to "int_max_count" "(written form, normalized
+        # Damerau-Levenshtein distance)" pairs, from the closest one, in two
+        # stages: the "int_max_candidates_count" forms (of the lemmas or the
+        # "Form" tags), which share the most n-grams with the given written
+        # form, are found in the inverted index, and only they are reranked
+        # by their distances between the normalized forms. Hence, the cost
+        # hardly depends on the size of the vocabulary.
+        lst_arr_rows = []
+        for str_ngram in written_form_ngrams(str_written_form) :
+            arr_rows = self._dict_ngram_to_indexed_form_rows.get(str_ngram)
+            if arr_rows is not None :
+                lst_arr_rows.append(np.asarray(arr_rows))
+        if int_max_count < 1 or len(lst_arr_rows) == 0 :
+            return []
+        (arr_rows, arr_counts) = np.unique(
+            np.concatenate(lst_arr_rows), return_counts = True)
+        if len(arr_rows) > int_max_candidates_count :
+            arr_rows = np.sort(arr_rows[np.argsort(
+                -arr_counts, kind = "stable")[:int_max_candidates_count]])
+        lst_str_candidates = [
+            self._list_ngram_indexed_forms[int_row] for int_row in arr_rows.tolist()]
+        arr_distances = process.cdist(
+            [str_written_form], lst_str_candidates,
+            scorer = DamerauLevenshtein.normalized_distance,
+            processor = normalize_written_form, dtype = np.float64)[0]
+        return [
+            (lst_str_candidates[int_index], float(arr_distances[int_index]))
+            for int_index in np.argsort(
+                arr_distances, kind = "stable")[:int_max_count].tolist()]
+
+    def _assign_int_ids(self,) :
+        # Every lexical entry, sense and synset gets a dense integer ID, which
+        # is its position in the lexicon's dictionary (i.e. in the document),
+        # and the relations' targets are resolved into these IDs. Hence, the
+        # string identifiers are only needed at the edges, e.g. for lookups
+        # by the chatbot's users.
+        self._list_lexical_entries = list(self._dict_lexical_entries.values())
+        self._list_senses = list(self._dict_senses.values())
+        self._list_synsets = list(self._dict_synsets.values())
+        for lst_entities in (
+                self._list_lexical_entries, self._list_senses, self._list_synsets,) :
+            for (int_id, entity_obj) in enumerate(lst_entities) :
+                entity_obj._int_id = int_id
+        dict_sense_int_ids = {
+            str_identifier : int_id for (int_id, str_identifier) in
+            enumerate(self._dict_senses.keys())}
+        lst_str_unknown_target_identifiers = []
+        for sense_obj in self._list_senses :
+            lst_str_unknown_target_identifiers.extend(
+                sense_obj._resolve_sense_relations(dict_sense_int_ids))
+        if len(lst_str_unknown_target_identifiers) > 0 :
+            warnings.warn(
+                'Skipped {0:d} "SenseRelation" tags with unknown "target" attributes, e.g. "{1}".'.format(
+                    len(lst_str_unknown_target_identifiers), lst_str_unknown_target_identifiers[0]))
+        dict_synset_int_ids = {
+            str_identifier : int_id for (int_id, str_identifier) in
+            enumerate(self._dict_synsets.keys())}
+        lst_str_unknown_target_identifiers = []
+        for synset_obj in self._list_synsets :
+            lst_str_unknown_target_identifiers.extend(
+                synset_obj._resolve_synset_relations(dict_synset_int_ids))
+        if len(lst_str_unknown_target_identifiers) > 0 :
+            warnings.warn(
+                'Skipped {0:d} "SynsetRelation" tags with unknown "target" attributes, e.g. "{1}".'.format(
+                    len(lst_str_unknown_target_identifiers), lst_str_unknown_target_identifiers[0]))
+
+    def _build_relation_graphs(self,) :
+        self._sense_relation_graph = RelationGraph.from_relations(
+            lst_tpl_target_int_ids = [
+                sense_obj.sense_relation_target_int_ids for sense_obj in self._list_senses],
+            lst_bytes_type_codes = [
+                sense_obj.sense_relation_type_codes for sense_obj in self._list_senses],
+            lst_relation_types = lst_sense_relation_types,
+            lst_bytes_subtype_codes = [
+                sense_obj.sense_relation_subtype_codes for sense_obj in self._list_senses],
+            lst_relation_subtypes = lst_sense_relation_subtypes)
+        self._synset_relation_graph = RelationGraph.from_relations(
+            lst_tpl_target_int_ids = [
+                synset_obj.synset_relation_target_int_ids for synset_obj in self._list_synsets],
+            lst_bytes_type_codes = [
+                synset_obj.synset_relation_type_codes for synset_obj in self._list_synsets],
+            lst_relation_types = lst_synset_relation_types)
+        # The incoming relations, e.g. the synsets having a given synset as
+        # their hypernym, are found in O(degree) rather than by a full scan.
+        self._sense_incoming_relation_graph = self._sense_relation_graph.transposed()
+        self._synset_incoming_relation_graph = self._synset_relation_graph.transposed()
+        self._hypernym_hierarchy = HypernymHierarchy.from_relation_graph(
+            self._synset_relation_graph)
+
+    def _build_lookup_indexes(self,) :
+        dict_written_form_to_lexical_entry_int_ids = {}
+        dict_normalized_form_to_lexical_entry_int_ids = {}
+        for lexical_entry_obj in self._list_lexical_entries :
+            str_written_form = lexical_entry_obj.written_form
+            if str_written_form in dict_written_form_to_lexical_entry_int_ids :
+                dict_written_form_to_lexical_entry_int_ids[str_written_form].append(
+                    lexical_entry_obj.int_id)
+            else :
+                dict_written_form_to_lexical_entry_int_ids[str_written_form] = [
+                    lexical_entry_obj.int_id]
+            for str_form in [str_written_form] + lexical_entry_obj.list_of_forms :
+                str_normalized_form = sys.intern(normalize_written_form(str_form))
+                if str_normalized_form in dict_normalized_form_to_lexical_entry_int_ids :
+                    lst_int_ids = dict_normalized_form_to_lexical_entry_int_ids[
+                        str_normalized_form]
+                    # An entry is listed once, even if several of its forms
+                    # have the same normalized form.
+                    if lst_int_ids[-1] != lexical_entry_obj.int_id :
+                        lst_int_ids.append(lexical_entry_obj.int_id)
+                else :
+                    dict_normalized_form_to_lexical_entry_int_ids[str_normalized_form] = [
+                        lexical_entry_obj.int_id]
+        self._dict_written_form_to_lexical_entry_int_ids = {
+            str_written_form : tuple(lst_int_ids) for (str_written_form, lst_int_ids) in
+            dict_written_form_to_lexical_entry_int_ids.items()}
+        self._list_written_forms = sorted(self._dict_written_form_to_lexical_entry_int_ids.keys())
+        self._arr_written_forms_sense_counts = np.array([
+            sum(len(self._list_lexical_entries[int_id].dictionary_of_senses)
+                for int_id in self._dict_written_form_to_lexical_entry_int_ids[str_written_form])
+            for str_written_form in self._list_written_forms], dtype = np.int32)
+        dict_anagram_key_to_written_form_rows = {}
+        for (int_row, str_written_form) in enumerate(self._list_written_forms) :
+            str_anagram_key = anagram_key(str_written_form)
+            if str_anagram_key in dict_anagram_key_to_written_form_rows :
+                dict_anagram_key_to_written_form_rows[str_anagram_key].append(int_row)
+            else :
+                dict_anagram_key_to_written_form_rows[str_anagram_key] = [int_row]
+        self._dict_anagram_key_to_written_form_rows = {
+            str_anagram_key : np.array(lst_int_rows, dtype = np.int32)
+            for (str_anagram_key, lst_int_rows) in
+            dict_anagram_key_to_written_form_rows.items()}
+        self._arr_written_forms_letter_counts = np.array(
+            [written_form_letter_counts(str_written_form)
+             for str_written_form in self._list_written_forms],
+            dtype = np.uint8).reshape(-1, len(str_counted_letters) + 1)
+        set_tpl_rhyme_keys_int_ids = set()
+        dict_pronunciation_to_lexical_entry_int_ids = {}
+        for lexical_entry_obj in self._list_lexical_entries :
+            for pronunciation_obj in lexical_entry_obj.lemma.list_of_pronunciations :
+                str_rhyme_key = rhyme_key(pronunciation_obj.text, pronunciation_obj.variety)
+                if str_rhyme_key is not None :
+                    set_tpl_rhyme_keys_int_ids.add((str_rhyme_key, lexical_entry_obj.int_id))
+                str_pronunciation = normalize_pronunciation(pronunciation_obj.text)
+                if str_pronunciation in dict_pronunciation_to_lexical_entry_int_ids :
+                    lst_int_ids = dict_pronunciation_to_lexical_entry_int_ids[str_pronunciation]
+                    if lst_int_ids[-1] != lexical_entry_obj.int_id :
+                        lst_int_ids.append(lexical_entry_obj.int_id)
+                else :
+                    dict_pronunciation_to_lexical_entry_int_ids[str_pronunciation] = [
+                        lexical_entry_obj.int_id]
+        lst_tpl_rhyme_keys_int_ids = sorted(set_tpl_rhyme_keys_int_ids)
+        self._list_rhyme_keys = [
+            str_rhyme_key for (str_rhyme_key, _) in lst_tpl_rhyme_keys_int_ids]
+        self._arr_rhyme_keys_lexical_entry_int_ids = np.array(
+            [int_id for (_, int_id) in lst_tpl_rhyme_keys_int_ids], dtype = np.int32)
+        self._dict_pronunciation_to_lexical_entry_int_ids = {
+            str_pronunciation : tuple(lst_int_ids) for (str_pronunciation, lst_int_ids) in
+            dict_pronunciation_to_lexical_entry_int_ids.items()}
+        self._str_written_forms_buffer = "".join(
+            str_written_form + "\n" for str_written_form in self._list_written_forms)
+        self._arr_written_forms_buffer_offsets = np.zeros(
+            len(self._list_written_forms) + 1, dtype = np.int32)
+        np.cumsum(
+            [len(str_written_form) + 1 for str_written_form in self._list_written_forms],
+            out = self._arr_written_forms_buffer_offsets[1:])
+        lst_tpl_autocomplete_keys_rows = sorted(
+            (normalize_written_form(str_written_form), int_row)
+            for (int_row, str_written_form) in enumerate(self._list_written_forms))
+        self._list_autocomplete_keys = [
+            sys.intern(str_key) for (str_key, _) in lst_tpl_autocomplete_keys_rows]
+        self._arr_autocomplete_written_form_rows = np.array(
+            [int_row for (_, int_row) in lst_tpl_autocomplete_keys_rows], dtype = np.int32)
+        self._symmetric_delete_index_of_written_forms = SymmetricDeleteIndex.from_words(
+            self._list_written_forms)
+        dict_phonetic_key_to_written_form_rows = {}
+        for (int_row, str_written_form) in enumerate(self._list_written_forms) :
+            str_phonetic_key = phonetic_key(str_written_form)
+            if str_phonetic_key in dict_phonetic_key_to_written_form_rows :
+                dict_phonetic_key_to_written_form_rows[str_phonetic_key].append(int_row)
+            else :
+                dict_phonetic_key_to_written_form_rows[str_phonetic_key] = [int_row]
+        self._dict_phonetic_key_to_written_form_rows = {
+            str_phonetic_key : np.array(lst_int_rows, dtype = np.int32)
+            for (str_phonetic_key, lst_int_rows) in
+            dict_phonetic_key_to_written_form_rows.items()}
+
+        set_indexed_forms = set(self._list_written_forms)
+        for lexical_entry_obj in self._list_lexical_entries :
+            set_indexed_forms.update(lexical_entry_obj.list_of_forms)
+        self._list_ngram_indexed_forms = sorted(set_indexed_forms)
+        dict_ngram_to_indexed_form_rows = {}
+        for (int_row, str_form) in enumerate(self._list_ngram_indexed_forms) :
+            for str_ngram in written_form_ngrams(str_form) :
+                if str_ngram in dict_ngram_to_indexed_form_rows :
+                    dict_ngram_to_indexed_form_rows[str_ngram].append(int_row)
+                else :
+                    dict_ngram_to_indexed_form_rows[str_ngram] = [int_row]
+        self._dict_ngram_to_indexed_form_rows = {
+            str_ngram : np.array(lst_int_rows, dtype = np.int32)
+            for (str_ngram, lst_int_rows) in dict_ngram_to_indexed_form_rows.items()}
+        self._dict_normalized_form_to_lexical_entry_int_ids = {
+            str_normalized_form : tuple(lst_int_ids) for (str_normalized_form, lst_int_ids) in
+            dict_normalized_form_to_lexical_entry_int_ids.items()}
+
+        dict_part_of_speech_to_lexical_entry_int_ids = {}
+        dict_lexical_file_category_to_lexical_entry_int_ids = {}
+        dict_part_of_speech_and_lexical_file_category_to_lexical_entry_int_ids = {}
+        for lexical_entry_obj in self._list_lexical_entries :
+            str_part_of_speech = lexical_entry_obj.part_of_speech
+            if str_part_of_speech in dict_part_of_speech_to_lexical_entry_int_ids :
+                dict_part_of_speech_to_lexical_entry_int_ids[str_part_of_speech].append(
+                    lexical_entry_obj.int_id)
+            else :
+                dict_part_of_speech_to_lexical_entry_int_ids[str_part_of_speech] = [
+                    lexical_entry_obj.int_id]
+            for sense_obj in lexical_entry_obj.dictionary_of_senses.values() :
+                str_lexical_file_category = self._dict_synsets[
+                    sense_obj.synset_identifier].lexical_file_category
+                if str_lexical_file_category in dict_lexical_file_category_to_lexical_entry_int_ids :
+                    lst_int_ids = dict_lexical_file_category_to_lexical_entry_int_ids[
+                        str_lexical_file_category]
+                    if lst_int_ids[-1] != lexical_entry_obj.int_id :
+                        lst_int_ids.append(lexical_entry_obj.int_id)
+                else :
+                    dict_lexical_file_category_to_lexical_entry_int_ids[
+                        str_lexical_file_category] = [lexical_entry_obj.int_id]
+                str_key = str_part_of_speech + "\x1f" + str_lexical_file_category
+                if str_key in dict_part_of_speech_and_lexical_file_category_to_lexical_entry_int_ids :
+                    lst_int_ids = dict_part_of_speech_and_lexical_file_category_to_lexical_entry_int_ids[
+                        str_key]
+                    if lst_int_ids[-1] != lexical_entry_obj.int_id :
+                        lst_int_ids.append(lexical_entry_obj.int_id)
+                else :
+                    dict_part_of_speech_and_lexical_file_category_to_lexical_entry_int_ids[
+                        str_key] = [lexical_entry_obj.int_id]
+        self._dict_part_of_speech_to_lexical_entry_int_ids = {
+            str_part_of_speech : np.array(lst_int_ids, dtype = np.int32)
+            for (str_part_of_speech, lst_int_ids) in
+            dict_part_of_speech_to_lexical_entry_int_ids.items()}
+        self._dict_lexical_file_category_to_lexical_entry_int_ids = {
+            str_lexical_file_category : np.array(lst_int_ids, dtype = np.int32)
+            for (str_lexical_file_category, lst_int_ids) in
+            dict_lexical_file_category_to_lexical_entry_int_ids.items()}
+        self._dict_part_of_speech_and_lexical_file_category_to_lexical_entry_int_ids = {
+            str_key : np.array(lst_int_ids, dtype = np.int32)
+            for (str_key, lst_int_ids) in
+            dict_part_of_speech_and_lexical_file_category_to_lexical_entry_int_ids.items()}
+
     def refresh_summary_counts(self,) :
         # bool_debug_traces = False
         self._dict_lemma_parts_of_speech_counts = {} # partOfSpeech
@@ -1183,7 +2296,7 @@ class Lexicon :
                         self._dict_syntactic_behaviour_types_counts[str_syntactic_behaviour_info] += 1
                     else :
                         self._dict_syntactic_behaviour_types_counts[str_syntactic_behaviour_info] = 1
-                for sense_relation_obj in sense_obj.dictionary_of_sense_relations.values() :
+                for sense_relation_obj in sense_obj.list_of_sense_relations :
                     str_sense_relation_type = sense_relation_obj.sense_relation_type
                     #if bool_debug_traces :
                     #    print("Sense Relation Type: " + str_sense_relation_type)
@@ -1225,7 +2338,7 @@ class Lexicon :
                 self._dict_synset_lexical_file_categories_counts[str_lexical_file_category] += 1
             else :
                 self._dict_synset_lexical_file_categories_counts[str_lexical_file_category] = 1
-            for synset_relation_obj in synset_obj.dictionary_of_synset_relations.values() :
+            for synset_relation_obj in synset_obj.list_of_synset_relations :
                 str_synset_relation_type = synset_relation_obj.synset_relation_type
                 if str_synset_relation_type in self._dict_synset_relation_types_counts :
                     self._dict_synset_relation_types_counts[str_synset_relation_type] += 1
@@ -1293,231 +2406,1696 @@ class Lexicon :
 
 
     def save_to_pickle(self, str_file_name) :
+        # The relation types are saved first, as in "save_to_lzma".
         with open(str_file_name + ".pickle", 'wb') as fp :
+            pickle.dump(relation_types_to_dict(), fp, pickle.HIGHEST_PROTOCOL)
             pickle.dump(self, fp, pickle.HIGHEST_PROTOCOL)
 
     def load_from_pickle(str_file_name) :
         with open(str_file_name + ".pickle", 'rb') as fp:
+            register_relation_types(pickle.load(fp))
             return pickle.load(fp)
 
     def save_to_lzma(self, str_file_path, str_file_name) :
         # https://stackoverflow.com/questions/57983431/
         # whats-the-most-space-efficient-way-to-compress-serialized-python-data
+        # The relation types are saved first, so that their codes are known,
+        # before the lexicon is loaded.
         with lzma.open(os.path.join(str_file_path, str_file_name + ".xz"), 'wb') as fp :
+            pickle.dump(relation_types_to_dict(), fp, pickle.HIGHEST_PROTOCOL)
             pickle.dump(self, fp, pickle.HIGHEST_PROTOCOL)
 
     def load_from_lzma(str_file_path, str_file_name) :
         with lzma.open(os.path.join(str_file_path, str_file_name + ".xz"), 'rb') as fp:
+            register_relation_types(pickle.load(fp))
             return pickle.load(fp)
 
-    def load_from_xml(str_file_path, str_file_name) :
+    def save_to_mmap(self, str_file_path, str_file_name) :
+        _write_mmap_sections_file(
+            str_file_path = os.path.join(
+                str_file_path, str_file_name + FILE_EXT_DATA_MMAP_WORDNET),
+            dict_header = {
+                "identifier" : self._str_identifier,
+                "summary_counts" : self._summary_counts_to_dict(),
+                "relation_types" : relation_types_to_dict(),},
+            dict_sections = self._to_mmap_sections())
+
+    def load_from_mmap(str_file_path, str_file_name) :
+        return MappedLexicon(os.path.join(
+            str_file_path, str_file_name + FILE_EXT_DATA_MMAP_WORDNET))
+
+    def _summary_counts_to_dict(self,) :
+        return {
+            "syntactic_behaviour_types" : self._dict_syntactic_behaviour_types_counts,
+            "sense_relation_types" : self._dict_sense_relation_types_counts,
+            "sense_relation_subtypes" : self._dict_sense_relation_subtypes_counts,
+            "lemma_parts_of_speech" : self._dict_lemma_parts_of_speech_counts,
+            "synset_parts_of_speech" : self._dict_synset_parts_of_speech_counts,
+            "synset_lexical_file_categories" : self._dict_synset_lexical_file_categories_counts,
+            "synset_relation_types" : self._dict_synset_relation_types_counts,}
+
+    def _to_mmap_sections(self,) :
+        # Every entity type is stored as a set of flat columns, where the row
+        # of an entity is its integer ID, if it has one. The
+        # variable-length lists of an entity are stored as CSR-like pairs of
+        # "indptr" (list boundaries per row) and flat values columns.
+        dict_lexical_entry_rows = {
+            str_identifier : int_row for (int_row, str_identifier) in
+            enumerate(self._dict_lexical_entries.keys())}
+        dict_synset_rows = {
+            str_identifier : int_row for (int_row, str_identifier) in
+            enumerate(self._dict_synsets.keys())}
+        dict_sections = {}
+
+        lst_identifiers = list(self._dict_lexical_entries.keys())
+        dict_sections["lexical_entry.identifier"] = lst_identifiers
+        dict_sections["lexical_entry.identifier.sorted_rows"] = array.array(
+            'i', sorted(range(len(lst_identifiers)), key = lst_identifiers.__getitem__))
+        dict_sections["lexical_entry.written_form"] = [
+            le.written_form for le in self._dict_lexical_entries.values()]
+        dict_sections["lexical_entry.part_of_speech"] = [
+            le.part_of_speech for le in self._dict_lexical_entries.values()]
+        _add_mmap_csr_sections(
+            dict_sections, "lexical_entry.senses", [
+                [sense_obj.int_id for sense_obj in le.dictionary_of_senses.values()]
+                for le in self._dict_lexical_entries.values()], "int")
+        _add_mmap_csr_sections(
+            dict_sections, "lexical_entry.forms", [
+                le.list_of_forms
+                for le in self._dict_lexical_entries.values()], "str")
+        _add_mmap_csr_sections(
+            dict_sections, "lexical_entry.pronunciations", [
+                [pronunciation_obj.text for pronunciation_obj in
+                 le.lemma.list_of_pronunciations]
+                for le in self._dict_lexical_entries.values()], "str")
+        # A missing variety is stored as an empty string.
+        dict_sections["lexical_entry.pronunciations.variety"] = [
+            "" if pronunciation_obj.variety is None else pronunciation_obj.variety
+            for le in self._dict_lexical_entries.values()
+            for pronunciation_obj in le.lemma.list_of_pronunciations]
+
+        lst_identifiers = list(self._dict_senses.keys())
+        dict_sections["sense.identifier"] = lst_identifiers
+        dict_sections["sense.identifier.sorted_rows"] = array.array(
+            'i', sorted(range(len(lst_identifiers)), key = lst_identifiers.__getitem__))
+        dict_sections["sense.synset_row"] = array.array('i', [
+            dict_synset_rows[sense_obj.synset_identifier]
+            for sense_obj in self._dict_senses.values()])
+        _add_mmap_csr_sections(
+            dict_sections, "sense.syntactic_behaviours", [
+                sense_obj.list_of_syntactic_behaviour_identifiers
+                for sense_obj in self._dict_senses.values()], "str")
+        # The relation graphs' arrays are the CSR sections of relations.
+        _add_mmap_relation_graph_sections(
+            dict_sections, "sense.relations", self._sense_relation_graph)
+        _add_mmap_relation_graph_sections(
+            dict_sections, "sense.incoming_relations",
+            self._sense_incoming_relation_graph)
+
+        lst_identifiers = list(self._dict_synsets.keys())
+        dict_sections["synset.identifier"] = lst_identifiers
+        dict_sections["synset.identifier.sorted_rows"] = array.array(
+            'i', sorted(range(len(lst_identifiers)), key = lst_identifiers.__getitem__))
+        dict_sections["synset.part_of_speech"] = [
+            synset_obj.part_of_speech for synset_obj in self._dict_synsets.values()]
+        dict_sections["synset.lexical_file_category"] = [
+            synset_obj.lexical_file_category for synset_obj in self._dict_synsets.values()]
+        _add_mmap_csr_sections(
+            dict_sections, "synset.members", [
+                [dict_lexical_entry_rows[str_lexical_entry_identifier]
+                 for str_lexical_entry_identifier in
+                 synset_obj.list_of_lexical_entries_identifiers]
+                for synset_obj in self._dict_synsets.values()], "int")
+        _add_mmap_csr_sections(
+            dict_sections, "synset.definitions", [
+                synset_obj.list_of_definitions
+                for synset_obj in self._dict_synsets.values()], "str")
+        _add_mmap_csr_sections(
+            dict_sections, "synset.examples", [
+                synset_obj.list_of_examples
+                for synset_obj in self._dict_synsets.values()], "str")
+        _add_mmap_relation_graph_sections(
+            dict_sections, "synset.relations", self._synset_relation_graph)
+        _add_mmap_relation_graph_sections(
+            dict_sections, "synset.incoming_relations",
+            self._synset_incoming_relation_graph)
+        _add_mmap_hypernym_hierarchy_sections(
+            dict_sections, "synset.hypernym_hierarchy", self._hypernym_hierarchy)
+
+        _add_mmap_string_index_sections(
+            dict_sections, "index.written_form",
+            self._dict_written_form_to_lexical_entry_int_ids)
+        _add_mmap_string_index_sections(
+            dict_sections, "index.normalized_form",
+            self._dict_normalized_form_to_lexical_entry_int_ids)
+        dict_sections["index.written_form.sense_count"] = array.array(
+            'i', self._arr_written_forms_sense_counts.tobytes())
+        _add_mmap_string_index_sections(
+            dict_sections, "index.written_form.anagram_key",
+            self._dict_anagram_key_to_written_form_rows)
+        dict_sections["index.written_form.letter_counts"] = array.array(
+            'B', self._arr_written_forms_letter_counts.tobytes())
+        dict_sections["index.rhyme.keys"] = self._list_rhyme_keys
+        dict_sections["index.rhyme"] = array.array(
+            'i', self._arr_rhyme_keys_lexical_entry_int_ids.tobytes())
+        _add_mmap_string_index_sections(
+            dict_sections, "index.pronunciation",
+            self._dict_pronunciation_to_lexical_entry_int_ids)
+        dict_sections["index.written_form.buffer"] = [self._str_written_forms_buffer]
+        dict_sections["index.written_form.buffer.offsets"] = array.array(
+            'i', self._arr_written_forms_buffer_offsets.tobytes())
+        dict_sections["index.autocomplete.keys"] = self._list_autocomplete_keys
+        dict_sections["index.autocomplete"] = array.array(
+            'i', self._arr_autocomplete_written_form_rows.tobytes())
+        _add_mmap_symmetric_delete_index_sections(
+            dict_sections, "index.written_form.symmetric_delete",
+            self._symmetric_delete_index_of_written_forms)
+        _add_mmap_string_index_sections(
+            dict_sections, "index.written_form.phonetic_key",
+            self._dict_phonetic_key_to_written_form_rows)
+        dict_sections["index.ngram.forms"] = self._list_ngram_indexed_forms
+        _add_mmap_string_index_sections(
+            dict_sections, "index.ngram", self._dict_ngram_to_indexed_form_rows)
+        _add_mmap_string_index_sections(
+            dict_sections, "index.part_of_speech",
+            self._dict_part_of_speech_to_lexical_entry_int_ids)
+        _add_mmap_string_index_sections(
+            dict_sections, "index.lexical_file_category",
+            self._dict_lexical_file_category_to_lexical_entry_int_ids)
+        _add_mmap_string_index_sections(
+            dict_sections, "index.part_of_speech.lexical_file_category",
+            self._dict_part_of_speech_and_lexical_file_category_to_lexical_entry_int_ids)
+
+        lst_identifiers = list(self._dict_syntactic_behaviours.keys())
+        dict_sections["syntactic_behaviour.identifier"] = lst_identifiers
+        dict_sections["syntactic_behaviour.identifier.sorted_rows"] = array.array(
+            'i', sorted(range(len(lst_identifiers)), key = lst_identifiers.__getitem__))
+        dict_sections["syntactic_behaviour.subcategorization_frame"] = [
+            syntactic_behaviour_obj.subcategorization_frame
+            for syntactic_behaviour_obj in self._dict_syntactic_behaviours.values()]
+        return dict_sections
+
+    def load_from_xml(
+            str_file_path, str_file_name, str_file_extension = ".xml",
+            bool_print_throughput = False) :
+
+        # A compressed document (".xml.gz" or ".xml.xz") is decompressed
+        # incrementally, while it is being parsed, without any temporary file.
+        flt_start_time = time.perf_counter()
+        (fp_raw, fp_compressed, fp_xml) = Lexicon._open_xml_file(
+            str_file_path, str_file_name, str_file_extension)
+        with fp_raw :
+            lexicon = Lexicon._load_from_xml_stream(fp_xml)
+        lexicon._assign_int_ids()
+        lexicon._build_relation_graphs()
+        lexicon._build_lookup_indexes()
+        lexicon.refresh_summary_counts()
+        if bool_print_throughput :
+            Lexicon._print_xml_throughput(
+                fp_xml.bytes_read,
+                None if fp_xml is fp_compressed else fp_compressed.bytes_read,
+                time.perf_counter() - flt_start_time)
+        return lexicon
 
-        tree = ET.parse(os.path.join(str_file_path, str_file_name + ".xml"))
-        xml_elem_LexicalResource = tree.getroot()
+    def load_from_xml_in_parallel(
+            str_file_path, str_file_name, str_file_extension = ".xml",
+            int_processes = None, bool_print_throughput = False) :
+
+        # The decompressed document is split into byte-range shards before the
+        # "LexicalEntry" and "Synset" tags at depth 2 (i.e. the children of
+        # the "Lexicon" tag). Every process of the pool reads its own byte
+        # range from the file, and wraps it into the original document's
+        # header and footer, so that it is a valid document on its own. The
+        # partial lexicons are merged in the document order, so the result is
+        # identical to "load_from_xml". A compressed document is decompressed
+        # incrementally into a temporary file, so that neither the process
+        # nor the pool ever holds the whole document in memory. Only the
+        # first "Lexicon" tag of the document is expected (as in the
+        # releases).
+        flt_start_time = time.perf_counter()
+        if int_processes is None :
+            int_processes = os.cpu_count() or 1
+        (fp_raw, fp_compressed, fp_xml) = Lexicon._open_xml_file(
+            str_file_path, str_file_name, str_file_extension)
+        str_temp_xml_file_path = None
+        with fp_raw :
+            if fp_xml is fp_compressed :
+                str_xml_file_path = fp_raw.name
+            else :
+                with tempfile.NamedTemporaryFile(
+                        suffix = ".xml", delete = False) as fp_temp_xml :
+                    str_temp_xml_file_path = fp_temp_xml.name
+                    shutil.copyfileobj(fp_xml, fp_temp_xml)
+                str_xml_file_path = str_temp_xml_file_path
+        try :
+            with open(str_xml_file_path, 'rb') as fp_xml_file :
+                with mmap.mmap(fp_xml_file.fileno(), 0, access = mmap.ACCESS_READ) as mm_xml :
+                    int_xml_bytes = len(mm_xml)
+                    (bytes_header, lst_int_cuts) = Lexicon._split_xml_into_shards(
+                        buffer_xml = mm_xml,
+                        int_shards_count = int_processes * INT_XML_SHARDS_PER_PROCESS)
+            int_shards_count = len(lst_int_cuts) - 1
+            lexicon = None
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers = int_processes) as executor :
+                for partial_lexicon in executor.map(
+                        _load_lexicon_from_xml_shard,
+                        [str_xml_file_path] * int_shards_count,
+                        [bytes_header] * int_shards_count,
+                        lst_int_cuts[:-1], lst_int_cuts[1:],
+                        [int_shard_index == 0 for int_shard_index in
+                         range(int_shards_count)]) :
+                    if lexicon is None :
+                        lexicon = Lexicon(str_identifier = partial_lexicon.identifier)
+                    lexicon._merge(partial_lexicon)
+        finally :
+            if str_temp_xml_file_path is not None :
+                os.remove(str_temp_xml_file_path)
+        lexicon._assign_int_ids()
+        lexicon._build_relation_graphs()
+        lexicon._build_lookup_indexes()
+        lexicon.refresh_summary_counts()
+        if bool_print_throughput :
+            Lexicon._print_xml_throughput(
+                int_xml_bytes,
+                None if fp_xml is fp_compressed else fp_compressed.bytes_read,
+                time.perf_counter() - flt_start_time)
+        return lexicon
 
-        # tag, attrib, text
-        if xml_elem_LexicalResource.tag != "LexicalResource" :
+    def _open_xml_file(str_file_path, str_file_name, str_file_extension) :
+        fp_raw = open(os.path.join(
+            str_file_path, str_file_name + str_file_extension), 'rb')
+        fp_compressed = _ByteCountingReader(fp_raw)
+        if str_file_extension.endswith(".gz") :
+            fp_xml = _ByteCountingReader(gzip.GzipFile(fileobj = fp_compressed))
+        elif str_file_extension.endswith(".xz") :
+            fp_xml = _ByteCountingReader(lzma.LZMAFile(fp_compressed))
+        else :
+            fp_xml = fp_compressed
+        return (fp_raw, fp_compressed, fp_xml)
+
+    def _print_xml_throughput(
+            int_xml_bytes, int_compressed_bytes, flt_elapsed_seconds) :
+        flt_xml_mb = int_xml_bytes / 1e6
+        print("Parsed {:.1f} MB of XML{:s} in {:.1f} s: {:.1f} MB/s.".format(
+            flt_xml_mb,
+            "" if int_compressed_bytes is None else
+            " (decompressed from {:.1f} MB)".format(int_compressed_bytes / 1e6),
+            flt_elapsed_seconds,
+            flt_xml_mb / flt_elapsed_seconds if flt_elapsed_seconds > 0. else 0.))
+
+    def _split_xml_into_shards(buffer_xml, int_shards_count) :
+        # Returns the document's header (up to the first child of the
+        # "Lexicon" tag) and the byte offsets of the shards' boundaries. Only
+        # the header is tokenized: the "k"-th cut is found by seeking to
+        # "k / int_shards_count" of the body, and by searching forward for
+        # the next "LexicalEntry" or "Synset" start tag. These tags are
+        # children of the "Lexicon" tag only (they are not nested, unlike
+        # "SyntacticBehaviour" tags in WN-LMF 1.1+), and "<" cannot be
+        # unescaped in attribute values or in text, so a match is a cut
+        # unless it is in a comment, a CDATA section or a processing
+        # instruction.
+        int_depth = 0
+        int_body_start = -1
+        for match_token in re_xml_markup_token.finditer(buffer_xml) :
+            int_token_start = match_token.start()
+            if buffer_xml[int_token_start + 1] in b"!?" :
+                continue
+            if buffer_xml[int_token_start + 1] == 0x2F : # "</"
+                int_depth -= 1
+                if int_depth < 2 :
+                    break
+                continue
+            if int_depth == 2 :
+                int_body_start = int_token_start
+                break
+            if buffer_xml[match_token.end() - 2] != 0x2F : # not "/>"
+                int_depth += 1
+        if int_body_start < 0 :
             raise TypeError(
-                'Error: expecting "LexicalResource" type tag.')
-        # <LexicalResource xmlns:dc="https://globalwordnet.github.io/schemas/dc/">
-        str_dc_type = "{https://globalwordnet.github.io/schemas/dc/}type" # "dc:type"
-        xml_elem_Lexicon = xml_elem_LexicalResource[0]
-        if xml_elem_Lexicon.tag != "Lexicon" :
+                'Error: expecting at least one "LexicalEntry" tag in "Lexicon" tag.')
+        int_body_end = buffer_xml.rfind(b"</Lexicon>")
+        if int_body_end < int_body_start :
             raise TypeError('Error: expecting "Lexicon" type tag.')
-        if not "id" in xml_elem_Lexicon.attrib :
-            raise TypeError(
-                'Error: expecting "id" attribute in "Lexicon" tag.')
-        lexicon = Lexicon(str_identifier = xml_elem_Lexicon.attrib["id"])
-
-        bool_Lexicon_has_LexicalEntry = False
-        for xml_elem_Lexicon_child in xml_elem_Lexicon :
-            str_Lexicon_child_tag = xml_elem_Lexicon_child.tag
+        lst_int_cuts = [int_body_start]
+        int_shard_size = (int_body_end - int_body_start) / max(1, int_shards_count)
+        for int_shard_index in range(1, int_shards_count) :
+            int_cut = Lexicon._find_xml_shard_cut(
+                buffer_xml, lst_int_cuts[-1],
+                max(lst_int_cuts[-1] + 1,
+                    int_body_start + int(int_shard_index * int_shard_size)),
+                int_body_end)
+            if int_cut < 0 :
+                break
+            lst_int_cuts.append(int_cut)
+        lst_int_cuts.append(int_body_end)
+        return (bytes(buffer_xml[:int_body_start]), lst_int_cuts)
+
+    def _find_xml_shard_cut(buffer_xml, int_previous_cut, int_position, int_body_end) :
+        # The previous cut is out of any comment, CDATA section or processing
+        # instruction, so a match is in one of them only if the last opening
+        # delimiter since the previous cut is not closed before the match.
+        while True :
+            match_tag = re_xml_shard_start_tag.search(
+                buffer_xml, int_position, int_body_end)
+            if match_tag is None :
+                return -1
+            int_position = match_tag.start()
+            for (bytes_opening, bytes_closing) in (
+                    (b"<!--", b"-->"), (b"<![CDATA[", b"]]>"), (b"<?", b"?>"),) :
+                int_opening = buffer_xml.rfind(
+                    bytes_opening, int_previous_cut, int_position)
+                if int_opening >= 0 and buffer_xml.find(
+                        bytes_closing, int_opening + len(bytes_opening),
+                        int_position) < 0 :
+                    break
+            else :
+                return int_position
+            int_position += 1
+
+    def _merge(self, other_lexicon) :
+        # Dictionaries keep the insertion order, so merging partial lexicons
+        # in the document order reproduces the order of the serial loading.
+        # The keys are interned, like the identifiers of the unpickled domain
+        # objects, so that every identifier is stored once across shards.
+        for (dict_self, dict_other) in (
+                (self._dict_lexical_entries, other_lexicon._dict_lexical_entries),
+                (self._dict_senses, other_lexicon._dict_senses),
+                (self._dict_synsets, other_lexicon._dict_synsets),
+                (self._dict_syntactic_behaviours,
+                 other_lexicon._dict_syntactic_behaviours),) :
+            for (str_identifier, entity_obj) in dict_other.items() :
+                dict_self[sys.intern(str_identifier)] = entity_obj
+
+    def _load_from_xml_stream(fp_xml, bool_expect_lexical_entry_first = True) :
+
+        # The document is parsed as a stream of "start"/"end" events, rather
+        # than as a whole tree: every child of the "Lexicon" tag is converted
+        # into domain objects as soon as its end tag is read, and then it is
+        # cleared. Hence, the peak memory is bounded by the largest single
+        # "LexicalEntry" or "Synset" tag instead of the whole document.
+        lexicon = None
+        xml_elem_Lexicon = None
+        bool_Lexicon_has_LexicalEntry = not bool_expect_lexical_entry_first
+        int_depth = 0
+        for (str_event, xml_elem) in ET.iterparse(
+                fp_xml, events = ("start", "end")) :
+            if str_event == "start" :
+                int_depth += 1
+                # tag, attrib, text
+                if int_depth == 1 :
+                    if xml_elem.tag != "LexicalResource" :
+                        raise TypeError(
+                            'Error: expecting "LexicalResource" type tag.')
+                elif int_depth == 2 and lexicon is None :
+                    xml_elem_Lexicon = xml_elem
+                    if xml_elem_Lexicon.tag != "Lexicon" :
+                        raise TypeError('Error: expecting "Lexicon" type tag.')
+                    if not "id" in xml_elem_Lexicon.attrib :
+                        raise TypeError(
+                            'Error: expecting "id" attribute in "Lexicon" tag.')
+                    lexicon = Lexicon(str_identifier = xml_elem_Lexicon.attrib["id"])
+                continue
+            int_depth -= 1
+            if xml_elem is xml_elem_Lexicon :
+                # Only the first "Lexicon" tag is loaded.
+                xml_elem_Lexicon = None
+            if int_depth != 2 or xml_elem_Lexicon is None :
+                continue
+            str_Lexicon_child_tag = xml_elem.tag
             if str_Lexicon_child_tag == "LexicalEntry" :
-                xml_elem_LexicalEntry = xml_elem_Lexicon_child
-                if not "id" in xml_elem_LexicalEntry.attrib :
-                    raise TypeError(
-                        'Error: expecting "id" attribute in "LexicalEntry" tag.')
-                str_Lemma_written_form = None
-                str_Lemma_part_of_speech = None
-                bool_LexicalEntry_has_one_Lemma = False
-                lst_Forms = []
-                lst_Senses = []
-                lst_Pronunciations = []
-                for xml_elem_LexicalEntry_child in xml_elem_LexicalEntry :
-                    str_LexicalEntry_child_tag = xml_elem_LexicalEntry_child.tag
-                    if str_LexicalEntry_child_tag == "Lemma" :
-                        xml_elem_Lemma = xml_elem_LexicalEntry_child
-                        if bool_LexicalEntry_has_one_Lemma :
-                            raise ValueError(
-                                'Error: expecting only one "Lemma" tag in "LexicalEntry".')
-                        if not "writtenForm" in xml_elem_Lemma.attrib :
-                            raise TypeError(
-                                'Error: expecting "writtenForm" attribute in "Lemma" tag.')
-                        if not "partOfSpeech" in xml_elem_Lemma.attrib :
-                            raise TypeError(
-                                'Error: expecting "partOfSpeech" attribute in "Lemma" tag.')
-                        str_Lemma_written_form = xml_elem_Lemma.attrib["writtenForm"]
-                        str_Lemma_part_of_speech = xml_elem_Lemma.attrib["partOfSpeech"]
-                        bool_LexicalEntry_has_one_Lemma = True
-                        for xml_elem_Lemma_child in xml_elem_Lemma :
-                            str_Lemma_child_tag = xml_elem_Lemma_child.tag
-                            if str_Lemma_child_tag == "Pronunciation" :
-                                xml_elem_Pronunciation = xml_elem_Lemma_child
-                                if "variety" in xml_elem_Pronunciation.attrib :
-                                    str_variety = xml_elem_Pronunciation.attrib["variety"]
-                                else :
-                                    str_variety = None
-                                pronunciation_obj = Pronunciation(
-                                    str_text = xml_elem_Pronunciation.text,
-                                    str_variety = str_variety,)
-                                lst_Pronunciations.append(pronunciation_obj)
-                    elif str_LexicalEntry_child_tag == "Form" :
-                        xml_elem_Form = xml_elem_LexicalEntry_child
-                        if not "writtenForm" in xml_elem_Form.attrib :
-                            raise TypeError(
-                                'Error: expecting "writtenForm" attribute in "Form" tag.')
-                        str_Form_written_form = xml_elem_Form.attrib["writtenForm"]
-                        form_obj = Form(str_written_form = str_Form_written_form)
-                        lst_Forms.append(form_obj)
-                    elif str_LexicalEntry_child_tag == "Sense" :
-                        xml_elem_Sense = xml_elem_LexicalEntry_child
-                        if not "id" in xml_elem_Sense.attrib :
-                            raise TypeError(
-                                'Error: expecting "id" attribute in "Sense" tag.')
-                        if not "synset" in xml_elem_Sense.attrib :
-                            raise TypeError(
-                                'Error: expecting "synset" attribute in "Sense" tag.')
-                        sense_obj = Sense(
-                            str_identifier = xml_elem_Sense.attrib["id"],
-                            str_synset_identifier = xml_elem_Sense.attrib["synset"],)
-                        for xml_elem_Sense_child in xml_elem_Sense :
-                            str_Sense_child_tag = xml_elem_Sense_child.tag
-                            if str_Sense_child_tag == "SenseRelation" :
-                                xml_elem_SenseRelation = xml_elem_Sense_child
-                                if not "target" in xml_elem_SenseRelation.attrib :
-                                    raise TypeError(
-                                        'Error: expecting "target" attribute in "SenseRelation" tag.')
-                                if not "relType" in xml_elem_SenseRelation.attrib :
-                                    raise TypeError(
-                                        'Error: expecting "relType" attribute in "SenseRelation" tag.')
-                                if str_dc_type in xml_elem_SenseRelation.attrib :
-                                    str_sense_relation_subtype = xml_elem_SenseRelation.attrib[str_dc_type]
-                                else :
-                                    str_sense_relation_subtype = "<empty>"
-                                sense_relation_obj = SenseRelation(
-                                    str_source_sense_identifier = sense_obj.identifier,
-                                    str_target_sense_identifier = xml_elem_SenseRelation.attrib["target"],
-                                    str_sense_relation_type = xml_elem_SenseRelation.attrib["relType"],
-                                    str_sense_relation_subtype = str_sense_relation_subtype)
-                                sense_obj.add_sense_relation(sense_relation_obj)
-                        if "subcat" in xml_elem_Sense.attrib :
-                            lst_str_syntactic_behaviour_identifiers = \
-                                xml_elem_Sense.attrib["subcat"].split()
-                            for str_syntactic_behaviour_identifier in lst_str_syntactic_behaviour_identifiers :
-                                sense_obj.add_syntactic_behaviour(
-                                    str_syntactic_behaviour_identifier = str_syntactic_behaviour_identifier)
-                        lst_Senses.append(sense_obj)
-                if not bool_LexicalEntry_has_one_Lemma :
-                    raise ValueError(
-                        'Error: expecting one and only one "Lemma" tag in "LexicalEntry".')
-                lexical_entry_obj = LexicalEntry(
-                    str_identifier = xml_elem_LexicalEntry.attrib["id"],
-                    str_written_form = str_Lemma_written_form,
-                    str_part_of_speech = str_Lemma_part_of_speech)
-                for pronunciation_obj in lst_Pronunciations :
-                    lexical_entry_obj.lemma.add_pronunciation(
-                        pronunciation_obj = pronunciation_obj)
-                for form_obj in lst_Forms :
-                    lexical_entry_obj.add_form(form_obj = form_obj)
-                for sense_obj in lst_Senses :
-                    lexical_entry_obj.add_sense(sense_obj = sense_obj)
-                    lexicon.add_sense(sense_obj = sense_obj)
-                lexicon.add_lexical_entry(lexical_entry_obj = lexical_entry_obj)
+                lexicon._add_lexical_entry_from_xml(xml_elem)
                 bool_Lexicon_has_LexicalEntry = True
             elif str_Lexicon_child_tag == "Synset" :
-                xml_elem_Synset = xml_elem_Lexicon_child
-                if not "id" in xml_elem_Synset.attrib :
+                lexicon._add_synset_from_xml(xml_elem)
+            elif str_Lexicon_child_tag == "SyntacticBehaviour" :
+                lexicon._add_syntactic_behaviour_from_xml(xml_elem)
+
+            if not bool_Lexicon_has_LexicalEntry :
+                raise TypeError(
+                    'Error: expecting at least one "LexicalEntry" tag in "Lexicon" tag.')
+            # The child is fully converted: drop it from the "Lexicon" tag.
+            xml_elem_Lexicon.clear()
+        if lexicon is None :
+            raise TypeError('Error: expecting "Lexicon" type tag.')
+        return lexicon
+
+    def _add_lexical_entry_from_xml(self, xml_elem_LexicalEntry) :
+        if not "id" in xml_elem_LexicalEntry.attrib :
+            raise TypeError(
+                'Error: expecting "id" attribute in "LexicalEntry" tag.')
+        str_Lemma_written_form = None
+        str_Lemma_part_of_speech = None
+        bool_LexicalEntry_has_one_Lemma = False
+        lst_Forms = []
+        lst_Senses = []
+        lst_Pronunciations = []
+        for xml_elem_LexicalEntry_child in xml_elem_LexicalEntry :
+            str_LexicalEntry_child_tag = xml_elem_LexicalEntry_child.tag
+            if str_LexicalEntry_child_tag == "Lemma" :
+                xml_elem_Lemma = xml_elem_LexicalEntry_child
+                if bool_LexicalEntry_has_one_Lemma :
+                    raise ValueError(
+                        'Error: expecting only one "Lemma" tag in "LexicalEntry".')
+                if not "writtenForm" in xml_elem_Lemma.attrib :
                     raise TypeError(
-                        'Error: expecting "id" attribute in "Synset" tag.')
-                if not "partOfSpeech" in xml_elem_Synset.attrib :
+                        'Error: expecting "writtenForm" attribute in "Lemma" tag.')
+                if not "partOfSpeech" in xml_elem_Lemma.attrib :
                     raise TypeError(
-                        'Error: expecting "partOfSpeech" attribute in "Synset" tag.')
-                if not "lexfile" in xml_elem_Synset.attrib :
+                        'Error: expecting "partOfSpeech" attribute in "Lemma" tag.')
+                str_Lemma_written_form = xml_elem_Lemma.attrib["writtenForm"]
+                str_Lemma_part_of_speech = xml_elem_Lemma.attrib["partOfSpeech"]
+                bool_LexicalEntry_has_one_Lemma = True
+                for xml_elem_Lemma_child in xml_elem_Lemma :
+                    str_Lemma_child_tag = xml_elem_Lemma_child.tag
+                    if str_Lemma_child_tag == "Pronunciation" :
+                        xml_elem_Pronunciation = xml_elem_Lemma_child
+                        if "variety" in xml_elem_Pronunciation.attrib :
+                            str_variety = xml_elem_Pronunciation.attrib["variety"]
+                        else :
+                            str_variety = None
+                        pronunciation_obj = Pronunciation(
+                            str_text = xml_elem_Pronunciation.text,
+                            str_variety = str_variety,)
+                        lst_Pronunciations.append(pronunciation_obj)
+            elif str_LexicalEntry_child_tag == "Form" :
+                xml_elem_Form = xml_elem_LexicalEntry_child
+                if not "writtenForm" in xml_elem_Form.attrib :
                     raise TypeError(
-                        'Error: expecting "lexfile" attribute in "Synset" tag.')
-                if not "members" in xml_elem_Synset.attrib :
+                        'Error: expecting "writtenForm" attribute in "Form" tag.')
+                str_Form_written_form = xml_elem_Form.attrib["writtenForm"]
+                lst_Forms.append(str_Form_written_form)
+            elif str_LexicalEntry_child_tag == "Sense" :
+                xml_elem_Sense = xml_elem_LexicalEntry_child
+                if not "id" in xml_elem_Sense.attrib :
                     raise TypeError(
-                        'Error: expecting "members" attribute in "Synset" tag.')
-                synset_obj = Synset(
-                    str_identifier = xml_elem_Synset.attrib["id"],
-                    str_part_of_speech = xml_elem_Synset.attrib["partOfSpeech"],
-                    str_lexical_file_category = xml_elem_Synset.attrib["lexfile"])
-                lst_str_lexical_entries_identifiers = \
-                    xml_elem_Synset.attrib["members"].split()
-                for str_lexical_entry_identifier in lst_str_lexical_entries_identifiers :
-                    synset_obj.add_lexical_entry_identifier(
-                        str_lexical_entry_identifier = str_lexical_entry_identifier)
-                for xml_elem_Synset_child in xml_elem_Synset :
-                    str_Synset_child_tag = xml_elem_Synset_child.tag
-                    if str_Synset_child_tag == "Definition" :
-                        xml_elem_Definition = xml_elem_Synset_child
-                        synset_obj.add_definition(str_definition = Definition(
-                            str_text = xml_elem_Definition.text))
-                    elif str_Synset_child_tag == "Example" :
-                        xml_elem_Example = xml_elem_Synset_child
-                        synset_obj.add_example(str_example = Example(
-                            str_text = xml_elem_Example.text))
-                    elif str_Synset_child_tag == "SynsetRelation" :
-                        xml_elem_SynsetRelation = xml_elem_Synset_child
-                        if not "relType" in xml_elem_SynsetRelation.attrib :
+                        'Error: expecting "id" attribute in "Sense" tag.')
+                if not "synset" in xml_elem_Sense.attrib :
+                    raise TypeError(
+                        'Error: expecting "synset" attribute in "Sense" tag.')
+                sense_obj = Sense(
+                    str_identifier = xml_elem_Sense.attrib["id"],
+                    str_synset_identifier = xml_elem_Sense.attrib["synset"],)
+                for xml_elem_Sense_child in xml_elem_Sense :
+                    str_Sense_child_tag = xml_elem_Sense_child.tag
+                    if str_Sense_child_tag == "SenseRelation" :
+                        xml_elem_SenseRelation = xml_elem_Sense_child
+                        if not "target" in xml_elem_SenseRelation.attrib :
                             raise TypeError(
-                                'Error: expecting "relType" attribute in "SynsetRelation" tag.')
-                        if not "target" in xml_elem_SynsetRelation.attrib :
+                                'Error: expecting "target" attribute in "SenseRelation" tag.')
+                        if not "relType" in xml_elem_SenseRelation.attrib :
                             raise TypeError(
-                                'Error: expecting "target" attribute in "SynsetRelation" tag.')
-                        synset_relation_obj = SynsetRelation(
-                            str_source_synset_identifier = synset_obj.identifier,
-                            str_target_synset_identifier = xml_elem_SynsetRelation.attrib["target"],
-                            str_synset_relation_type = xml_elem_SynsetRelation.attrib["relType"])
-                        synset_obj.add_synset_relation(
-                            synset_relation_obj = synset_relation_obj)
-                lexicon.add_synset(synset_obj = synset_obj)
-            elif str_Lexicon_child_tag == "SyntacticBehaviour" :
-                xml_elem_SyntacticBehaviour = xml_elem_Lexicon_child
-                if not "id" in xml_elem_SyntacticBehaviour.attrib :
+                                'Error: expecting "relType" attribute in "SenseRelation" tag.')
+                        sense_obj.add_sense_relation(
+                            str_target_sense_identifier = xml_elem_SenseRelation.attrib["target"],
+                            str_sense_relation_type = xml_elem_SenseRelation.attrib["relType"],
+                            str_sense_relation_subtype = xml_elem_SenseRelation.attrib.get(
+                                STR_XML_ATTRIB_DC_TYPE))
+                if "subcat" in xml_elem_Sense.attrib :
+                    lst_str_syntactic_behaviour_identifiers = \
+                        xml_elem_Sense.attrib["subcat"].split()
+                    for str_syntactic_behaviour_identifier in lst_str_syntactic_behaviour_identifiers :
+                        sense_obj.add_syntactic_behaviour(
+                            str_syntactic_behaviour_identifier = str_syntactic_behaviour_identifier)
+                lst_Senses.append(sense_obj)
+        if not bool_LexicalEntry_has_one_Lemma :
+            raise ValueError(
+                'Error: expecting one and only one "Lemma" tag in "LexicalEntry".')
+        lexical_entry_obj = LexicalEntry(
+            str_identifier = xml_elem_LexicalEntry.attrib["id"],
+            str_written_form = str_Lemma_written_form,
+            str_part_of_speech = str_Lemma_part_of_speech)
+        for pronunciation_obj in lst_Pronunciations :
+            lexical_entry_obj.lemma.add_pronunciation(
+                pronunciation_obj = pronunciation_obj)
+        for str_Form_written_form in lst_Forms :
+            lexical_entry_obj.add_form(str_written_form = str_Form_written_form)
+        for sense_obj in lst_Senses :
+            lexical_entry_obj.add_sense(sense_obj = sense_obj)
+            self.add_sense(sense_obj = sense_obj)
+        self.add_lexical_entry(lexical_entry_obj = lexical_entry_obj)
+
+    def _add_synset_from_xml(self, xml_elem_Synset) :
+        if not "id" in xml_elem_Synset.attrib :
+            raise TypeError(
+                'Error: expecting "id" attribute in "Synset" tag.')
+        if not "partOfSpeech" in xml_elem_Synset.attrib :
+            raise TypeError(
+                'Error: expecting "partOfSpeech" attribute in "Synset" tag.')
+        if not "lexfile" in xml_elem_Synset.attrib :
+            raise TypeError(
+                'Error: expecting "lexfile" attribute in "Synset" tag.')
+        if not "members" in xml_elem_Synset.attrib :
+            raise TypeError(
+                'Error: expecting "members" attribute in "Synset" tag.')
+        synset_obj = Synset(
+            str_identifier = xml_elem_Synset.attrib["id"],
+            str_part_of_speech = xml_elem_Synset.attrib["partOfSpeech"],
+            str_lexical_file_category = xml_elem_Synset.attrib["lexfile"])
+        lst_str_lexical_entries_identifiers = \
+            xml_elem_Synset.attrib["members"].split()
+        for str_lexical_entry_identifier in lst_str_lexical_entries_identifiers :
+            synset_obj.add_lexical_entry_identifier(
+                str_lexical_entry_identifier = str_lexical_entry_identifier)
+        for xml_elem_Synset_child in xml_elem_Synset :
+            str_Synset_child_tag = xml_elem_Synset_child.tag
+            if str_Synset_child_tag == "Definition" :
+                xml_elem_Definition = xml_elem_Synset_child
+                synset_obj.add_definition(
+                    str_definition = xml_elem_Definition.text)
+            elif str_Synset_child_tag == "Example" :
+                xml_elem_Example = xml_elem_Synset_child
+                synset_obj.add_example(
+                    str_example = xml_elem_Example.text)
+            elif str_Synset_child_tag == "SynsetRelation" :
+                xml_elem_SynsetRelation = xml_elem_Synset_child
+                if not "relType" in xml_elem_SynsetRelation.attrib :
                     raise TypeError(
-                        'Error: expecting "id" attribute in "SyntacticBehaviour" tag.')
-                if not "subcategorizationFrame" in xml_elem_SyntacticBehaviour.attrib :
+                        'Error: expecting "relType" attribute in "SynsetRelation" tag.')
+                if not "target" in xml_elem_SynsetRelation.attrib :
                     raise TypeError(
-                        'Error: expecting "subcategorizationFrame" attribute in ' +
-                        '"SyntacticBehaviour" tag.')
-                syntactic_behaviour_obj = SyntacticBehaviour(
-                    str_identifier = xml_elem_SyntacticBehaviour.attrib["id"],
-                    str_subcategorization_frame = xml_elem_SyntacticBehaviour.attrib[
-                        'subcategorizationFrame'])
-                lexicon.add_syntactic_behaviour(
-                    syntactic_behaviour_obj = syntactic_behaviour_obj)
+                        'Error: expecting "target" attribute in "SynsetRelation" tag.')
+                synset_obj.add_synset_relation(
+                    str_target_synset_identifier = xml_elem_SynsetRelation.attrib["target"],
+                    str_synset_relation_type = xml_elem_SynsetRelation.attrib["relType"])
+        self.add_synset(synset_obj = synset_obj)
+
+    def _add_syntactic_behaviour_from_xml(self, xml_elem_SyntacticBehaviour) :
+        if not "id" in xml_elem_SyntacticBehaviour.attrib :
+            raise TypeError(
+                'Error: expecting "id" attribute in "SyntacticBehaviour" tag.')
+        if not "subcategorizationFrame" in xml_elem_SyntacticBehaviour.attrib :
+            raise TypeError(
+                'Error: expecting "subcategorizationFrame" attribute in ' +
+                '"SyntacticBehaviour" tag.')
+        syntactic_behaviour_obj = SyntacticBehaviour(
+            str_identifier = xml_elem_SyntacticBehaviour.attrib["id"],
+            str_subcategorization_frame = xml_elem_SyntacticBehaviour.attrib[
+                'subcategorizationFrame'])
+        self.add_syntactic_behaviour(
+            syntactic_behaviour_obj = syntactic_behaviour_obj)
 
-            if not bool_Lexicon_has_LexicalEntry :
-                raise TypeError(
-                    'Error: expecting at least one "LexicalEntry" tag in "Lexicon" tag.')
-        lexicon.refresh_summary_counts()
-        return lexicon
+
+###############################################################################
+# Memory-mapped columnar repository.
+#
+# File layout: magic bytes, the byte length of a JSON header (little-endian
+# uint64), the JSON header, and then the 8-byte aligned sections. The header
+# describes every section by its offset (relative to the first section), its
+# kind and its length. An "int" section is a raw array of a given typecode,
+# and a "str" section is an array of "q" offsets followed by the UTF-8 bytes
+# of all strings, so that the i-th string is decoded only when it is read.
+###############################################################################
+
+
+def _add_mmap_csr_sections(dict_sections, str_name, lst_lst_values, str_kind) :
+    # Stores a list of lists as "<name>.indptr" and flat "<name>" columns,
+    # where the values are of the given kind ("int" or "str"), so that even
+    # an empty column is read back as such.
+    if str_kind not in ("int", "str",) :
+        raise ValueError('Error: expecting "int" or "str" kind of column, got "{0}".'.format(
+            str_kind))
+    arr_int_indptr = array.array('i', [0])
+    for lst_values in lst_lst_values :
+        arr_int_indptr.append(arr_int_indptr[-1] + len(lst_values))
+    dict_sections[str_name + ".indptr"] = arr_int_indptr
+    lst_flat_values = [
+        value for lst_values in lst_lst_values for value in lst_values]
+    if str_kind == "str" :
+        dict_sections[str_name] = lst_flat_values
+    else :
+        dict_sections[str_name] = array.array('i', lst_flat_values)
+
+
+def _add_mmap_string_index_sections(dict_sections, str_name, dict_index) :
+    # Stores a "string -> integer IDs" dictionary as "<name>.keys" (sorted
+    # keys) and "<name>.indptr" and "<name>" columns (IDs by key).
+    lst_keys = sorted(dict_index.keys())
+    dict_sections[str_name + ".keys"] = lst_keys
+    _add_mmap_csr_sections(
+        dict_sections, str_name, [dict_index[str_key] for str_key in lst_keys], "int")
+
+
+def _add_mmap_symmetric_delete_index_sections(
+        dict_sections, str_name, symmetric_delete_index) :
+    # Stores a symmetric delete dictionary as "<name>.hash" and "<name>"
+    # (rows) columns; its words are stored separately, and its parameters
+    # are stored in the "<name>.params" column.
+    dict_sections[str_name + ".hash"] = array.array(
+        'I', symmetric_delete_index.hashes.tobytes())
+    dict_sections[str_name] = array.array('i', symmetric_delete_index.rows.tobytes())
+    dict_sections[str_name + ".params"] = array.array('i', [
+        symmetric_delete_index.max_distance, symmetric_delete_index.prefix_length])
+
+
+def _add_mmap_hypernym_hierarchy_sections(dict_sections, str_name, hypernym_hierarchy) :
+    # Stores a hypernym hierarchy as "<name>.pre", "<name>.end", "<name>.order",
+    # "<name>.extra.indptr", "<name>.extra.start" and "<name>.extra.end"
+    # columns; its relation graph is stored separately.
+    for (str_column, arr_values) in (
+            ("pre", hypernym_hierarchy.pre), ("end", hypernym_hierarchy.end),
+            ("order", hypernym_hierarchy.order),
+            ("extra.indptr", hypernym_hierarchy.extra_indptr),
+            ("extra.start", hypernym_hierarchy.extra_starts),
+            ("extra.end", hypernym_hierarchy.extra_ends),) :
+        dict_sections[str_name + "." + str_column] = array.array('i', arr_values.tobytes())
+
+
+def _add_mmap_relation_graph_sections(dict_sections, str_name, relation_graph) :
+    # Stores a relation graph as "<name>.indptr", "<name>", "<name>.type"
+    # (and "<name>.subtype") columns.
+    dict_sections[str_name + ".indptr"] = array.array(
+        'i', relation_graph.indptr.tobytes())
+    dict_sections[str_name] = array.array('i', relation_graph.indices.tobytes())
+    dict_sections[str_name + ".type"] = array.array(
+        'B', relation_graph.reltype.tobytes())
+    if relation_graph.relsubtype is not None :
+        dict_sections[str_name + ".subtype"] = array.array(
+            'B', relation_graph.relsubtype.tobytes())
+
+
+def _write_mmap_sections_file(str_file_path, dict_header, dict_sections) :
+    dict_header = dict(dict_header)
+    dict_header["sections"] = {}
+    lst_bytes_sections = []
+    int_offset = 0
+    for (str_name, values) in dict_sections.items() :
+        if isinstance(values, array.array) :
+            bytes_section = values.tobytes()
+            dict_header["sections"][str_name] = {
+                "kind" : "int", "typecode" : values.typecode,
+                "offset" : int_offset, "count" : len(values),}
+        else :
+            lst_bytes_values = [str_value.encode("utf-8") for str_value in values]
+            arr_int_offsets = array.array('q', [0])
+            for bytes_value in lst_bytes_values :
+                arr_int_offsets.append(arr_int_offsets[-1] + len(bytes_value))
+            bytes_section = arr_int_offsets.tobytes() + b"".join(lst_bytes_values)
+            dict_header["sections"][str_name] = {
+                "kind" : "str", "offset" : int_offset, "count" : len(values),}
+        bytes_section += b"\0" * (-len(bytes_section) % 8)
+        lst_bytes_sections.append(bytes_section)
+        int_offset += len(bytes_section)
+    bytes_header = json.dumps(dict_header).encode("utf-8")
+    bytes_header += b" " * (-(len(STR_MMAP_FILE_MAGIC) + 8 + len(bytes_header)) % 8)
+    with open(str_file_path, 'wb') as fp :
+        fp.write(STR_MMAP_FILE_MAGIC)
+        fp.write(len(bytes_header).to_bytes(8, "little"))
+        fp.write(bytes_header)
+        for bytes_section in lst_bytes_sections :
+            fp.write(bytes_section)
+
+
+class _MmapSectionsFile :
+
+    def __init__(self, str_file_path) :
+        with open(str_file_path, 'rb') as fp :
+            self._mmap = mmap.mmap(fp.fileno(), 0, access = mmap.ACCESS_READ)
+        int_magic_length = len(STR_MMAP_FILE_MAGIC)
+        if self._mmap[:int_magic_length] != STR_MMAP_FILE_MAGIC :
+            raise TypeError(
+                'Error: expecting a memory-mapped lexicon file "{0}".'.format(
+                    str_file_path))
+        int_header_length = int.from_bytes(
+            self._mmap[int_magic_length:int_magic_length + 8], "little")
+        int_header_start = int_magic_length + 8
+        self._dict_header = json.loads(
+            self._mmap[int_header_start:int_header_start + int_header_length])
+        self._int_data_start = int_header_start + int_header_length
+        self._memoryview = memoryview(self._mmap)
+
+    @property
+    def header(self,) :
+        return self._dict_header
+
+    def int_section(self, str_name) :
+        dict_section = self._dict_header["sections"][str_name]
+        if dict_section["kind"] != "int" :
+            raise TypeError('Error: expecting an "int" section "{0}".'.format(str_name))
+        int_start = self._int_data_start + dict_section["offset"]
+        int_item_size = array.array(dict_section["typecode"]).itemsize
+        return self._memoryview[
+            int_start:int_start + dict_section["count"] * int_item_size].cast(
+                dict_section["typecode"])
+
+    def str_section(self, str_name) :
+        dict_section = self._dict_header["sections"][str_name]
+        if dict_section["kind"] != "str" :
+            raise TypeError('Error: expecting a "str" section "{0}".'.format(str_name))
+        int_start = self._int_data_start + dict_section["offset"]
+        int_offsets_end = int_start + (dict_section["count"] + 1) * 8
+        return _MappedStrings(
+            self._memoryview[int_start:int_offsets_end].cast('q'),
+            self._memoryview[int_offsets_end:])
+
+
+class _MappedStrings(collections.abc.Sequence) :
+
+    # Read-only sequence of strings, which are decoded on access.
+
+    def __init__(self, memoryview_offsets, memoryview_bytes) :
+        self._memoryview_offsets = memoryview_offsets
+        self._memoryview_bytes = memoryview_bytes
+
+    def __len__(self,) :
+        return len(self._memoryview_offsets) - 1
+
+    def __getitem__(self, int_index) :
+        if isinstance(int_index, slice) :
+            return [self[i] for i in range(*int_index.indices(len(self)))]
+        if int_index < 0 :
+            int_index += len(self)
+        if not 0 <= int_index < len(self) :
+            raise IndexError(int_index)
+        return str(self._memoryview_bytes[
+            self._memoryview_offsets[int_index]:
+            self._memoryview_offsets[int_index + 1]], "utf-8")
+
+
+class _MappedEntitiesDictionary(collections.abc.Mapping) :
+
+    # Read-only "identifier -> entity" dictionary over mapped columns: an
+    # identifier is found by a binary search in the rows sorted by their
+    # identifiers, and the entity objects are built lazily by "fn_entity_at".
+
+    def __init__(self, mapped_identifiers, memoryview_sorted_rows, fn_entity_at) :
+        self._mapped_identifiers = mapped_identifiers
+        self._memoryview_sorted_rows = memoryview_sorted_rows
+        self._fn_entity_at = fn_entity_at
+
+    def row_of(self, str_identifier) :
+        int_low = 0
+        int_high = len(self._memoryview_sorted_rows)
+        while int_low < int_high :
+            int_middle = (int_low + int_high) // 2
+            if self._mapped_identifiers[
+                    self._memoryview_sorted_rows[int_middle]] < str_identifier :
+                int_low = int_middle + 1
+            else :
+                int_high = int_middle
+        if int_low < len(self._memoryview_sorted_rows) :
+            int_row = self._memoryview_sorted_rows[int_low]
+            if self._mapped_identifiers[int_row] == str_identifier :
+                return int_row
+        return None
+
+    def __getitem__(self, str_identifier) :
+        int_row = self.row_of(str_identifier)
+        if int_row is None :
+            raise KeyError(str_identifier)
+        return self._fn_entity_at(int_row)
+
+    def __contains__(self, str_identifier) :
+        return self.row_of(str_identifier) is not None
+
+    def __iter__(self,) :
+        return iter(self._mapped_identifiers)
+
+    def __len__(self,) :
+        return len(self._mapped_identifiers)
+
+    def values(self,) :
+        return _MappedEntitiesValuesView(self)
+
+
+class _MappedEntitiesValuesView(collections.abc.ValuesView) :
+
+    def __iter__(self,) :
+        for int_row in range(len(self._mapping)) :
+            yield self._mapping._fn_entity_at(int_row)
+
+
+class _MappedStringIndex(collections.abc.Mapping) :
+
+    # Read-only "string -> integer IDs" dictionary over mapped columns (see
+    # "_add_mmap_string_index_sections"): a key is found by a binary search,
+    # and its IDs are a zero-copy slice of the mapped column.
+
+    def __init__(self, mapped_keys, memoryview_indptr, memoryview_values) :
+        self._mapped_keys = mapped_keys
+        self._memoryview_indptr = memoryview_indptr
+        self._memoryview_values = memoryview_values
+
+    def __getitem__(self, str_key) :
+        int_row = bisect.bisect_left(self._mapped_keys, str_key)
+        if int_row == len(self._mapped_keys) or self._mapped_keys[int_row] != str_key :
+            raise KeyError(str_key)
+        return self._memoryview_values[
+            self._memoryview_indptr[int_row]:self._memoryview_indptr[int_row + 1]]
+
+    def __iter__(self,) :
+        return iter(self._mapped_keys)
+
+    def __len__(self,) :
+        return len(self._mapped_keys)
+
+
+class _MappedEntitiesList(collections.abc.Sequence) :
+
+    # Read-only "integer ID -> entity" list over mapped columns.
+
+    def __init__(self, int_count, fn_entity_at) :
+        self._int_count = int_count
+        self._fn_entity_at = fn_entity_at
+
+    def __len__(self,) :
+        return self._int_count
+
+    def __getitem__(self, int_index) :
+        if isinstance(int_index, slice) :
+            return [self[i] for i in range(*int_index.indices(len(self)))]
+        if int_index < 0 :
+            int_index += len(self)
+        if not 0 <= int_index < len(self) :
+            raise IndexError(int_index)
+        return self._fn_entity_at(int_index)
+
+
+class MappedLexicon(Lexicon) :
+
+    # A read-only lexicon over a memory-mapped columnar file (see
+    # "Lexicon.save_to_mmap"). Opening it reads the header only: the
+    # entity objects are built from the mapped columns on first access,
+    # and then they are cached, so that each of them stays a single object.
+
+    def __init__(self, str_file_path) :
+        mapped_file = _MmapSectionsFile(str_file_path)
+        register_relation_types(mapped_file.header["relation_types"])
+        Lexicon.__init__(
+            self, str_identifier = mapped_file.header["identifier"])
+        self._mapped_file = mapped_file
+        dict_summary_counts = mapped_file.header["summary_counts"]
+        self._dict_syntactic_behaviour_types_counts = \
+            dict_summary_counts["syntactic_behaviour_types"]
+        self._dict_sense_relation_types_counts = \
+            dict_summary_counts["sense_relation_types"]
+        self._dict_sense_relation_subtypes_counts = \
+            dict_summary_counts["sense_relation_subtypes"]
+        self._dict_lemma_parts_of_speech_counts = \
+            dict_summary_counts["lemma_parts_of_speech"]
+        self._dict_synset_parts_of_speech_counts = \
+            dict_summary_counts["synset_parts_of_speech"]
+        self._dict_synset_lexical_file_categories_counts = \
+            dict_summary_counts["synset_lexical_file_categories"]
+        self._dict_synset_relation_types_counts = \
+            dict_summary_counts["synset_relation_types"]
+        self._dict_cached_lexical_entries = {}
+        self._dict_cached_senses = {}
+        self._dict_cached_synsets = {}
+        self._dict_cached_syntactic_behaviours = {}
+        self._dict_lexical_entries = self._mapped_entities_dictionary(
+            "lexical_entry", self._lexical_entry_at)
+        self._dict_senses = self._mapped_entities_dictionary(
+            "sense", self._sense_at)
+        self._dict_synsets = self._mapped_entities_dictionary(
+            "synset", self._synset_at)
+        self._dict_syntactic_behaviours = self._mapped_entities_dictionary(
+            "syntactic_behaviour", self._syntactic_behaviour_at)
+        self._list_lexical_entries = _MappedEntitiesList(
+            len(self._dict_lexical_entries), self._lexical_entry_at)
+        self._list_senses = _MappedEntitiesList(
+            len(self._dict_senses), self._sense_at)
+        self._list_synsets = _MappedEntitiesList(
+            len(self._dict_synsets), self._synset_at)
+        # The relation graphs are zero-copy views of the mapped sections.
+        self._sense_relation_graph = self._mapped_relation_graph(
+            "sense.relations", lst_sense_relation_types, lst_sense_relation_subtypes)
+        self._synset_relation_graph = self._mapped_relation_graph(
+            "synset.relations", lst_synset_relation_types)
+        self._sense_incoming_relation_graph = self._mapped_relation_graph(
+            "sense.incoming_relations", lst_sense_relation_types,
+            lst_sense_relation_subtypes)
+        self._synset_incoming_relation_graph = self._mapped_relation_graph(
+            "synset.incoming_relations", lst_synset_relation_types)
+        self._hypernym_hierarchy = HypernymHierarchy(
+            synset_relation_graph = self._synset_relation_graph,
+            arr_pre = self._mapped_int_column("synset.hypernym_hierarchy.pre"),
+            arr_end = self._mapped_int_column("synset.hypernym_hierarchy.end"),
+            arr_order = self._mapped_int_column("synset.hypernym_hierarchy.order"),
+            arr_extra_indptr = self._mapped_int_column("synset.hypernym_hierarchy.extra.indptr"),
+            arr_extra_starts = self._mapped_int_column("synset.hypernym_hierarchy.extra.start"),
+            arr_extra_ends = self._mapped_int_column("synset.hypernym_hierarchy.extra.end"),)
+        self._dict_written_form_to_lexical_entry_int_ids = \
+            self._mapped_string_index("index.written_form")
+        self._dict_normalized_form_to_lexical_entry_int_ids = \
+            self._mapped_string_index("index.normalized_form")
+        # The keys of the written forms index are the sorted written forms.
+        self._list_written_forms = self._mapped_file.str_section(
+            "index.written_form.keys")
+        self._list_materialized_written_forms = None
+        self._arr_written_forms_sense_counts = np.asarray(
+            self._mapped_file.int_section("index.written_form.sense_count"))
+        self._dict_anagram_key_to_written_form_rows = self._mapped_string_index(
+            "index.written_form.anagram_key")
+        self._arr_written_forms_letter_counts = np.asarray(
+            self._mapped_file.int_section("index.written_form.letter_counts")).reshape(
+                -1, len(str_counted_letters) + 1)
+        self._list_rhyme_keys = self._mapped_file.str_section("index.rhyme.keys")
+        self._arr_rhyme_keys_lexical_entry_int_ids = np.asarray(
+            self._mapped_file.int_section("index.rhyme"))
+        self._dict_pronunciation_to_lexical_entry_int_ids = self._mapped_string_index(
+            "index.pronunciation")
+        self._str_written_forms_buffer = self._mapped_file.str_section(
+            "index.written_form.buffer")[0]
+        self._arr_written_forms_buffer_offsets = np.asarray(
+            self._mapped_file.int_section("index.written_form.buffer.offsets"))
+        self._list_autocomplete_keys = self._mapped_file.str_section("index.autocomplete.keys")
+        self._arr_autocomplete_written_form_rows = np.asarray(
+            self._mapped_file.int_section("index.autocomplete"))
+        memoryview_symmetric_delete_params = self._mapped_file.int_section(
+            "index.written_form.symmetric_delete.params")
+        self._symmetric_delete_index_of_written_forms = SymmetricDeleteIndex(
+            lst_words = self._list_written_forms,
+            arr_hashes = np.asarray(self._mapped_file.int_section(
+                "index.written_form.symmetric_delete.hash")),
+            arr_rows = np.asarray(self._mapped_file.int_section(
+                "index.written_form.symmetric_delete")),
+            int_max_distance = memoryview_symmetric_delete_params[0],
+            int_prefix_length = memoryview_symmetric_delete_params[1],)
+        self._dict_phonetic_key_to_written_form_rows = self._mapped_string_index(
+            "index.written_form.phonetic_key")
+        self._list_ngram_indexed_forms = self._mapped_file.str_section("index.ngram.forms")
+        self._dict_ngram_to_indexed_form_rows = self._mapped_string_index("index.ngram")
+        self._dict_part_of_speech_to_lexical_entry_int_ids = \
+            self._mapped_string_index("index.part_of_speech")
+        self._dict_lexical_file_category_to_lexical_entry_int_ids = \
+            self._mapped_string_index("index.lexical_file_category")
+        self._dict_part_of_speech_and_lexical_file_category_to_lexical_entry_int_ids = \
+            self._mapped_string_index("index.part_of_speech.lexical_file_category")
+
+    def __reduce__(self,) :
+        raise TypeError(
+            'Error: a memory-mapped lexicon cannot be pickled, ' +
+            'use "Lexicon.load_from_xml" to build a regular one.')
+
+    def _materialized_written_forms(self,) :
+        # The mapped written forms are decoded on each access, so they are
+        # split from their buffer once, on the first full scan.
+        if self._list_materialized_written_forms is None :
+            self._list_materialized_written_forms = \
+                self._str_written_forms_buffer.split("\n")[:-1]
+        return self._list_materialized_written_forms
+
+    def _mapped_entities_dictionary(self, str_entity_name, fn_entity_at) :
+        return _MappedEntitiesDictionary(
+            mapped_identifiers = self._mapped_file.str_section(
+                str_entity_name + ".identifier"),
+            memoryview_sorted_rows = self._mapped_file.int_section(
+                str_entity_name + ".identifier.sorted_rows"),
+            fn_entity_at = fn_entity_at)
+
+    def _mapped_int_column(self, str_name) :
+        return np.asarray(self._mapped_file.int_section(str_name))
+
+    def _mapped_string_index(self, str_name) :
+        mf = self._mapped_file
+        return _MappedStringIndex(
+            mapped_keys = mf.str_section(str_name + ".keys"),
+            memoryview_indptr = mf.int_section(str_name + ".indptr"),
+            memoryview_values = mf.int_section(str_name))
+
+    def _mapped_relation_graph(
+            self, str_name, lst_relation_types, lst_relation_subtypes = None) :
+        mf = self._mapped_file
+        return RelationGraph(
+            arr_indptr = np.asarray(mf.int_section(str_name + ".indptr")),
+            arr_indices = np.asarray(mf.int_section(str_name)),
+            arr_reltype = np.asarray(mf.int_section(str_name + ".type")),
+            lst_relation_types = lst_relation_types,
+            arr_relsubtype = None if lst_relation_subtypes is None else \
+                np.asarray(mf.int_section(str_name + ".subtype")),
+            lst_relation_subtypes = lst_relation_subtypes)
+
+    def _csr_range(self, str_name, int_row) :
+        memoryview_indptr = self._mapped_file.int_section(str_name + ".indptr")
+        return range(memoryview_indptr[int_row], memoryview_indptr[int_row + 1])
+
+    def _lexical_entry_at(self, int_row) :
+        lexical_entry_obj = self._dict_cached_lexical_entries.get(int_row)
+        if lexical_entry_obj is not None :
+            return lexical_entry_obj
+        mf = self._mapped_file
+        lexical_entry_obj = LexicalEntry(
+            str_identifier = mf.str_section("lexical_entry.identifier")[int_row],
+            str_written_form = mf.str_section("lexical_entry.written_form")[int_row],
+            str_part_of_speech = mf.str_section("lexical_entry.part_of_speech")[int_row])
+        lexical_entry_obj._int_id = int_row
+        mapped_texts = mf.str_section("lexical_entry.pronunciations")
+        mapped_varieties = mf.str_section("lexical_entry.pronunciations.variety")
+        for i in self._csr_range("lexical_entry.pronunciations", int_row) :
+            str_variety = mapped_varieties[i]
+            lexical_entry_obj.lemma.add_pronunciation(Pronunciation(
+                str_text = mapped_texts[i],
+                str_variety = None if str_variety == "" else str_variety,))
+        mapped_forms = mf.str_section("lexical_entry.forms")
+        for i in self._csr_range("lexical_entry.forms", int_row) :
+            lexical_entry_obj.add_form(mapped_forms[i])
+        memoryview_sense_rows = mf.int_section("lexical_entry.senses")
+        for i in self._csr_range("lexical_entry.senses", int_row) :
+            lexical_entry_obj.add_sense(self._sense_at(memoryview_sense_rows[i]))
+        self._dict_cached_lexical_entries[int_row] = lexical_entry_obj
+        return lexical_entry_obj
+
+    def _sense_at(self, int_row) :
+        sense_obj = self._dict_cached_senses.get(int_row)
+        if sense_obj is not None :
+            return sense_obj
+        mf = self._mapped_file
+        sense_obj = Sense(
+            str_identifier = mf.str_section("sense.identifier")[int_row],
+            str_synset_identifier = mf.str_section("synset.identifier")[
+                mf.int_section("sense.synset_row")[int_row]],)
+        sense_obj._int_id = int_row
+        range_relations = self._csr_range("sense.relations", int_row)
+        sense_obj.set_sense_relations(
+            tpl_target_int_ids = tuple(mf.int_section("sense.relations")[
+                range_relations.start:range_relations.stop]),
+            bytes_type_codes = bytes(mf.int_section("sense.relations.type")[
+                range_relations.start:range_relations.stop]),
+            bytes_subtype_codes = bytes(mf.int_section("sense.relations.subtype")[
+                range_relations.start:range_relations.stop]))
+        mapped_syntactic_behaviours = mf.str_section("sense.syntactic_behaviours")
+        for i in self._csr_range("sense.syntactic_behaviours", int_row) :
+            sense_obj.add_syntactic_behaviour(mapped_syntactic_behaviours[i])
+        self._dict_cached_senses[int_row] = sense_obj
+        return sense_obj
+
+    def _synset_at(self, int_row) :
+        synset_obj = self._dict_cached_synsets.get(int_row)
+        if synset_obj is not None :
+            return synset_obj
+        mf = self._mapped_file
+        synset_obj = Synset(
+            str_identifier = mf.str_section("synset.identifier")[int_row],
+            str_part_of_speech = mf.str_section("synset.part_of_speech")[int_row],
+            str_lexical_file_category = mf.str_section(
+                "synset.lexical_file_category")[int_row])
+        synset_obj._int_id = int_row
+        mapped_lexical_entry_identifiers = mf.str_section("lexical_entry.identifier")
+        memoryview_member_rows = mf.int_section("synset.members")
+        for i in self._csr_range("synset.members", int_row) :
+            synset_obj.add_lexical_entry_identifier(
+                mapped_lexical_entry_identifiers[memoryview_member_rows[i]])
+        mapped_definitions = mf.str_section("synset.definitions")
+        for i in self._csr_range("synset.definitions", int_row) :
+            synset_obj.add_definition(mapped_definitions[i])
+        mapped_examples = mf.str_section("synset.examples")
+        for i in self._csr_range("synset.examples", int_row) :
+            synset_obj.add_example(mapped_examples[i])
+        range_relations = self._csr_range("synset.relations", int_row)
+        synset_obj.set_synset_relations(
+            tpl_target_int_ids = tuple(mf.int_section("synset.relations")[
+                range_relations.start:range_relations.stop]),
+            bytes_type_codes = bytes(mf.int_section("synset.relations.type")[
+                range_relations.start:range_relations.stop]))
+        self._dict_cached_synsets[int_row] = synset_obj
+        return synset_obj
+
+    def _syntactic_behaviour_at(self, int_row) :
+        syntactic_behaviour_obj = self._dict_cached_syntactic_behaviours.get(int_row)
+        if syntactic_behaviour_obj is not None :
+            return syntactic_behaviour_obj
+        mf = self._mapped_file
+        syntactic_behaviour_obj = SyntacticBehaviour(
+            str_identifier = mf.str_section("syntactic_behaviour.identifier")[int_row],
+            str_subcategorization_frame = mf.str_section(
+                "syntactic_behaviour.subcategorization_frame")[int_row])
+        self._dict_cached_syntactic_behaviours[int_row] = syntactic_behaviour_obj
+        return syntactic_behaviour_obj
+
+
+def _load_lexicon_from_xml_shard(
+        str_xml_file_path, bytes_header, int_shard_start, int_shard_end,
+        bool_expect_lexical_entry_first) :
+    # A process pool's worker: it must be a module-level function.
+    with open(str_xml_file_path, 'rb') as fp_xml :
+        fp_xml.seek(int_shard_start)
+        bytes_shard = fp_xml.read(int_shard_end - int_shard_start)
+    return Lexicon._load_from_xml_stream(
+        fp_xml = io.BytesIO(
+            bytes_header + bytes_shard + b"</Lexicon>\n</LexicalResource>\n"),
+        bool_expect_lexical_entry_first = bool_expect_lexical_entry_first)
+
+
+class _ByteCountingReader :
+
+    # Counts the bytes read through a binary file object, e.g. to report
+    # the throughput of both compressed and decompressed XML streams.
+
+    def __init__(self, fp) :
+        self._fp = fp
+        self._int_bytes_read = 0
+
+    def read(self, int_size = -1) :
+        bytes_data = self._fp.read(int_size)
+        self._int_bytes_read += len(bytes_data)
+        return bytes_data
+
+    @property
+    def bytes_read(self,) :
+        return self._int_bytes_read
+
+
+###############################################################################
+# Compressed sparse row (CSR) graph of relations.
+#
+# The relations of the node (synset or sense) with integer ID "i" are
+# "indices[indptr[i]:indptr[i + 1]]" (targets' IDs) with the type codes
+# "reltype[indptr[i]:indptr[i + 1]]" (and the sub-type codes "relsubtype" for
+# senses), in the document order of the relations. The transposed graph has
+# the same layout for the incoming relations: its "indices" are the sources'
+# IDs, in the order of these IDs.
+###############################################################################
+
+
+class RelationGraph :
+
+    def __init__(
+            self, arr_indptr, arr_indices, arr_reltype, lst_relation_types,
+            arr_relsubtype = None, lst_relation_subtypes = None,) :
+        self._arr_indptr = arr_indptr
+        self._arr_indices = arr_indices
+        self._arr_reltype = arr_reltype
+        self._arr_relsubtype = arr_relsubtype
+        self._lst_relation_types = lst_relation_types
+        self._lst_relation_subtypes = lst_relation_subtypes
+
+    def from_relations(
+            lst_tpl_target_int_ids, lst_bytes_type_codes, lst_relation_types,
+            lst_bytes_subtype_codes = None, lst_relation_subtypes = None,) :
+        # Builds a graph from the relations of every node, in the order of
+        # the nodes' integer IDs.
+        arr_indptr = np.zeros(len(lst_tpl_target_int_ids) + 1, dtype = np.int32)
+        np.cumsum(
+            [len(tpl_target_int_ids) for tpl_target_int_ids in lst_tpl_target_int_ids],
+            out = arr_indptr[1:])
+        return RelationGraph(
+            arr_indptr = arr_indptr,
+            arr_indices = np.fromiter(
+                (int_target_id for tpl_target_int_ids in lst_tpl_target_int_ids
+                 for int_target_id in tpl_target_int_ids),
+                dtype = np.int32, count = int(arr_indptr[-1])),
+            arr_reltype = np.frombuffer(
+                b"".join(lst_bytes_type_codes), dtype = np.uint8).copy(),
+            lst_relation_types = lst_relation_types,
+            arr_relsubtype = None if lst_bytes_subtype_codes is None else np.frombuffer(
+                b"".join(lst_bytes_subtype_codes), dtype = np.uint8).copy(),
+            lst_relation_subtypes = lst_relation_subtypes)
+
+    def transposed(self,) :
+        # Builds the graph of the incoming relations, i.e. the reverse-edge
+        # index, by a stable sort of all relations by their targets.
+        (arr_sources, arr_targets) = self.edges()
+        arr_order = np.argsort(arr_targets, kind = "stable")
+        arr_indptr = np.zeros(self.count_of_nodes + 1, dtype = np.int32)
+        np.cumsum(
+            np.bincount(arr_targets, minlength = self.count_of_nodes),
+            out = arr_indptr[1:])
+        return RelationGraph(
+            arr_indptr = arr_indptr,
+            arr_indices = arr_sources[arr_order],
+            arr_reltype = self._arr_reltype[arr_order],
+            lst_relation_types = self._lst_relation_types,
+            arr_relsubtype = None if self._arr_relsubtype is None else \
+                self._arr_relsubtype[arr_order],
+            lst_relation_subtypes = self._lst_relation_subtypes)
+
+    @property
+    def indptr(self,) :
+        return self._arr_indptr
+
+    @property
+    def indices(self,) :
+        return self._arr_indices
+
+    @property
+    def reltype(self,) :
+        return self._arr_reltype
+
+    @property
+    def relsubtype(self,) :
+        return self._arr_relsubtype
+
+    @property
+    def count_of_nodes(self,) :
+        return len(self._arr_indptr) - 1
+
+    @property
+    def count_of_edges(self,) :
+        return len(self._arr_indices)
+
+    def relation_type_codes(self, tpl_str_relation_types,) :
+        return self._codes(
+            tpl_str_relation_types, self._lst_relation_types, "relation type")
+
+    def relation_subtype_codes(self, tpl_str_relation_subtypes,) :
+        if self._lst_relation_subtypes is None :
+            raise TypeError('Error: expecting a graph with relation sub-types.')
+        return self._codes(
+            tpl_str_relation_subtypes, self._lst_relation_subtypes, "relation sub-type")
+
+    def _codes(self, tpl_str_names, lst_names, str_kind) :
+        lst_int_codes = []
+        for str_name in tpl_str_names :
+            if not str_name in lst_names :
+                raise ValueError('Error: unexpected {0} "{1}".'.format(str_kind, str_name))
+            lst_int_codes.append(lst_names.index(str_name))
+        return np.array(lst_int_codes, dtype = np.uint8)
+
+    def degree(self, int_id,) :
+        return int(self._arr_indptr[int_id + 1] - self._arr_indptr[int_id])
+
+    def neighbors(
+            self, int_id, tpl_str_relation_types = None,
+            tpl_str_relation_subtypes = None,) :
+        # Returns the targets' IDs of the relations of the node "int_id",
+        # optionally only those of the given types (and sub-types).
+        int_start = self._arr_indptr[int_id]
+        int_end = self._arr_indptr[int_id + 1]
+        arr_indices = self._arr_indices[int_start:int_end]
+        arr_bool_mask = self._mask(
+            self._arr_reltype[int_start:int_end],
+            None if self._arr_relsubtype is None else self._arr_relsubtype[int_start:int_end],
+            tpl_str_relation_types, tpl_str_relation_subtypes)
+        return arr_indices if arr_bool_mask is None else arr_indices[arr_bool_mask]
+
+    def neighbors_with_types(self, int_id,) :
+        # Returns the targets' IDs and the type codes of the relations of the
+        # node "int_id".
+        int_start = self._arr_indptr[int_id]
+        int_end = self._arr_indptr[int_id + 1]
+        return (
+            self._arr_indices[int_start:int_end],
+            self._arr_reltype[int_start:int_end])
+
+    def frontier_edges(self, arr_ids, tpl_str_relation_types = None,) :
+        # Returns the sources' and the targets' IDs and the type codes of the
+        # relations of all nodes "arr_ids" at once (e.g. of a breadth-first
+        # search level), optionally only those of the given types.
+        arr_starts = self._arr_indptr[arr_ids].astype(np.int64)
+        arr_counts = self._arr_indptr[arr_ids + 1] - arr_starts
+        arr_positions = np.arange(int(arr_counts.sum()), dtype = np.int64) + np.repeat(
+            arr_starts - (np.cumsum(arr_counts) - arr_counts), arr_counts)
+        arr_sources = np.repeat(arr_ids, arr_counts)
+        arr_targets = self._arr_indices[arr_positions]
+        arr_reltype = self._arr_reltype[arr_positions]
+        if tpl_str_relation_types is None :
+            return (arr_sources, arr_targets, arr_reltype)
+        arr_bool_mask = np.isin(arr_reltype, self.relation_type_codes(tpl_str_relation_types))
+        return (arr_sources[arr_bool_mask], arr_targets[arr_bool_mask], arr_reltype[arr_bool_mask])
+
+    def edges(self, tpl_str_relation_types = None, tpl_str_relation_subtypes = None,) :
+        # Returns the sources' and the targets' IDs of all relations,
+        # optionally only those of the given types (and sub-types).
+        arr_sources = np.repeat(
+            np.arange(self.count_of_nodes, dtype = np.int32),
+            np.diff(self._arr_indptr))
+        arr_bool_mask = self._mask(
+            self._arr_reltype, self._arr_relsubtype,
+            tpl_str_relation_types, tpl_str_relation_subtypes)
+        if arr_bool_mask is None :
+            return (arr_sources, self._arr_indices)
+        return (arr_sources[arr_bool_mask], self._arr_indices[arr_bool_mask])
+
+    def _mask(
+            self, arr_reltype, arr_relsubtype, tpl_str_relation_types,
+            tpl_str_relation_subtypes) :
+        arr_bool_mask = None
+        if tpl_str_relation_types is not None :
+            arr_bool_mask = np.isin(
+                arr_reltype, self.relation_type_codes(tpl_str_relation_types))
+        if tpl_str_relation_subtypes is not None :
+            arr_bool_subtype_mask = np.isin(
+                arr_relsubtype, self.relation_subtype_codes(tpl_str_relation_subtypes))
+            arr_bool_mask = arr_bool_subtype_mask if arr_bool_mask is None else \
+                arr_bool_mask & arr_bool_subtype_mask
+        return arr_bool_mask
+
+
+###############################################################################
+# Symmetric delete (SymSpell) dictionary of words.
+#
+# Every variant of the normalized word's prefix with up to "max_distance"
+# characters deleted (including the prefix itself) is hashed by CRC-32, and
+# "(hash, row)" pairs are sorted by the hashes, i.e. "rows[i]" is the word
+# with a variant hashed to "hashes[i]". Two words within "max_distance" edits
+# share a variant, so the candidates for a query are found by a few binary
+# searches for its own variants' hashes, and they are verified by the
+# Damerau-Levenshtein distance (which also drops the hash collisions).
+###############################################################################
+
+
+class SymmetricDeleteIndex :
+
+    def __init__(
+            self, lst_words, arr_hashes, arr_rows,
+            int_max_distance = INT_SYMMETRIC_DELETE_MAX_DISTANCE,
+            int_prefix_length = INT_SYMMETRIC_DELETE_PREFIX_LENGTH,) :
+        self._lst_words = lst_words
+        self._arr_hashes = arr_hashes
+        self._arr_rows = arr_rows
+        self._int_max_distance = int_max_distance
+        self._int_prefix_length = int_prefix_length
+
+    def from_words(
+            lst_words, int_max_distance = INT_SYMMETRIC_DELETE_MAX_DISTANCE,
+            int_prefix_length = INT_SYMMETRIC_DELETE_PREFIX_LENGTH,) :
+        arr_hashes = array.array('I')
+        arr_rows = array.array('i')
+        for (int_row, str_word) in enumerate(lst_words) :
+            for int_hash in SymmetricDeleteIndex._variants_hashes(
+                    str_word, int_max_distance, int_prefix_length) :
+                arr_hashes.append(int_hash)
+                arr_rows.append(int_row)
+        arr_hashes = np.frombuffer(arr_hashes, dtype = np.uint32)
+        arr_rows = np.frombuffer(arr_rows, dtype = np.int32)
+        arr_order = np.lexsort((arr_rows, arr_hashes))
+        return SymmetricDeleteIndex(
+            lst_words = lst_words,
+            arr_hashes = arr_hashes[arr_order],
+            arr_rows = arr_rows[arr_order],
+            int_max_distance = int_max_distance,
+            int_prefix_length = int_prefix_length,)
+
+    def _variants_hashes(str_word, int_max_distance, int_prefix_length) :
+        set_str_variants = {normalize_written_form(str_word)[:int_prefix_length]}
+        set_str_last_variants = set_str_variants
+        for _ in range(int_max_distance) :
+            set_str_last_variants = {
+                str_variant[:i] + str_variant[i + 1:]
+                for str_variant in set_str_last_variants
+                for i in range(len(str_variant))} - set_str_variants
+            set_str_variants |= set_str_last_variants
+        return sorted(
+            zlib.crc32(str_variant.encode("utf-8")) for str_variant in set_str_variants)
+
+    @property
+    def hashes(self,) :
+        return self._arr_hashes
+
+    @property
+    def rows(self,) :
+        return self._arr_rows
+
+    @property
+    def max_distance(self,) :
+        return self._int_max_distance
+
+    @property
+    def prefix_length(self,) :
+        return self._int_prefix_length
+
+    def lookup(self, str_word, int_max_count = None,) :
+        # Returns up to "int_max_count" (or all) "(row, distance)" pairs of
+        # the words within "max_distance" of the given word (between their
+        # normalized forms), from the closest one (the ties are sorted by
+        # the rows).
+        str_normalized_word = normalize_written_form(str_word)
+        arr_query_hashes = np.array(
+            SymmetricDeleteIndex._variants_hashes(
+                str_word, self._int_max_distance, self._int_prefix_length),
+            dtype = np.uint32)
+        arr_starts = np.searchsorted(self._arr_hashes, arr_query_hashes, side = "left")
+        arr_ends = np.searchsorted(self._arr_hashes, arr_query_hashes, side = "right")
+        set_int_rows = set()
+        for (int_start, int_end) in zip(arr_starts.tolist(), arr_ends.tolist()) :
+            set_int_rows.update(self._arr_rows[int_start:int_end].tolist())
+        lst_tpl_found = []
+        for int_row in set_int_rows :
+            int_distance = DamerauLevenshtein.distance(
+                str_normalized_word, normalize_written_form(self._lst_words[int_row]),
+                score_cutoff = self._int_max_distance)
+            if int_distance <= self._int_max_distance :
+                lst_tpl_found.append((int_distance, int_row))
+        lst_tpl_found.sort()
+        if int_max_count is not None :
+            lst_tpl_found = lst_tpl_found[:int_max_count]
+        return [(int_row, int_distance) for (int_distance, int_row) in lst_tpl_found]
+
+
+###############################################################################
+# Hypernym hierarchy of synsets with interval labels.
+#
+# The first "hypernym" or "instance_hypernym" relation of every synset is its
+# edge in a spanning forest, which is numbered in the depth-first pre-order:
+# synset "i" is "order[pre[i]]", and its descendants in the forest are
+# "order[pre[i] + 1:end[i] + 1]". Its other descendants, through the other
+# hypernym relations (i.e. multiple inheritance), are in the side table of
+# the disjoint, sorted ranges "[extra_starts[j], extra_ends[j]]" of "pre"
+# outside its own range "[pre[i], end[i]]" for "j" in
+# "range(extra_indptr[i], extra_indptr[i + 1])", which is empty for most
+# synsets. Hence, synset "i" is a kind of synset "k", if "pre[i]" is in the
+# range of "k" (or, rarely, in one of its side ranges).
+###############################################################################
+
+
+tpl_hypernym_relation_types = ("hypernym", "instance_hypernym",)
+
+
+class HypernymHierarchy :
+
+    def __init__(
+            self, synset_relation_graph, arr_pre, arr_end, arr_order,
+            arr_extra_indptr, arr_extra_starts, arr_extra_ends,) :
+        self._synset_relation_graph = synset_relation_graph
+        self._arr_pre = arr_pre
+        self._arr_end = arr_end
+        self._arr_order = arr_order
+        self._arr_extra_indptr = arr_extra_indptr
+        self._arr_extra_starts = arr_extra_starts
+        self._arr_extra_ends = arr_extra_ends
+
+    def from_relation_graph(synset_relation_graph) :
+        int_count = synset_relation_graph.count_of_nodes
+        (arr_sources, arr_targets) = synset_relation_graph.edges(tpl_hypernym_relation_types)
+        arr_bool_mask = arr_sources != arr_targets
+        (arr_sources, arr_targets) = (arr_sources[arr_bool_mask], arr_targets[arr_bool_mask])
+        arr_parents = np.full(int_count, -1, dtype = np.int32)
+        (arr_children, arr_first_indices) = np.unique(arr_sources, return_index = True)
+        arr_parents[arr_children] = arr_targets[arr_first_indices]
+
+        # The spanning forest is numbered from its roots, and then from the
+        # synsets on the cycles (if any) of the first hypernym relations.
+        lst_lst_tree_children = [[] for _ in range(int_count)]
+        for (int_child, int_parent) in enumerate(arr_parents.tolist()) :
+            if int_parent >= 0 :
+                lst_lst_tree_children[int_parent].append(int_child)
+        lst_int_pre = [-1] * int_count
+        lst_int_end = [-1] * int_count
+        lst_int_order = []
+        for int_root in np.flatnonzero(arr_parents < 0).tolist() + list(range(int_count)) :
+            if lst_int_pre[int_root] >= 0 :
+                continue
+            lst_int_pre[int_root] = len(lst_int_order)
+            lst_int_order.append(int_root)
+            lst_tpl_stack = [(int_root, iter(lst_lst_tree_children[int_root]))]
+            while len(lst_tpl_stack) > 0 :
+                (int_node, iter_children) = lst_tpl_stack[-1]
+                for int_child in iter_children :
+                    if lst_int_pre[int_child] < 0 :
+                        lst_int_pre[int_child] = len(lst_int_order)
+                        lst_int_order.append(int_child)
+                        lst_tpl_stack.append((int_child, iter(lst_lst_tree_children[int_child])))
+                        break
+                else :
+                    lst_int_end[int_node] = len(lst_int_order) - 1
+                    lst_tpl_stack.pop()
+
+        # The side ranges are collected from the hyponyms to the hypernyms,
+        # i.e. a synset is processed after all its hyponyms (or, on cycles,
+        # in the order of the integer IDs).
+        arr_edges = np.unique(arr_sources.astype(np.int64) * int_count + arr_targets)
+        lst_lst_parents = [[] for _ in range(int_count)]
+        lst_lst_children = [[] for _ in range(int_count)]
+        for (int_child, int_parent) in zip(
+                (arr_edges // max(1, int_count)).tolist(), (arr_edges % max(1, int_count)).tolist()) :
+            lst_lst_parents[int_child].append(int_parent)
+            lst_lst_children[int_parent].append(int_child)
+        lst_int_pending_children_counts = [len(lst_children) for lst_children in lst_lst_children]
+        lst_int_ready = [
+            int_node for int_node in range(int_count) if lst_int_pending_children_counts[int_node] == 0]
+        lst_lst_tpl_extra_ranges = [None] * int_count
+        lst_bool_done = [False] * int_count
+        int_next_leftover = 0
+        while True :
+            if len(lst_int_ready) == 0 :
+                while int_next_leftover < int_count and lst_bool_done[int_next_leftover] :
+                    int_next_leftover += 1
+                if int_next_leftover == int_count :
+                    break
+                lst_int_ready.append(int_next_leftover)
+            int_node = lst_int_ready.pop()
+            if lst_bool_done[int_node] :
+                continue
+            lst_bool_done[int_node] = True
+            int_pre = lst_int_pre[int_node]
+            int_end = lst_int_end[int_node]
+            lst_tpl_ranges = []
+            for int_child in lst_lst_children[int_node] :
+                if not (int_pre <= lst_int_pre[int_child] <= int_end) :
+                    lst_tpl_ranges.append((lst_int_pre[int_child], lst_int_end[int_child]))
+                if lst_lst_tpl_extra_ranges[int_child] is not None :
+                    lst_tpl_ranges.extend(lst_lst_tpl_extra_ranges[int_child])
+            lst_tpl_ranges.sort()
+            lst_tpl_merged_ranges = []
+            for (int_start, int_stop) in lst_tpl_ranges :
+                if len(lst_tpl_merged_ranges) > 0 and int_start <= lst_tpl_merged_ranges[-1][1] + 1 :
+                    lst_tpl_merged_ranges[-1] = (
+                        lst_tpl_merged_ranges[-1][0], max(lst_tpl_merged_ranges[-1][1], int_stop))
+                else :
+                    lst_tpl_merged_ranges.append((int_start, int_stop))
+            # The synset's own range is cut out of the merged ranges (which
+            # can overlap it, once the adjacent ranges are merged), so that
+            # every descendant is in exactly one range.
+            lst_tpl_disjoint_ranges = []
+            for (int_start, int_stop) in lst_tpl_merged_ranges :
+                if int_start < int_pre :
+                    lst_tpl_disjoint_ranges.append((int_start, min(int_stop, int_pre - 1)))
+                if int_stop > int_end :
+                    lst_tpl_disjoint_ranges.append((max(int_start, int_end + 1), int_stop))
+            if len(lst_tpl_disjoint_ranges) > 0 :
+                lst_lst_tpl_extra_ranges[int_node] = lst_tpl_disjoint_ranges
+            for int_parent in lst_lst_parents[int_node] :
+                lst_int_pending_children_counts[int_parent] -= 1
+                if lst_int_pending_children_counts[int_parent] == 0 :
+                    lst_int_ready.append(int_parent)
+
+        arr_extra_indptr = np.zeros(int_count + 1, dtype = np.int32)
+        np.cumsum(
+            [0 if lst_tpl_ranges is None else len(lst_tpl_ranges)
+             for lst_tpl_ranges in lst_lst_tpl_extra_ranges],
+            out = arr_extra_indptr[1:])
+        lst_tpl_extra_ranges = [
+            tpl_range for lst_tpl_ranges in lst_lst_tpl_extra_ranges
+            if lst_tpl_ranges is not None for tpl_range in lst_tpl_ranges]
+        return HypernymHierarchy(
+            synset_relation_graph = synset_relation_graph,
+            arr_pre = np.array(lst_int_pre, dtype = np.int32),
+            arr_end = np.array(lst_int_end, dtype = np.int32),
+            arr_order = np.array(lst_int_order, dtype = np.int32),
+            arr_extra_indptr = arr_extra_indptr,
+            arr_extra_starts = np.array(
+                [int_start for (int_start, _) in lst_tpl_extra_ranges], dtype = np.int32),
+            arr_extra_ends = np.array(
+                [int_stop for (_, int_stop) in lst_tpl_extra_ranges], dtype = np.int32),)
+
+    @property
+    def pre(self,) :
+        return self._arr_pre
+
+    @property
+    def end(self,) :
+        return self._arr_end
+
+    @property
+    def order(self,) :
+        return self._arr_order
+
+    @property
+    def extra_indptr(self,) :
+        return self._arr_extra_indptr
+
+    @property
+    def extra_starts(self,) :
+        return self._arr_extra_starts
+
+    @property
+    def extra_ends(self,) :
+        return self._arr_extra_ends
+
+    def is_a(self, int_synset_id, int_ancestor_synset_id,) :
+        # Whether the synset is the other synset or its (instance) hyponym,
+        # directly or not.
+        int_pre = int(self._arr_pre[int_synset_id])
+        if self._arr_pre[int_ancestor_synset_id] <= int_pre <= self._arr_end[int_ancestor_synset_id] :
+            return True
+        int_start = int(self._arr_extra_indptr[int_ancestor_synset_id])
+        int_stop = int(self._arr_extra_indptr[int_ancestor_synset_id + 1])
+        if int_start == int_stop :
+            return False
+        int_index = bisect.bisect_right(
+            memoryview(self._arr_extra_starts), int_pre, int_start, int_stop) - 1
+        return int_index >= int_start and int_pre <= self._arr_extra_ends[int_index]
+
+    def descendants(self, int_synset_id,) :
+        # Returns the integer IDs of all (instance) hyponyms of the synset,
+        # directly or not, in the pre-order of the spanning forest.
+        int_start = int(self._arr_extra_indptr[int_synset_id])
+        int_stop = int(self._arr_extra_indptr[int_synset_id + 1])
+        return np.concatenate(
+            [self._arr_order[self._arr_pre[int_synset_id] + 1:self._arr_end[int_synset_id] + 1]] + [
+                self._arr_order[int_range_start:int_range_end + 1]
+                for (int_range_start, int_range_end) in zip(
+                    self._arr_extra_starts[int_start:int_stop].tolist(),
+                    self._arr_extra_ends[int_start:int_stop].tolist())])
+
+    def descendants_counts(self,) :
+        # Returns the NumPy array of the counts of all (instance) hyponyms of
+        # every synset, directly or not, by the sizes of its ranges.
+        arr_extra_sizes = np.zeros(len(self._arr_extra_starts) + 1, dtype = np.int64)
+        np.cumsum(self._arr_extra_ends - self._arr_extra_starts + 1, out = arr_extra_sizes[1:])
+        return (self._arr_end - self._arr_pre).astype(np.int64) + (
+            arr_extra_sizes[self._arr_extra_indptr[1:]] - arr_extra_sizes[self._arr_extra_indptr[:-1]])
+
+    def ancestors(self, int_synset_id,) :
+        # Returns the sorted integer IDs of all (instance) hypernyms of the
+        # synset, directly or not.
+        set_int_ancestors = set()
+        lst_int_synsets_to_visit = [int_synset_id]
+        while len(lst_int_synsets_to_visit) > 0 :
+            for int_hypernym in self._synset_relation_graph.neighbors(
+                    lst_int_synsets_to_visit.pop(), tpl_hypernym_relation_types).tolist() :
+                if int_hypernym not in set_int_ancestors :
+                    set_int_ancestors.add(int_hypernym)
+                    lst_int_synsets_to_visit.append(int_hypernym)
+        set_int_ancestors.discard(int_synset_id)
+        return np.array(sorted(set_int_ancestors), dtype = np.int32)
+
+
+###############################################################################
+
+
+def _set_state_with_interned_strings(self, tpl_state) :
+    # "__setstate__" of the domain classes: identifier-like strings are
+    # interned again when unpickled, so that they stay shared with all
+    # their references, even across pickles (e.g. of process pool shards).
+    (_, dict_slots) = tpl_state
+    for (str_slot, value) in dict_slots.items() :
+        if str_slot in self._tpl_interned_slots and value is not None :
+            if isinstance(value, str) :
+                value = sys.intern(value)
+            elif isinstance(value, list) :
+                value = [sys.intern(str_value) for str_value in value]
+            elif isinstance(value, dict) :
+                value = {
+                    sys.intern(str_key) : value_obj
+                    for (str_key, value_obj) in value.items()}
+        setattr(self, str_slot, value)
 
 
 class LexicalEntry :
 
+    __slots__ = (
+        "_int_id", "_str_identifier", "_lemma", "_dict_senses", "_list_forms",)
+    _tpl_interned_slots = ("_str_identifier", "_dict_senses",)
+    __setstate__ = _set_state_with_interned_strings
+
     def __init__(self, str_identifier, str_written_form, str_part_of_speech) :
-        self._str_identifier = str_identifier
+        self._int_id = None # assigned by the lexicon
+        self._str_identifier = sys.intern(str_identifier)
         self._lemma = Lemma(str_written_form, str_part_of_speech)
         self._dict_senses = {}
-        self._list_forms = []
+        self._list_forms = [] # written forms of the "Form" tags
 
     def add_sense(self, sense_obj,) :
         self._dict_senses[sense_obj.identifier] = sense_obj
 
-    def add_form(self, form_obj,) :
-        self._list_forms.append(form_obj)
+    def add_form(self, str_written_form,) :
+        self._list_forms.append(str_written_form)
+
+    @property
+    def int_id(self,) :
+        return self._int_id
 
     @property
     def identifier(self,) :
@@ -1546,9 +4124,14 @@ class LexicalEntry :
 
 class Lemma :
 
+    __slots__ = (
+        "_str_written_form", "_str_part_of_speech", "_list_pronunciations",)
+    _tpl_interned_slots = ("_str_written_form", "_str_part_of_speech",)
+    __setstate__ = _set_state_with_interned_strings
+
     def __init__(self, str_written_form, str_part_of_speech) :
-        self._str_written_form = str_written_form
-        self._str_part_of_speech = str_part_of_speech
+        self._str_written_form = sys.intern(str_written_form)
+        self._str_part_of_speech = sys.intern(str_part_of_speech)
         self._list_pronunciations = []
 
     def add_pronunciation(self, pronunciation_obj,) :
@@ -1569,9 +4152,13 @@ class Lemma :
 
 class Pronunciation :
 
+    __slots__ = ("_str_text", "_str_variety",)
+    _tpl_interned_slots = ("_str_variety",)
+    __setstate__ = _set_state_with_interned_strings
+
     def __init__(self, str_text, str_variety = None,) :
         self._str_text = str_text
-        self._str_variety = str_variety
+        self._str_variety = None if str_variety is None else sys.intern(str_variety)
 
     @property
     def text(self) :
@@ -1582,32 +4169,78 @@ class Pronunciation :
         return self._str_variety
 
 
-class Form :
-
-    def __init__(self, str_written_form) :
-        self._str_written_form = str_written_form
-
-    @property
-    def written_form(self,) :
-        return self._str_written_form
-
-
 class Sense :
 
+    __slots__ = (
+        "_int_id", "_str_identifier", "_str_synset_identifier",
+        "_list_unresolved_sense_relations", "_tpl_sense_relation_target_int_ids",
+        "_bytes_sense_relation_type_codes", "_bytes_sense_relation_subtype_codes",
+        "_list_syntactic_behaviour_identifiers",)
+    _tpl_interned_slots = (
+        "_str_identifier", "_str_synset_identifier",
+        "_list_syntactic_behaviour_identifiers",)
+    __setstate__ = _set_state_with_interned_strings
+
     def __init__(self, str_identifier, str_synset_identifier) :
-        self._str_identifier = str_identifier
-        self._str_synset_identifier = str_synset_identifier
-        self._dict_sense_relations = {}
+        self._int_id = None # assigned by the lexicon
+        self._str_identifier = sys.intern(str_identifier)
+        self._str_synset_identifier = sys.intern(str_synset_identifier)
+        # The relations are added with the string identifiers of their
+        # targets, which are resolved into integer IDs by the lexicon, once
+        # all senses are known (see "Lexicon._assign_int_ids").
+        self._list_unresolved_sense_relations = []
+        self._tpl_sense_relation_target_int_ids = ()
+        self._bytes_sense_relation_type_codes = b""
+        self._bytes_sense_relation_subtype_codes = b""
         self._list_syntactic_behaviour_identifiers = [] # subcat
 
-    def add_sense_relation(self, sense_relation_obj,) :
-        self._dict_sense_relations[
-            sense_relation_obj.target_sense_identifier + "|" +
-            sense_relation_obj.sense_relation_type] = sense_relation_obj
+    def add_sense_relation(
+            self, str_target_sense_identifier, str_sense_relation_type,
+            str_sense_relation_subtype = None,) :
+        # The types are coded, when the relations are resolved, so that the
+        # new types get the same codes in all shards of a parallel loading.
+        self._list_unresolved_sense_relations.append((
+            sys.intern(str_target_sense_identifier),
+            sys.intern(str_sense_relation_type),
+            "<empty>" if str_sense_relation_subtype is None else \
+                sys.intern(str_sense_relation_subtype)))
+
+    def _resolve_sense_relations(self, dict_sense_int_ids,) :
+        # Only the last relation of a given type with a given target is kept,
+        # at the position of the first one. The relations with unknown
+        # targets are skipped, and their targets are returned.
+        dict_relations = {}
+        lst_str_unknown_target_identifiers = []
+        for (str_target_identifier, str_type, str_subtype) in \
+                self._list_unresolved_sense_relations :
+            if not str_target_identifier in dict_sense_int_ids :
+                lst_str_unknown_target_identifiers.append(str_target_identifier)
+                continue
+            dict_relations[(
+                dict_sense_int_ids[str_target_identifier],
+                sense_relation_type_code(str_type))] = sense_relation_subtype_code(str_subtype)
+        self.set_sense_relations(
+            tpl_target_int_ids = tuple(
+                int_target_id for (int_target_id, _) in dict_relations.keys()),
+            bytes_type_codes = bytes(
+                int_type_code for (_, int_type_code) in dict_relations.keys()),
+            bytes_subtype_codes = bytes(dict_relations.values()))
+        return lst_str_unknown_target_identifiers
+
+    def set_sense_relations(
+            self, tpl_target_int_ids, bytes_type_codes, bytes_subtype_codes,) :
+        self._list_unresolved_sense_relations = None
+        self._tpl_sense_relation_target_int_ids = tpl_target_int_ids
+        self._bytes_sense_relation_type_codes = bytes_type_codes
+        self._bytes_sense_relation_subtype_codes = bytes_subtype_codes
 
     def add_syntactic_behaviour(self, str_syntactic_behaviour_identifier,) :
         self._list_syntactic_behaviour_identifiers.append(
-            str_syntactic_behaviour_identifier)
+            sys.intern(str_syntactic_behaviour_identifier))
+
+    @property
+    def int_id(self,) :
+        return self._int_id
 
     @property
     def identifier(self,) :
@@ -1618,8 +4251,29 @@ class Sense :
         return self._str_synset_identifier
 
     @property
-    def dictionary_of_sense_relations(self,) :
-        return self._dict_sense_relations
+    def list_of_sense_relations(self,) :
+        return [
+            SenseRelation(
+                int_source_sense_id = self._int_id,
+                int_target_sense_id = int_target_id,
+                int_sense_relation_type_code = int_type_code,
+                int_sense_relation_subtype_code = int_subtype_code)
+            for (int_target_id, int_type_code, int_subtype_code) in zip(
+                self._tpl_sense_relation_target_int_ids,
+                self._bytes_sense_relation_type_codes,
+                self._bytes_sense_relation_subtype_codes)]
+
+    @property
+    def sense_relation_target_int_ids(self,) :
+        return self._tpl_sense_relation_target_int_ids
+
+    @property
+    def sense_relation_type_codes(self,) :
+        return self._bytes_sense_relation_type_codes
+
+    @property
+    def sense_relation_subtype_codes(self,) :
+        return self._bytes_sense_relation_subtype_codes
 
     @property
     def list_of_syntactic_behaviour_identifiers(self,) :
@@ -1628,8 +4282,12 @@ class Sense :
 
 class SyntacticBehaviour :
 
+    __slots__ = ("_str_identifier", "_str_subcategorization_frame",)
+    _tpl_interned_slots = ("_str_identifier",)
+    __setstate__ = _set_state_with_interned_strings
+
     def __init__(self, str_identifier, str_subcategorization_frame) :
-        self._str_identifier = str_identifier
+        self._str_identifier = sys.intern(str_identifier)
         self._str_subcategorization_frame = str_subcategorization_frame
 
     @property
@@ -1643,47 +4301,68 @@ class SyntacticBehaviour :
 
 class SenseRelation :
 
+    # A view of a relation stored by its source sense, as integer IDs of
+    # senses and codes of types (see "lst_sense_relation_types").
+
+    __slots__ = (
+        "_int_source_sense_id", "_int_target_sense_id",
+        "_int_sense_relation_type_code", "_int_sense_relation_subtype_code",)
+
     def __init__(
-            self, str_source_sense_identifier, str_target_sense_identifier,
-            str_sense_relation_type, str_sense_relation_subtype) :
-        self._str_source_sense_identifier = str_source_sense_identifier
-        self._str_target_sense_identifier = str_target_sense_identifier
-        self._str_sense_relation_type = str_sense_relation_type # relType
-        self._str_sense_relation_subtype = str_sense_relation_subtype # dc:type
+            self, int_source_sense_id, int_target_sense_id,
+            int_sense_relation_type_code, int_sense_relation_subtype_code) :
+        self._int_source_sense_id = int_source_sense_id
+        self._int_target_sense_id = int_target_sense_id
+        self._int_sense_relation_type_code = int_sense_relation_type_code # relType
+        self._int_sense_relation_subtype_code = int_sense_relation_subtype_code # dc:type
 
     @property
-    def source_sense_identifier(self,) :
-        return self._str_source_sense_identifier
+    def source_sense_int_id(self,) :
+        return self._int_source_sense_id
 
     @property
-    def target_sense_identifier(self,) :
-        return self._str_target_sense_identifier
+    def target_sense_int_id(self,) :
+        return self._int_target_sense_id
 
     @property
     def sense_relation_type(self,) :
-        return self._str_sense_relation_type
+        return lst_sense_relation_types[self._int_sense_relation_type_code]
 
     @property
     def sense_relation_subtype(self,) :
-        return self._str_sense_relation_subtype
+        return lst_sense_relation_subtypes[self._int_sense_relation_subtype_code]
 
 
 class Synset :
 
+    __slots__ = (
+        "_int_id", "_str_identifier", "_str_part_of_speech",
+        "_str_lexical_file_category", "_list_lexical_entries_identifiers",
+        "_list_definitions", "_list_examples", "_list_unresolved_synset_relations",
+        "_tpl_synset_relation_target_int_ids", "_bytes_synset_relation_type_codes",)
+    _tpl_interned_slots = (
+        "_str_identifier", "_str_part_of_speech", "_str_lexical_file_category",
+        "_list_lexical_entries_identifiers",)
+    __setstate__ = _set_state_with_interned_strings
+
     def __init__(
             self, str_identifier, str_part_of_speech,
             str_lexical_file_category) :
-        self._str_identifier = str_identifier
-        self._str_part_of_speech = str_part_of_speech
-        self._str_lexical_file_category = str_lexical_file_category
+        self._int_id = None # assigned by the lexicon
+        self._str_identifier = sys.intern(str_identifier)
+        self._str_part_of_speech = sys.intern(str_part_of_speech)
+        self._str_lexical_file_category = sys.intern(str_lexical_file_category)
         self._list_lexical_entries_identifiers = []
-        self._list_definitions = []
-        self._list_examples = []
-        self._dict_synset_relations = {}
+        self._list_definitions = [] # texts of the "Definition" tags
+        self._list_examples = [] # texts of the "Example" tags
+        # Resolved like the relations of senses.
+        self._list_unresolved_synset_relations = []
+        self._tpl_synset_relation_target_int_ids = ()
+        self._bytes_synset_relation_type_codes = b""
 
     def add_lexical_entry_identifier(self, str_lexical_entry_identifier,) :
         self._list_lexical_entries_identifiers.append(
-            str_lexical_entry_identifier)
+            sys.intern(str_lexical_entry_identifier))
 
     def add_definition(self, str_definition,) :
         self._list_definitions.append(str_definition)
@@ -1691,10 +4370,43 @@ class Synset :
     def add_example(self, str_example,) :
         self._list_examples.append(str_example)
 
-    def add_synset_relation(self, synset_relation_obj,) :
-        self._dict_synset_relations[
-            synset_relation_obj.target_synset_identifier + "|" +
-            synset_relation_obj.synset_relation_type] = synset_relation_obj
+    def add_synset_relation(
+            self, str_target_synset_identifier, str_synset_relation_type,) :
+        # The types are coded, when the relations are resolved (see
+        # "Sense.add_sense_relation").
+        self._list_unresolved_synset_relations.append((
+            sys.intern(str_target_synset_identifier),
+            sys.intern(str_synset_relation_type)))
+
+    def _resolve_synset_relations(self, dict_synset_int_ids,) :
+        # Only one relation of a given type with a given target is kept. The
+        # relations with unknown targets are skipped, and their targets are
+        # returned.
+        dict_relations = {}
+        lst_str_unknown_target_identifiers = []
+        for (str_target_identifier, str_type) in \
+                self._list_unresolved_synset_relations :
+            if not str_target_identifier in dict_synset_int_ids :
+                lst_str_unknown_target_identifiers.append(str_target_identifier)
+                continue
+            dict_relations[(
+                dict_synset_int_ids[str_target_identifier],
+                synset_relation_type_code(str_type))] = None
+        self.set_synset_relations(
+            tpl_target_int_ids = tuple(
+                int_target_id for (int_target_id, _) in dict_relations.keys()),
+            bytes_type_codes = bytes(
+                int_type_code for (_, int_type_code) in dict_relations.keys()))
+        return lst_str_unknown_target_identifiers
+
+    def set_synset_relations(self, tpl_target_int_ids, bytes_type_codes,) :
+        self._list_unresolved_synset_relations = None
+        self._tpl_synset_relation_target_int_ids = tpl_target_int_ids
+        self._bytes_synset_relation_type_codes = bytes_type_codes
+
+    @property
+    def int_id(self) :
+        return self._int_id
 
     @property
     def identifier(self) :
@@ -1721,49 +4433,52 @@ class Synset :
         return self._list_examples
 
     @property
-    def dictionary_of_synset_relations(self) :
-        return self._dict_synset_relations
-
-
-class Definition :
-
-    def __init__(self, str_text) :
-        self._str_text = str_text
+    def list_of_synset_relations(self) :
+        return [
+            SynsetRelation(
+                int_source_synset_id = self._int_id,
+                int_target_synset_id = int_target_id,
+                int_synset_relation_type_code = int_type_code)
+            for (int_target_id, int_type_code) in zip(
+                self._tpl_synset_relation_target_int_ids,
+                self._bytes_synset_relation_type_codes)]
 
     @property
-    def text(self) :
-        return self._str_text
-
-
-class Example :
-    def __init__(self, str_text) :
-        self._str_text = str_text
+    def synset_relation_target_int_ids(self) :
+        return self._tpl_synset_relation_target_int_ids
 
     @property
-    def text(self) :
-        return self._str_text
+    def synset_relation_type_codes(self) :
+        return self._bytes_synset_relation_type_codes
 
 
 class SynsetRelation :
 
+    # A view of a relation stored by its source synset, as integer IDs of
+    # synsets and a code of type (see "lst_synset_relation_types").
+
+    __slots__ = (
+        "_int_source_synset_id", "_int_target_synset_id",
+        "_int_synset_relation_type_code",)
+
     def __init__(
-            self, str_source_synset_identifier, str_target_synset_identifier,
-            str_synset_relation_type) :
-        self._str_source_synset_identifier = str_source_synset_identifier
-        self._str_target_synset_identifier = str_target_synset_identifier
-        self._str_synset_relation_type = str_synset_relation_type # relType
+            self, int_source_synset_id, int_target_synset_id,
+            int_synset_relation_type_code) :
+        self._int_source_synset_id = int_source_synset_id
+        self._int_target_synset_id = int_target_synset_id
+        self._int_synset_relation_type_code = int_synset_relation_type_code # relType
 
     @property
-    def source_synset_identifier(self,) :
-        return self._str_source_synset_identifier
+    def source_synset_int_id(self,) :
+        return self._int_source_synset_id
 
     @property
-    def target_synset_identifier(self,) :
-        return self._str_target_synset_identifier
+    def target_synset_int_id(self,) :
+        return self._int_target_synset_id
 
     @property
     def synset_relation_type(self,) :
-        return self._str_synset_relation_type
+        return lst_synset_relation_types[self._int_synset_relation_type_code]
 
 
 ###############################################################################
@@ -1771,9 +4486,19 @@ class SynsetRelation :
 
 def main() -> int :
 
-    lexicon = Lexicon.load_from_xml(
-        str_file_path = "data_xml_wordnet",
-        str_file_name = "wn")
+    if INT_XML_LOADING_PROCESSES > 1 :
+        lexicon = Lexicon.load_from_xml_in_parallel(
+            str_file_path = DIR_PATH_DATA_XML_WORDNET,
+            str_file_name = FILE_NAME_DATA_XML_WORDNET,
+            str_file_extension = FILE_EXT_DATA_XML_WORDNET,
+            int_processes = INT_XML_LOADING_PROCESSES,
+            bool_print_throughput = True)
+    else :
+        lexicon = Lexicon.load_from_xml(
+            str_file_path = DIR_PATH_DATA_XML_WORDNET,
+            str_file_name = FILE_NAME_DATA_XML_WORDNET,
+            str_file_extension = FILE_EXT_DATA_XML_WORDNET,
+            bool_print_throughput = True)
     lexicon.print_summary()
 
     print()
@@ -1788,6 +4513,15 @@ def main() -> int :
         str_file_name = FILE_NAME_DATA_PKL_XZ_WORDNET)
 
     print(type(lexicon1))
+
+    lexicon1.save_to_mmap(
+        str_file_path = DIR_PATH_DATA_MMAP_WORDNET,
+        str_file_name = FILE_NAME_DATA_MMAP_WORDNET)
+    lexicon2 = Lexicon.load_from_mmap(
+        str_file_path = DIR_PATH_DATA_MMAP_WORDNET,
+        str_file_name = FILE_NAME_DATA_MMAP_WORDNET)
+
+    print(type(lexicon2))
     return 0
 
 
@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2025 James James Johnson. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# =============================================================================
+
+
+import math
+import functools
+import numpy as np
+from wn_repository import tpl_hypernym_relation_types
+
+
+###############################################################################
+# Semantic similarity of synsets in the hypernym hierarchy.
+#
+# The hypernym hierarchy consists of the "hypernym" and "instance_hypernym"
+# relations. The min (max) depth of a synset is the length of its shortest
+# (longest) hypernym path to a root, i.e. a synset without hypernyms (0 for
+# the roots). The lowest common hypernyms of two synsets are their common
+# hypernyms (including the synsets themselves) with the highest max depth,
+# and the shortest path between them passes through one of their common
+# hypernyms. The measures follow NLTK's WordNet module: Wu-Palmer picks the
+# lowest common hypernym by the min depth (the first synset itself, if it is
+# one of them, or else the one with the lowest ID), counts its max depth and
+# the shortest path distances of the synsets to it; Leacock-Chodorow counts
+# the max depth of the part of speech (plus 1 for the simulated root). The
+# synsets other than nouns get a simulated root above all roots by default,
+# which is a hypernym of every synset, one step above its farthest hypernym,
+# so that the verb hierarchies (and the adjectives without any) are joined.
+# The depths of all synsets are computed at once, and the distances of every
+# synset to all its hypernyms are computed on demand and kept in an LRU cache,
+# so that a pair of synsets is compared by a few dictionary operations only.
+#
+# Without a corpus, the information content (IC) of a synset is intrinsic,
+# i.e. computed from the hierarchy itself (Seco, Veale and Hayes, 2004):
+# "1 - log(hyponyms + 1) / log(synsets)", where the hyponyms are counted
+# directly or not, and the synsets are counted per part of speech, so that
+# the leaves have 1 and a root above all synsets has 0. Optionally, the depth
+# is weighted in (Zhou, Wang and Gu, 2008) with "log(max depth + 1) /
+# log(max depth of the part of speech + 1)". The ICs of all synsets are
+# computed at once from the interval labels of the hypernym hierarchy, and
+# the most informative common hypernym of two synsets is their common
+# hypernym with the highest IC.
+###############################################################################
+
+
+INT_SIMILARITY_CACHE_SIZE = 65536
+
+tpl_similarity_measures = (
+    "path", "wu_palmer", "leacock_chodorow", "resnik", "lin", "jiang_conrath",)
+
+# The ID of the simulated root, at which the depths lists end with its depths.
+INT_SIMULATED_ROOT_ID = -1
+
+
+class SynsetSimilarity :
+
+    def __init__(
+            self, lexicon, int_cache_size = INT_SIMILARITY_CACHE_SIZE,
+            flt_information_content_depth_weight = 0.,) :
+        if not (0. <= flt_information_content_depth_weight <= 1.) :
+            raise ValueError('Error: expecting the depth weight between 0 and 1.')
+        self._lexicon = lexicon
+        int_count = lexicon.synset_relation_graph.count_of_nodes
+        (arr_sources, arr_targets) = lexicon.synset_relation_graph.edges(
+            tpl_hypernym_relation_types)
+        self._lst_lst_hypernyms = [[] for _ in range(int_count)]
+        lst_lst_hyponyms = [[] for _ in range(int_count)]
+        for (int_synset_id, int_hypernym_id) in zip(arr_sources.tolist(), arr_targets.tolist()) :
+            if int_synset_id != int_hypernym_id :
+                self._lst_lst_hypernyms[int_synset_id].append(int_hypernym_id)
+                lst_lst_hyponyms[int_hypernym_id].append(int_synset_id)
+        # The min depths are found by a breadth-first search from all roots
+        # (the synsets on cycles without roots, if any, get 0).
+        lst_int_roots = [
+            int_synset_id for int_synset_id in range(int_count)
+            if len(self._lst_lst_hypernyms[int_synset_id]) == 0]
+        lst_int_depths = [-1] * int_count
+        lst_int_level = lst_int_roots
+        int_depth = 0
+        while len(lst_int_level) > 0 :
+            for int_synset_id in lst_int_level :
+                lst_int_depths[int_synset_id] = int_depth
+            lst_int_next_level = []
+            for int_synset_id in lst_int_level :
+                for int_hyponym_id in lst_lst_hyponyms[int_synset_id] :
+                    if lst_int_depths[int_hyponym_id] < 0 :
+                        lst_int_depths[int_hyponym_id] = int_depth + 1
+                        lst_int_next_level.append(int_hyponym_id)
+            lst_int_level = lst_int_next_level
+            int_depth += 1
+        self._arr_min_depths = np.maximum(np.array(lst_int_depths, dtype = np.int32), 0)
+        # The max depths are found in a topological order from all roots: a
+        # synset is reached after all its hypernyms (the synsets on or under
+        # cycles, if any, keep their min depths).
+        lst_int_depths = self._arr_min_depths.tolist()
+        lst_int_hypernyms_left_counts = [
+            len(lst_int_hypernyms) for lst_int_hypernyms in self._lst_lst_hypernyms]
+        lst_int_level = lst_int_roots
+        while len(lst_int_level) > 0 :
+            lst_int_next_level = []
+            for int_synset_id in lst_int_level :
+                for int_hyponym_id in lst_lst_hyponyms[int_synset_id] :
+                    lst_int_depths[int_hyponym_id] = max(
+                        lst_int_depths[int_hyponym_id], lst_int_depths[int_synset_id] + 1)
+                    lst_int_hypernyms_left_counts[int_hyponym_id] -= 1
+                    if lst_int_hypernyms_left_counts[int_hyponym_id] == 0 :
+                        lst_int_next_level.append(int_hyponym_id)
+            lst_int_level = lst_int_next_level
+        self._arr_max_depths = np.array(lst_int_depths, dtype = np.int32)
+        # The simulated root (see "INT_SIMULATED_ROOT_ID") has the depths 0.
+        self._lst_int_min_depths = self._arr_min_depths.tolist() + [0]
+        self._lst_int_max_depths = self._arr_max_depths.tolist() + [0]
+        self._dict_part_of_speech_to_max_depth = None
+        self._arr_information_contents = self._compute_information_contents(
+            flt_information_content_depth_weight)
+        self._lst_flt_information_contents = self._arr_information_contents.tolist()
+        self._hypernym_distances = functools.lru_cache(maxsize = int_cache_size)(
+            self._compute_hypernym_distances)
+
+    @property
+    def lexicon(self,) :
+        return self._lexicon
+
+    @property
+    def min_depths(self,) :
+        # NumPy array of the min depths of all synsets, by their integer IDs.
+        return self._arr_min_depths
+
+    def min_depth(self, synset_obj,) :
+        return self._lst_int_min_depths[synset_obj.int_id]
+
+    @property
+    def max_depths(self,) :
+        # NumPy array of the max depths of all synsets, by their integer IDs.
+        return self._arr_max_depths
+
+    def max_depth(self, synset_obj,) :
+        return self._lst_int_max_depths[synset_obj.int_id]
+
+    def part_of_speech_max_depth(self, str_part_of_speech,) :
+        # The max depth of the deepest synset with the given part of speech.
+        if self._dict_part_of_speech_to_max_depth is None :
+            self._dict_part_of_speech_to_max_depth = {}
+            for synset_obj in self._lexicon.list_of_synsets :
+                self._dict_part_of_speech_to_max_depth[synset_obj.part_of_speech] = max(
+                    self._dict_part_of_speech_to_max_depth.get(synset_obj.part_of_speech, 0),
+                    self._lst_int_max_depths[synset_obj.int_id])
+        return self._dict_part_of_speech_to_max_depth.get(str_part_of_speech, 0)
+
+    def needs_root(str_part_of_speech) :
+        # Only the nouns have a single root.
+        return str_part_of_speech != "n"
+
+    def _compute_information_contents(self, flt_depth_weight) :
+        arr_parts_of_speech = np.array(
+            [synset_obj.part_of_speech for synset_obj in self._lexicon.list_of_synsets], dtype = object)
+        arr_hyponyms_counts = self._lexicon.hypernym_hierarchy.descendants_counts()
+        arr_information_contents = np.zeros(len(arr_parts_of_speech), dtype = np.float64)
+        for str_part_of_speech in np.unique(arr_parts_of_speech).tolist() :
+            arr_bool_mask = arr_parts_of_speech == str_part_of_speech
+            # Single synsets (and single levels for the depths) carry all the
+            # information there is.
+            int_count = int(np.count_nonzero(arr_bool_mask))
+            arr_hyponyms_information_contents = np.ones(int_count) if int_count <= 1 else \
+                1. - np.log(np.minimum(arr_hyponyms_counts[arr_bool_mask], int_count - 1) + 1.) / \
+                np.log(int_count)
+            int_max_depth = self.part_of_speech_max_depth(str_part_of_speech)
+            arr_depths_information_contents = np.ones(int_count) if int_max_depth == 0 else \
+                np.log(self._arr_max_depths[arr_bool_mask] + 1.) / np.log(int_max_depth + 1.)
+            arr_information_contents[arr_bool_mask] = \
+                (1. - flt_depth_weight) * arr_hyponyms_information_contents + \
+                flt_depth_weight * arr_depths_information_contents
+        return arr_information_contents
+
+    @property
+    def information_contents(self,) :
+        # NumPy array of the intrinsic ICs of all synsets, by their integer IDs.
+        return self._arr_information_contents
+
+    def information_content(self, synset_obj,) :
+        return self._lst_flt_information_contents[synset_obj.int_id]
+
+    def _compute_hypernym_distances(self, int_synset_id) :
+        dict_distances = {int_synset_id : 0}
+        lst_int_level = [int_synset_id]
+        int_distance = 0
+        while len(lst_int_level) > 0 :
+            int_distance += 1
+            lst_int_next_level = []
+            for int_id in lst_int_level :
+                for int_hypernym_id in self._lst_lst_hypernyms[int_id] :
+                    if int_hypernym_id not in dict_distances :
+                        dict_distances[int_hypernym_id] = int_distance
+                        lst_int_next_level.append(int_hypernym_id)
+            lst_int_level = lst_int_next_level
+        return dict_distances
+
+    def hypernym_distances(self, synset_obj,) :
+        # Returns the (cached, so read-only) "integer ID -> distance"
+        # dictionary of the synset itself and all its hypernyms.
+        return self._hypernym_distances(synset_obj.int_id)
+
+    def _root_distance(dict_distances) :
+        # The distance to the simulated root, one step above the farthest
+        # hypernym.
+        return max(dict_distances.values()) + 1
+
+    def _lowest_common_hypernym_ids(
+            self, dict_distances, dict_other_distances, bool_simulate_root, bool_use_min_depth) :
+        set_int_common_ids = dict_distances.keys() & dict_other_distances.keys()
+        if bool_simulate_root :
+            set_int_common_ids.add(INT_SIMULATED_ROOT_ID)
+        if len(set_int_common_ids) == 0 :
+            return []
+        lst_int_depths = self._lst_int_min_depths if bool_use_min_depth else self._lst_int_max_depths
+        int_max_depth = max(lst_int_depths[int_id] for int_id in set_int_common_ids)
+        return sorted(
+            int_id for int_id in set_int_common_ids
+            if lst_int_depths[int_id] == int_max_depth)
+
+    def lowest_common_hypernyms(self, synset_obj, other_synset_obj, bool_use_min_depth = False,) :
+        # The common hypernyms with the highest max (or min) depth, by their
+        # integer IDs.
+        return [
+            self._lexicon.list_of_synsets[int_id] for int_id in
+            self._lowest_common_hypernym_ids(
+                self._hypernym_distances(synset_obj.int_id),
+                self._hypernym_distances(other_synset_obj.int_id),
+                False, bool_use_min_depth)]
+
+    def _shortest_path_distance(self, dict_distances, dict_other_distances, bool_simulate_root) :
+        if len(dict_other_distances) < len(dict_distances) :
+            (dict_distances, dict_other_distances) = (dict_other_distances, dict_distances)
+        int_min_distance = None
+        for (int_id, int_distance) in dict_distances.items() :
+            int_other_distance = dict_other_distances.get(int_id)
+            if int_other_distance is not None and (
+                    int_min_distance is None or int_distance + int_other_distance < int_min_distance) :
+                int_min_distance = int_distance + int_other_distance
+        if bool_simulate_root :
+            int_root_distance = SynsetSimilarity._root_distance(dict_distances) + \
+                SynsetSimilarity._root_distance(dict_other_distances)
+            if int_min_distance is None or int_root_distance < int_min_distance :
+                int_min_distance = int_root_distance
+        return int_min_distance
+
+    def shortest_path_distance(self, synset_obj, other_synset_obj, bool_simulate_root = False,) :
+        # The count of hypernym relations on the shortest path between the
+        # synsets through a common hypernym (or the simulated root), or None
+        # without one.
+        return self._shortest_path_distance(
+            self._hypernym_distances(synset_obj.int_id),
+            self._hypernym_distances(other_synset_obj.int_id),
+            bool_simulate_root)
+
+    def path_similarity(self, synset_obj, other_synset_obj, bool_simulate_root = True,) :
+        # "1 / (shortest path distance + 1)", or None without a common hypernym.
+        int_distance = self.shortest_path_distance(
+            synset_obj, other_synset_obj, bool_simulate_root and (
+                SynsetSimilarity.needs_root(synset_obj.part_of_speech) or
+                SynsetSimilarity.needs_root(other_synset_obj.part_of_speech)))
+        return None if int_distance is None else 1. / (int_distance + 1)
+
+    def wu_palmer_similarity(self, synset_obj, other_synset_obj, bool_simulate_root = True,) :
+        # "2 * depth(lcs) / (depth(lcs) + distance to lcs) summed over the
+        # synsets", where "depth(lcs)" is the max depth of the lowest common
+        # hypernym by the min depth plus 1, or None without one.
+        bool_simulate_root = bool_simulate_root and (
+            SynsetSimilarity.needs_root(synset_obj.part_of_speech) or
+            SynsetSimilarity.needs_root(other_synset_obj.part_of_speech))
+        dict_distances = self._hypernym_distances(synset_obj.int_id)
+        dict_other_distances = self._hypernym_distances(other_synset_obj.int_id)
+        lst_int_lcs_ids = self._lowest_common_hypernym_ids(
+            dict_distances, dict_other_distances, bool_simulate_root, True)
+        if len(lst_int_lcs_ids) == 0 :
+            return None
+        int_lcs_id = synset_obj.int_id if synset_obj.int_id in lst_int_lcs_ids else lst_int_lcs_ids[0]
+        int_lcs_depth = self._lst_int_max_depths[int_lcs_id] + 1
+        return 2. * int_lcs_depth / (
+            self._lowest_common_hypernym_distance(synset_obj.int_id, int_lcs_id) +
+            self._lowest_common_hypernym_distance(other_synset_obj.int_id, int_lcs_id) +
+            2 * int_lcs_depth)
+
+    def _lowest_common_hypernym_distance(self, int_synset_id, int_lcs_id) :
+        # The shortest path distance of a synset to its common hypernym, which
+        # may pass through a hypernym of both (the simulated root would never
+        # shorten it).
+        if int_lcs_id == INT_SIMULATED_ROOT_ID :
+            return SynsetSimilarity._root_distance(self._hypernym_distances(int_synset_id))
+        return self._shortest_path_distance(
+            self._hypernym_distances(int_synset_id), self._hypernym_distances(int_lcs_id), False)
+
+    def _leacock_chodorow_depth(self, str_part_of_speech) :
+        # The max depth of the part of speech plus 1 for the simulated root,
+        # whether or not it is simulated for the distance.
+        return self.part_of_speech_max_depth(str_part_of_speech) + (
+            1 if SynsetSimilarity.needs_root(str_part_of_speech) else 0)
+
+    def leacock_chodorow_similarity(self, synset_obj, other_synset_obj, bool_simulate_root = True,) :
+        # "-log((shortest path distance + 1) / (2 * depth))" for the synsets
+        # with the same part of speech, where "depth" is the max depth of the
+        # part of speech (plus 1 with a simulated root), or None without a
+        # common hypernym or for the depth 0.
+        if synset_obj.part_of_speech != other_synset_obj.part_of_speech :
+            raise ValueError(
+                'Error: expecting synsets with the same part of speech, got "{0}" and "{1}".'.format(
+                    synset_obj.part_of_speech, other_synset_obj.part_of_speech))
+        int_depth = self._leacock_chodorow_depth(synset_obj.part_of_speech)
+        int_distance = self.shortest_path_distance(
+            synset_obj, other_synset_obj,
+            bool_simulate_root and SynsetSimilarity.needs_root(synset_obj.part_of_speech))
+        if int_distance is None or int_depth == 0 :
+            return None
+        return -math.log((int_distance + 1) / (2. * int_depth))
+
+    def _most_informative_common_hypernym_id(self, synset_obj, other_synset_obj) :
+        set_int_common_ids = self._hypernym_distances(synset_obj.int_id).keys() & \
+            self._hypernym_distances(other_synset_obj.int_id).keys()
+        if len(set_int_common_ids) == 0 :
+            return None
+        return min(
+            set_int_common_ids,
+            key = lambda int_id : (-self._lst_flt_information_contents[int_id], int_id))
+
+    def most_informative_common_hypernym(self, synset_obj, other_synset_obj,) :
+        int_id = self._most_informative_common_hypernym_id(synset_obj, other_synset_obj)
+        return None if int_id is None else self._lexicon.list_of_synsets[int_id]
+
+    def resnik_similarity(self, synset_obj, other_synset_obj,) :
+        # "IC(mica)", where "mica" is the most informative common hypernym,
+        # or None without one.
+        int_mica_id = self._most_informative_common_hypernym_id(synset_obj, other_synset_obj)
+        if int_mica_id is None :
+            return None
+        return self._lst_flt_information_contents[int_mica_id]
+
+    def lin_similarity(self, synset_obj, other_synset_obj,) :
+        # "2 * IC(mica) / (IC(synset) + IC(other synset))" (1 for two roots
+        # above all synsets), or None without a common hypernym.
+        int_mica_id = self._most_informative_common_hypernym_id(synset_obj, other_synset_obj)
+        if int_mica_id is None :
+            return None
+        flt_information_contents_sum = self._lst_flt_information_contents[synset_obj.int_id] + \
+            self._lst_flt_information_contents[other_synset_obj.int_id]
+        if flt_information_contents_sum == 0. :
+            return 1.
+        return 2. * self._lst_flt_information_contents[int_mica_id] / flt_information_contents_sum
+
+    def jiang_conrath_similarity(self, synset_obj, other_synset_obj,) :
+        # "1 / (IC(synset) + IC(other synset) - 2 * IC(mica))" (infinity for
+        # the distance 0, e.g. of a synset to itself), or None without a common
+        # hypernym.
+        int_mica_id = self._most_informative_common_hypernym_id(synset_obj, other_synset_obj)
+        if int_mica_id is None :
+            return None
+        flt_distance = self._lst_flt_information_contents[synset_obj.int_id] + \
+            self._lst_flt_information_contents[other_synset_obj.int_id] - \
+            2. * self._lst_flt_information_contents[int_mica_id]
+        return math.inf if flt_distance <= 0. else 1. / flt_distance
+
+    ###########################################################################
+    # Similarity matrices: the hypernyms of both lists of synsets are grouped
+    # by their integer IDs, and every common hypernym updates the block of
+    # the matrix of the synsets under it at once, so that the work is spread
+    # over NumPy operations on the blocks rather than over pairs of synsets.
+
+    def _hypernyms_arrays(self, lst_synsets) :
+        # Returns the IDs of the hypernyms of the synsets (including the
+        # synsets themselves), sorted, the synsets' rows and the distances.
+        lst_int_ids = []
+        lst_int_rows = []
+        lst_int_distances = []
+        for (int_row, synset_obj) in enumerate(lst_synsets) :
+            dict_distances = self._hypernym_distances(synset_obj.int_id)
+            lst_int_ids.extend(dict_distances.keys())
+            lst_int_rows.extend([int_row] * len(dict_distances))
+            lst_int_distances.extend(dict_distances.values())
+        arr_ids = np.array(lst_int_ids, dtype = np.int32)
+        arr_order = np.argsort(arr_ids, kind = "stable")
+        return (
+            arr_ids[arr_order],
+            np.array(lst_int_rows, dtype = np.int32)[arr_order],
+            np.array(lst_int_distances, dtype = np.int32)[arr_order],)
+
+    def _common_hypernyms_blocks(self, lst_synsets_a, lst_synsets_b) :
+        # Yields the ID of every common hypernym, and the rows of the synsets
+        # under it in both lists with their distances to it.
+        (arr_ids_a, arr_rows_a, arr_distances_a) = self._hypernyms_arrays(lst_synsets_a)
+        (arr_ids_b, arr_rows_b, arr_distances_b) = self._hypernyms_arrays(lst_synsets_b)
+        arr_common_ids = np.intersect1d(arr_ids_a, arr_ids_b)
+        arr_starts_a = np.searchsorted(arr_ids_a, arr_common_ids, side = "left")
+        arr_ends_a = np.searchsorted(arr_ids_a, arr_common_ids, side = "right")
+        arr_starts_b = np.searchsorted(arr_ids_b, arr_common_ids, side = "left")
+        arr_ends_b = np.searchsorted(arr_ids_b, arr_common_ids, side = "right")
+        for (int_id, int_start_a, int_end_a, int_start_b, int_end_b) in zip(
+                arr_common_ids.tolist(), arr_starts_a.tolist(), arr_ends_a.tolist(),
+                arr_starts_b.tolist(), arr_ends_b.tolist()) :
+            yield (
+                int_id,
+                arr_rows_a[int_start_a:int_end_a], arr_distances_a[int_start_a:int_end_a],
+                arr_rows_b[int_start_b:int_end_b], arr_distances_b[int_start_b:int_end_b],)
+
+    def _root_distances(self, lst_synsets) :
+        return np.array(
+            [SynsetSimilarity._root_distance(self._hypernym_distances(synset_obj.int_id))
+             for synset_obj in lst_synsets], dtype = np.int32)
+
+    def _needs_root_mask(lst_synsets) :
+        return np.array(
+            [SynsetSimilarity.needs_root(synset_obj.part_of_speech) for synset_obj in lst_synsets],
+            dtype = bool)
+
+    def _shortest_path_distances_matrix(self, lst_synsets_a, lst_synsets_b, arr_bool_root) :
+        # Returns the matrix of the shortest path distances, with -1 for the
+        # pairs without a common hypernym, where the pairs in "arr_bool_root"
+        # also have the simulated root.
+        int_no_path = np.iinfo(np.int32).max
+        arr_distances = np.full(
+            (len(lst_synsets_a), len(lst_synsets_b)), int_no_path, dtype = np.int32)
+        for (_, arr_rows_a, arr_distances_a, arr_rows_b, arr_distances_b) in \
+                self._common_hypernyms_blocks(lst_synsets_a, lst_synsets_b) :
+            tpl_block = np.ix_(arr_rows_a, arr_rows_b)
+            arr_distances[tpl_block] = np.minimum(
+                arr_distances[tpl_block], arr_distances_a[:, None] + arr_distances_b[None, :])
+        if arr_bool_root.any() :
+            arr_root_distances = self._root_distances(lst_synsets_a)[:, None] + \
+                self._root_distances(lst_synsets_b)[None, :]
+            arr_distances = np.where(
+                arr_bool_root, np.minimum(arr_distances, arr_root_distances), arr_distances)
+        arr_distances[arr_distances == int_no_path] = -1
+        return arr_distances
+
+    def similarity_matrix(
+            self, lst_synsets_a, lst_synsets_b, str_measure = "path", bool_simulate_root = True,) :
+        # Returns the NumPy matrix of the similarities (see
+        # "tpl_similarity_measures") of every synset in "lst_synsets_a" to
+        # every synset in "lst_synsets_b", with NaN, where the similarity is
+        # None (or not defined, e.g. for different parts of speech).
+        if str_measure not in tpl_similarity_measures :
+            raise ValueError('Error: unexpected similarity measure "{0}".'.format(str_measure))
+        arr_similarities = np.full((len(lst_synsets_a), len(lst_synsets_b)), np.nan)
+        arr_bool_needs_root_a = SynsetSimilarity._needs_root_mask(lst_synsets_a)
+        arr_bool_needs_root_b = SynsetSimilarity._needs_root_mask(lst_synsets_b)
+        if str_measure == "wu_palmer" :
+            # The blocks of the common hypernyms deeper by the min depth (and
+            # then of the lower IDs, the simulated root first) overwrite the
+            # others, so that every pair ends up with its first lowest common
+            # hypernym. Then the first synsets, which are such hypernyms
+            # themselves, take their place. The distances to them are found
+            # once per distinct synset and hypernym.
+            arr_bool_root = bool_simulate_root & (
+                arr_bool_needs_root_a[:, None] | arr_bool_needs_root_b[None, :])
+            lst_tpl_blocks = list(self._common_hypernyms_blocks(lst_synsets_a, lst_synsets_b))
+            lst_tpl_blocks.sort(
+                key = lambda tpl_block : (self._lst_int_min_depths[tpl_block[0]], -tpl_block[0]))
+            int_no_lcs_id = INT_SIMULATED_ROOT_ID - 1
+            arr_lcs_ids = np.full(arr_similarities.shape, int_no_lcs_id, dtype = np.int32)
+            arr_lcs_min_depths = np.full(arr_similarities.shape, -1, dtype = np.int32)
+            arr_lcs_ids[arr_bool_root] = INT_SIMULATED_ROOT_ID
+            arr_lcs_min_depths[arr_bool_root] = 0
+            for (int_id, arr_rows_a, _, arr_rows_b, _) in lst_tpl_blocks :
+                tpl_block = np.ix_(arr_rows_a, arr_rows_b)
+                if self._lst_int_min_depths[int_id] == 0 :
+                    # The simulated root comes first among the roots.
+                    arr_bool_block = arr_lcs_ids[tpl_block] != INT_SIMULATED_ROOT_ID
+                    arr_lcs_ids[tpl_block] = np.where(arr_bool_block, int_id, INT_SIMULATED_ROOT_ID)
+                else :
+                    arr_lcs_ids[tpl_block] = int_id
+                arr_lcs_min_depths[tpl_block] = self._lst_int_min_depths[int_id]
+            dict_id_to_block = {tpl_block[0] : tpl_block for tpl_block in lst_tpl_blocks}
+            for (int_row_a, synset_obj) in enumerate(lst_synsets_a) :
+                tpl_block = dict_id_to_block.get(synset_obj.int_id)
+                if tpl_block is not None :
+                    arr_rows_b = tpl_block[3]
+                    arr_rows_b = arr_rows_b[arr_lcs_min_depths[int_row_a, arr_rows_b] ==
+                        self._lst_int_min_depths[synset_obj.int_id]]
+                    arr_lcs_ids[int_row_a, arr_rows_b] = synset_obj.int_id
+            arr_bool_lcs = arr_lcs_ids != int_no_lcs_id
+            (arr_rows_a, arr_rows_b) = np.nonzero(arr_bool_lcs)
+            arr_lcs_ids = arr_lcs_ids[arr_bool_lcs]
+            arr_lcs_depths = np.array(self._lst_int_max_depths, dtype = np.float64)[arr_lcs_ids] + 1.
+            arr_distances_sums = np.zeros(len(arr_lcs_ids), dtype = np.float64)
+            for (lst_synsets, arr_rows) in ((lst_synsets_a, arr_rows_a), (lst_synsets_b, arr_rows_b),) :
+                arr_synset_ids = np.array(
+                    [synset_obj.int_id for synset_obj in lst_synsets], dtype = np.int32)[arr_rows]
+                # The pairs are keyed by single integers, with the simulated
+                # root at 0.
+                int_key_base = len(self._lst_int_max_depths)
+                (arr_keys, arr_inverse) = np.unique(
+                    arr_synset_ids.astype(np.int64) * int_key_base + (arr_lcs_ids + 1),
+                    return_inverse = True)
+                arr_distances = np.array(
+                    [self._lowest_common_hypernym_distance(
+                        int_key // int_key_base, int_key % int_key_base - 1)
+                     for int_key in arr_keys.tolist()], dtype = np.float64)
+                arr_distances_sums += arr_distances[arr_inverse.reshape(-1)]
+            arr_similarities[arr_bool_lcs] = 2. * arr_lcs_depths / (
+                arr_distances_sums + 2. * arr_lcs_depths)
+            return arr_similarities
+        if str_measure in ("resnik", "lin", "jiang_conrath",) :
+            # The blocks of the more informative common hypernyms overwrite
+            # the others, like for "wu_palmer".
+            lst_tpl_blocks = sorted(
+                self._common_hypernyms_blocks(lst_synsets_a, lst_synsets_b),
+                key = lambda tpl_block : (
+                    self._lst_flt_information_contents[tpl_block[0]], -tpl_block[0]))
+            for (int_id, arr_rows_a, _, arr_rows_b, _) in lst_tpl_blocks :
+                arr_similarities[np.ix_(arr_rows_a, arr_rows_b)] = \
+                    self._lst_flt_information_contents[int_id]
+            if str_measure == "resnik" :
+                return arr_similarities
+            arr_information_contents_a = self._arr_information_contents[
+                [synset_obj.int_id for synset_obj in lst_synsets_a]]
+            arr_information_contents_b = self._arr_information_contents[
+                [synset_obj.int_id for synset_obj in lst_synsets_b]]
+            arr_information_contents_sums = \
+                arr_information_contents_a[:, None] + arr_information_contents_b[None, :]
+            with np.errstate(divide = "ignore", invalid = "ignore") :
+                if str_measure == "lin" :
+                    arr_similarities = np.where(
+                        arr_information_contents_sums == 0.,
+                        np.where(np.isnan(arr_similarities), np.nan, 1.),
+                        2. * arr_similarities / arr_information_contents_sums)
+                else :
+                    arr_distances = arr_information_contents_sums - 2. * arr_similarities
+                    arr_similarities = np.where(
+                        arr_distances <= 0., np.inf, 1. / arr_distances)
+                    arr_similarities[np.isnan(arr_distances)] = np.nan
+            return arr_similarities
+        if str_measure == "path" :
+            arr_distances = self._shortest_path_distances_matrix(
+                lst_synsets_a, lst_synsets_b, bool_simulate_root & (
+                    arr_bool_needs_root_a[:, None] | arr_bool_needs_root_b[None, :]))
+            arr_bool_path = arr_distances >= 0
+            arr_similarities[arr_bool_path] = 1. / (arr_distances[arr_bool_path] + 1)
+        elif str_measure == "leacock_chodorow" :
+            arr_distances = self._shortest_path_distances_matrix(
+                lst_synsets_a, lst_synsets_b, np.broadcast_to(
+                    bool_simulate_root & arr_bool_needs_root_a[:, None],
+                    (len(lst_synsets_a), len(lst_synsets_b))))
+            lst_str_parts_of_speech_a = [synset_obj.part_of_speech for synset_obj in lst_synsets_a]
+            lst_str_parts_of_speech_b = [synset_obj.part_of_speech for synset_obj in lst_synsets_b]
+            arr_depths = np.array(
+                [self._leacock_chodorow_depth(str_part_of_speech)
+                 for str_part_of_speech in lst_str_parts_of_speech_a], dtype = np.float64)
+            arr_depths = np.broadcast_to(arr_depths[:, None], arr_distances.shape)
+            arr_bool_path = (arr_distances >= 0) & (arr_depths > 0) & (
+                np.array(lst_str_parts_of_speech_a, dtype = object)[:, None] ==
+                np.array(lst_str_parts_of_speech_b, dtype = object)[None, :])
+            arr_similarities[arr_bool_path] = -np.log(
+                (arr_distances[arr_bool_path] + 1.) / (2. * arr_depths[arr_bool_path]))
+        return arr_similarities